@@ -0,0 +1,48 @@
+"""
+A bounded per-subscriber mailbox for messages delivered by the MessageBus.
+"""
+from collections import deque
+from typing import List, Optional
+
+from core_lib.central_coordination.collaboration.message_bus import Message
+
+
+class Mailbox(deque):
+    """
+    A ring buffer of messages that can be subscribed to a topic directly.
+
+    Calling the mailbox appends the message, so the instance itself is a
+    valid listener: `bus.subscribe(topic, mailbox)`. Delivery then runs no
+    Python-level callback at all. `deque.append` is atomic under the GIL, so
+    any number of publishing threads can feed one consumer without a lock.
+
+    With a `capacity`, the oldest messages are dropped once the mailbox is
+    full; without one, it grows without bound like a list.
+    """
+
+    __call__ = deque.append
+
+    def __init__(self, capacity: Optional[int] = None):
+        """
+        Initializes the Mailbox.
+
+        Args:
+            capacity: The maximum number of messages kept, or None for no limit.
+        """
+        super().__init__(maxlen=capacity)
+
+    def drain(self) -> List[Message]:
+        """
+        Removes and returns all buffered messages, oldest first.
+        """
+        messages = []
+        popleft = self.popleft
+        append = messages.append
+        # Pop one by one rather than copy-and-clear, so a message appended by
+        # another thread in between is never lost.
+        try:
+            while True:
+                append(popleft())
+        except IndexError:
+            pass
+        return messages
@@ -1,7 +1,9 @@
 """
 A simple message bus for inter-agent communication.
 """
-from typing import Callable, Dict, Any, List
+import heapq
+import itertools
+from typing import Callable, Dict, Any, List, Iterable, Tuple, Optional, Sequence
 
 # Type alias for a message
 Message = Dict[str, Any]
@@ -21,6 +23,12 @@ class MessageBus:
 
     def __init__(self):
         self._subscriptions: Dict[str, List[Listener]] = {}
+        # Messages held back between begin_step() and end_step(), by topic
+        self._pending: Optional[Dict[str, Message]] = None
+        # Heap of (time, sequence, callback) for schedule_once; the sequence
+        # number keeps callbacks due at the same time in scheduling order
+        self._scheduled: List[Tuple[float, int, Callable[[float], None]]] = []
+        self._schedule_seq = itertools.count()
         print("MessageBus created.")
 
     def subscribe(self, topic: str, listener: Listener):
@@ -31,11 +39,29 @@ class MessageBus:
             topic: The topic to subscribe to (e.g., 'sensor.reservoir_1.level').
             listener: The callback function to execute when a message is published.
         """
-        if topic not in self._subscriptions:
-            self._subscriptions[topic] = []
-        self._subscriptions[topic].append(listener)
+        # setdefault keeps concurrent subscriptions to a new topic from
+        # clobbering each other's listener lists.
+        self._subscriptions.setdefault(topic, []).append(listener)
         print(f"New subscription to topic '{topic}'.")
 
+    def unsubscribe(self, topic: str, listener: Listener):
+        """
+        Removes a listener from a topic. Does nothing if it is not subscribed.
+
+        A listener may unsubscribe itself while it is being notified.
+
+        Args:
+            topic: The topic the listener was subscribed to.
+            listener: The callback function to remove.
+        """
+        listeners = self._subscriptions.get(topic)
+        if listeners and listener in listeners:
+            # Replace the list instead of editing it, so a publish that is
+            # iterating over it still notifies the remaining listeners.
+            remaining = list(listeners)
+            remaining.remove(listener)
+            self._subscriptions[topic] = remaining
+
     def publish(self, topic: str, message: Message):
         """
         Publishes a message to a topic, notifying all subscribers.
@@ -44,10 +70,116 @@ class MessageBus:
             topic: The topic to publish the message to.
             message: The message payload dictionary.
         """
-        if topic in self._subscriptions:
+        pending = self._pending
+        if pending is not None:
+            # Deferred until end_step(); a later message on the same topic replaces this one
+            pending.pop(topic, None)
+            pending[topic] = message
+            return
+
+        # A single lookup resolves the whole listener list for the topic
+        listeners = self._subscriptions.get(topic)
+        if listeners:
             # print(f"Publishing message to topic '{topic}': {message}")
-            for listener in self._subscriptions[topic]:
+            for listener in listeners:
                 # In a real system, this might be asynchronous
                 listener(message)
         # else:
         #     print(f"Publishing to topic '{topic}' with no subscribers.")
+
+    def publish_batch(self, items: Iterable[Tuple[str, Message]]):
+        """
+        Publishes several messages in a single dispatch sweep.
+
+        Equivalent to calling `publish` for each item in order, but resolves the
+        subscription table once for the whole batch.
+
+        Args:
+            items: An iterable of (topic, message) pairs.
+        """
+        if self._pending is not None:
+            for topic, message in items:
+                self.publish(topic, message)
+            return
+
+        subscriptions = self._subscriptions
+        for topic, message in items:
+            listeners = subscriptions.get(topic)
+            if listeners:
+                for listener in listeners:
+                    listener(message)
+
+    def publish_many(self, topics: Sequence[str], message: Message):
+        """
+        Publishes the same message to several topics in a single dispatch sweep.
+
+        Every listener on every topic receives the *same* message object, so
+        listeners must treat it as read-only.
+
+        Args:
+            topics: The topics to publish the message to.
+            message: The message payload dictionary.
+        """
+        if self._pending is not None:
+            for topic in topics:
+                self.publish(topic, message)
+            return
+
+        subscriptions = self._subscriptions
+        for topic in topics:
+            listeners = subscriptions.get(topic)
+            if listeners:
+                for listener in listeners:
+                    listener(message)
+
+    def schedule_once(self, time: float, callback: Callable[[float], None]):
+        """
+        Schedules a callback to run once, at the first `advance_time` call whose
+        time has reached `time`.
+
+        This lets an agent that acts at a known moment sleep until then instead
+        of checking the clock on every step.
+
+        Args:
+            time: The simulation time at which the callback becomes due.
+            callback: Called with the current simulation time.
+        """
+        heapq.heappush(self._scheduled, (time, next(self._schedule_seq), callback))
+
+    def advance_time(self, current_time: float):
+        """
+        Runs every scheduled callback that is due at `current_time`, earliest
+        first. Whoever drives the simulation clock calls this once per step.
+
+        Args:
+            current_time: The current simulation time.
+        """
+        scheduled = self._scheduled
+        while scheduled and scheduled[0][0] <= current_time:
+            _, _, callback = heapq.heappop(scheduled)
+            callback(current_time)
+
+    def begin_step(self):
+        """
+        Starts buffering publishes until `end_step` is called.
+
+        While buffering, only the latest message per topic is kept, so this is
+        meant for topics that carry state (setpoints, control signals) where
+        the newest value supersedes older ones. Event-like topics whose every
+        message matters, and agent cascades that rely on immediate delivery
+        within the step, should not be run inside a buffered step.
+        """
+        if self._pending is None:
+            self._pending = {}
+
+    def end_step(self):
+        """
+        Stops buffering and delivers the buffered messages in one sweep, one
+        message per topic, in the order their topics were last published.
+
+        Messages published by listeners during this flush are delivered
+        immediately.
+        """
+        pending, self._pending = self._pending, None
+        if pending:
+            self.publish_batch(pending.items())
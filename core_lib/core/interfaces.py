@@ -97,6 +97,10 @@ class Agent(ABC):
     This is the base class for Perception, Control, and Disturbance agents.
     """
 
+    # Subclasses that declare their own __slots__ get instances without a
+    # per-instance __dict__; subclasses that don't keep one as before.
+    __slots__ = ('agent_id',)
+
     def __init__(self, agent_id: str):
         self.agent_id = agent_id
 
@@ -119,6 +123,8 @@ class Controller(ABC):
     allowing different control strategies (PID, MPC, RL) to be swapped out.
     """
 
+    __slots__ = ()
+
     @abstractmethod
     def compute_control_action(self, observation: State, dt: float) -> Any:
         """
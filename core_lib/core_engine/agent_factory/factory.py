@@ -191,9 +191,9 @@ class AgentFactory:
                         )
                     else:
                         # Use the generic DigitalTwinAgent for other models
-                        perception_agent = DigitalTwinAgent(
+                        perception_agent = DigitalTwinAgent.for_object(
+                            model,
                             agent_id=pa_id,
-                            simulated_object=model,
                             message_bus=self.bus,
                             state_topic=pa_topic
                         )
@@ -223,6 +223,8 @@ class SimulationHarness:
             print(f"--- MAS Simulation Step {i+1}, Time: {current_time:.2f}s ---")
 
             print("  Phase 1: Triggering agent perception and action cascade.")
+            # Fire the events agents scheduled for this time before they run
+            self.message_bus.advance_time(current_time)
             for agent in self.agents:
                 agent.run(current_time)
 
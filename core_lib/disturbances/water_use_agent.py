@@ -37,6 +37,8 @@ class WaterUseAgent(Agent):
         self.inflow_rate = -abs(demand_rate)
         self.end_time = self.start_time + self.duration
         self.is_active = False
+        # The payload never changes, so build it once; subscribers treat it as read-only
+        self._disturbance_message: Message = {'inflow_rate': self.inflow_rate}
 
         if not self.topic:
             raise ValueError("WaterUseAgent requires a 'topic'.")
@@ -55,8 +57,7 @@ class WaterUseAgent(Agent):
                 print(f"--- Water use event STARTED at t={current_time}s ---")
                 self.is_active = True
 
-            disturbance_message: Message = {'inflow_rate': self.inflow_rate}
-            self.bus.publish(self.topic, disturbance_message)
+            self.bus.publish(self.topic, self._disturbance_message)
         else:
             if self.is_active:
                 print(f"--- Water use event ENDED at t={current_time}s ---")
@@ -1,10 +1,15 @@
 """
 An agent responsible for orchestrating the parameter identification process.
 """
+import logging
+import numbers
+import numpy as np
 from core_lib.core.interfaces import Agent, Identifiable
 from core_lib.central_coordination.collaboration.message_bus import MessageBus, Message
 from typing import Dict, Any, List
 
+logger = logging.getLogger(__name__)
+
 class ParameterIdentificationAgent(Agent):
     """
     An agent that collects simulated and observed data and triggers the
@@ -39,35 +44,58 @@ class ParameterIdentificationAgent(Agent):
         self.id_interval = config.get("identification_interval", 100)
         self.data_map = config["identification_data_map"]
 
-        # Internal state
-        self.data_history: Dict[str, List[float]] = {key: [] for key in self.data_map.keys()}
+        # Internal state: one preallocated column per data stream. Fortran order
+        # keeps each column contiguous, so the per-key batches handed to the
+        # model in run() are zero-copy views.
+        self._col_of: Dict[str, int] = {key: i for i, key in enumerate(self.data_map)}
+        self.data_history = np.empty((self.id_interval, len(self._col_of)), dtype=np.float64, order='F')
+        self._rows: List[int] = [0] * len(self._col_of)
         self.new_data_count = 0
 
         # Subscribe to all necessary data topics
         for model_key, topic in self.data_map.items():
             # The lambda captures the 'model_key' for the handler
             self.bus.subscribe(topic, lambda msg, key=model_key: self.handle_data_message(msg, key))
-            print(f"[{self.agent_id}] Subscribed to topic '{topic}' for data key '{model_key}'.")
+            logger.debug("[%s] Subscribed to topic '%s' for data key '%s'.", self.agent_id, topic, model_key)
 
     def handle_data_message(self, message: Message, model_key: str):
-        """Callback to store incoming data."""
+        """
+        Callback to store incoming data.
+
+        Samples arriving after a stream's column is full are dropped, and not
+        counted, until the next identification cycle clears the buffer.
+        """
         value = message.get("value") # Assuming a simple {'value': ...} message
-        if isinstance(value, (int, float)):
-            self.data_history[model_key].append(value)
-            if model_key == list(self.data_map.keys())[0]: # Increment counter only for one stream
-                self.new_data_count += 1
+        if value is None:
+            return
+        # Checked explicitly: the float64 store would also accept strings like "1.5"
+        if not isinstance(value, numbers.Real):
+            logger.warning("[%s] Non-numeric value on '%s': %r", self.agent_id, model_key, value)
+            return
+        col = self._col_of[model_key]
+        row = self._rows[col]
+        if row >= self.id_interval:
+            return
+        self.data_history[row, col] = value
+        self._rows[col] = row + 1
+        if col == 0: # Increment counter only for one stream, and only for stored samples
+            self.new_data_count += 1
 
     def run(self, current_time: float):
         """
         Checks if enough data has been collected and triggers identification.
         """
         if self.new_data_count >= self.id_interval:
-            print(f"  [{current_time}s] [{self.agent_id}] Collected {self.new_data_count} new data points. Triggering parameter identification.")
+            logger.info("[%ss] [%s] Collected %d new data points. Triggering parameter identification.",
+                        current_time, self.agent_id, self.new_data_count)
 
             # Prepare data for the model
-            # The model's identify_parameters expects numpy arrays
-            import numpy as np
-            data_for_model = {key: np.array(values) for key, values in self.data_history.items()}
+            # The model's identify_parameters expects numpy arrays. These are views
+            # into the shared buffer and are only valid until the next cycle.
+            data_for_model = {
+                key: self.data_history[:self._rows[col], col]
+                for key, col in self._col_of.items()
+            }
 
             # Trigger identification
             self.target_model.identify_parameters(data_for_model)
@@ -77,6 +105,6 @@ class ParameterIdentificationAgent(Agent):
 
     def clear_history(self):
         """Clears the collected data history."""
-        self.data_history = {key: [] for key in self.data_map.keys()}
+        self._rows = [0] * len(self._col_of)
         self.new_data_count = 0
-        print(f"  [{self.agent_id}] Data history cleared. Ready for next identification cycle.")
+        logger.debug("[%s] Data history cleared. Ready for next identification cycle.", self.agent_id)
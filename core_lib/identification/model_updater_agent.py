@@ -1,10 +1,13 @@
 """
 Agent for updating model parameters online.
 """
+import logging
 from core_lib.core.interfaces import Agent
 from core_lib.central_coordination.collaboration.message_bus import MessageBus, Message
 from typing import Dict
 
+logger = logging.getLogger(__name__)
+
 class ModelUpdaterAgent(Agent):
     """
     An agent that listens for newly identified model parameters and applies
@@ -27,29 +30,41 @@ class ModelUpdaterAgent(Agent):
         self.bus = message_bus
         self.parameter_topic = parameter_topic
         self.models = models
+        # Resolve each model's 'set_parameters' once instead of reflecting on
+        # every incoming message. None marks a model that cannot be updated.
+        self._setters = {name: getattr(model, 'set_parameters', None) for name, model in models.items()}
 
         self.bus.subscribe(self.parameter_topic, self.handle_new_parameters)
 
-        print(f"ModelUpdaterAgent '{self.agent_id}' initialized. Subscribed to '{self.parameter_topic}'.")
+        logger.debug("ModelUpdaterAgent '%s' initialized. Subscribed to '%s'.", self.agent_id, self.parameter_topic)
 
     def handle_new_parameters(self, message: Message):
         """
         Callback to handle a message containing new model parameters.
+
+        Accepts either a single update, ``{'model_name': ..., 'parameters': ...}``,
+        or a batch, ``{'updates': [{'model_name': ..., 'parameters': ...}, ...]}``,
+        so one identification cycle can update several models with one publish.
         """
-        model_name = message.get("model_name")
-        new_params = message.get("parameters")
-
-        if model_name and new_params and model_name in self.models:
-            target_model = self.models[model_name]
-            # Assuming the model has a 'set_parameters' method
-            if hasattr(target_model, 'set_parameters'):
-                target_model.set_parameters(new_params)
-                print(f"[{self.agent_id}] Updated parameters for model '{model_name}': {new_params}")
+        updates = message.get("updates")
+        if updates is not None:
+            for update in updates:
+                self._apply(update.get("model_name"), update.get("parameters"), update)
+            return
+
+        self._apply(message.get("model_name"), message.get("parameters"), message)
+
+    def _apply(self, model_name, new_params, message: Message):
+        """Applies one parameter update to the named model."""
+        if model_name and new_params and model_name in self._setters:
+            setter = self._setters[model_name]
+            if setter is not None:
+                setter(new_params)
+                logger.debug("[%s] Updated parameters for model '%s': %s", self.agent_id, model_name, new_params)
             else:
-                print(f"[{self.agent_id}] Warning: Model '{model_name}' has no 'set_parameters' method.")
+                logger.warning("[%s] Model '%s' has no 'set_parameters' method.", self.agent_id, model_name)
         else:
-            print(f"[{self.agent_id}] Warning: Invalid parameter update message received: {message}")
-
+            logger.warning("[%s] Invalid parameter update message received: %s", self.agent_id, message)
 
     def run(self, current_time: float):
         """
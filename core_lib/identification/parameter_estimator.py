@@ -1,9 +1,12 @@
 """
 Parameter Estimator for calibrating simulation models.
 """
+import logging
 from typing import Any
 from core_lib.core.interfaces import Parameters
 
+logger = logging.getLogger(__name__)
+
 class ParameterEstimator:
     """
     A utility class that provides algorithms for parameter estimation.
@@ -14,7 +17,7 @@ class ParameterEstimator:
     """
 
     def __init__(self):
-        print("ParameterEstimator created.")
+        logger.debug("ParameterEstimator created.")
 
     def perform_offline_estimation(self, model: Any, data: Any) -> Parameters:
         """
@@ -27,7 +30,7 @@ class ParameterEstimator:
         Returns:
             The estimated parameters.
         """
-        print(f"Performing offline estimation for model '{model.id}'.")
+        logger.debug("Performing offline estimation for model '%s'.", model.id)
         # Placeholder: In a real scenario, this would involve running the model
         # against the data and using an optimization algorithm to minimize error.
         # For now, it just returns the model's current parameters.
@@ -44,7 +47,7 @@ class ParameterEstimator:
         Returns:
             The updated parameters.
         """
-        print(f"Performing online estimation update for model '{model.id}'.")
+        logger.debug("Performing online estimation update for model '%s'.", model.id)
         # Placeholder: This would use a recursive algorithm (e.g., RLS, Kalman Filter).
         # For now, it just returns the model's current parameters.
         return model.get_parameters()
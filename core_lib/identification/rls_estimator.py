@@ -3,12 +3,57 @@
 本模块提供了用于在线参数辨识的递归最小二乘（RLS）估计算法的实现。
 """
 import numpy as np
+from scipy.linalg.blas import get_blas_funcs
+
+try:
+    from numba import njit
+except ImportError:  # numba为可选依赖，缺失时回退到BLAS实现
+    njit = None
+
+
+if njit is not None:
+    @njit(cache=True)
+    def _rls_update_kernel(P, theta, phi, y, lam):
+        """
+        RLS秩1更新的原生编译内核，原地修改P和theta。
+
+        参数:
+            P (np.ndarray): 逆相关矩阵，形状为 (n, n)，原地更新。
+            theta (np.ndarray): 参数估计向量，形状为 (n,)，原地更新。
+            phi (np.ndarray): 回归量向量，形状为 (n,)。
+            y (float): 测量的输出标量。
+            lam (float): 遗忘因子。
+        """
+        n = phi.shape[0]
+        P_phi = np.empty(n)
+        k_denominator = lam
+        y_hat = 0.0
+        for i in range(n):
+            acc = 0.0
+            for j in range(n):
+                acc += P[i, j] * phi[j]
+            P_phi[i] = acc
+            k_denominator += phi[i] * acc
+            y_hat += phi[i] * theta[i]
+
+        inv_denominator = 1.0 / k_denominator
+        alpha = y - y_hat
+        inv_lam = 1.0 / lam
+        for i in range(n):
+            theta[i] += P_phi[i] * inv_denominator * alpha
+            for j in range(n):
+                P[i, j] = (P[i, j] - P_phi[i] * P_phi[j] * inv_denominator) * inv_lam
+else:
+    _rls_update_kernel = None
 
 class RLSEstimator:
     """
     一个用于在线辨识线性模型 y = phi' * theta 的递归最小二乘（RLS）估计算法。
     """
 
+    # 每隔多少次更新对P做一次原地对称化，抑制浮点漂移导致的非对称
+    SYMMETRIZE_INTERVAL = 64
+
     def __init__(self, num_params, lambda_=0.99, P0=1000):
         """
         初始化RLS估计算法。
@@ -28,8 +73,16 @@ class RLSEstimator:
         # 初始化参数估计向量theta为零
         self.theta = np.zeros((num_params, 1))
 
-        # 初始化逆相关矩阵P
-        self.P = np.eye(num_params) * P0
+        # 初始化逆相关矩阵P（Fortran连续存储，使BLAS能够原地更新）
+        self.P = np.asfortranarray(np.eye(num_params) * P0)
+
+        # 预先解析BLAS例程：对于小维度矩阵，numpy的调度开销远大于实际计算量
+        self._gemv, self._ger = get_blas_funcs(('gemv', 'ger'), (self.P,))
+
+        # 若numba可用，则使用编译后的内核执行整个更新，消除每次调用的Python开销
+        self._kernel = _rls_update_kernel
+
+        self._steps_since_symm = 0
 
     def update(self, phi, y):
         """
@@ -37,25 +90,51 @@ class RLSEstimator:
 
         参数:
             phi (np.ndarray): 输入向量（回归量向量），形状为 (num_params, 1)。
-            y (float): 测量的输出标量。
+            y (float): 测量的输出标量，也可以是形状为 (1,) 或 (1, 1) 的数组。
         """
-        phi = phi.reshape(self.num_params, 1) # 确保phi是一个列向量
+        phi = np.ascontiguousarray(phi, dtype=self.P.dtype).reshape(self.num_params) # 展平为一维向量
+        if not isinstance(y, float):
+            # 也接受形状为 (1,) 或 (1, 1) 的数组，转换为标量
+            y = np.asarray(y, dtype=self.P.dtype).item()
+
+        if self._kernel is not None:
+            self._kernel(self.P, self.theta[:, 0], phi, y, self.lambda_)
+        else:
+            self._update_blas(phi, y)
+
+        # 周期性地原地对称化P：P = (P + P') / 2，分摊到每步几乎没有开销
+        self._steps_since_symm += 1
+        if self._steps_since_symm >= self.SYMMETRIZE_INTERVAL:
+            np.add(self.P, self.P.T, out=self.P)
+            self.P *= 0.5
+            self._steps_since_symm = 0
 
-        # 1. 计算卡尔曼增益向量k
-        k_numerator = np.dot(self.P, phi)
-        k_denominator = self.lambda_ + np.dot(phi.T, k_numerator)
-        k = k_numerator / k_denominator
+    def _update_blas(self, phi, y):
+        """
+        numba不可用时基于BLAS的更新路径。
+
+        参数:
+            phi (np.ndarray): 一维回归量向量，形状为 (num_params,)。
+            y (float): 测量的输出标量。
+        """
+        # 1. 计算卡尔曼增益向量k（P对称，故 phi' * P = (P * phi)'）
+        P_phi = self._gemv(1.0, self.P, phi)
+        k_denominator = self.lambda_ + phi @ P_phi
+        k = P_phi / k_denominator
 
         # 2. 计算先验估计误差
-        y_hat = np.dot(phi.T, self.theta)
+        y_hat = phi @ self.theta[:, 0]
         alpha = y - y_hat
 
         # 3. 更新参数估计向量theta
-        self.theta = self.theta + k * alpha
+        self.theta[:, 0] += k * alpha
 
-        # 4. 更新逆相关矩阵P
-        P_numerator = np.dot(np.eye(self.num_params) - np.dot(k, phi.T), self.P)
-        self.P = P_numerator / self.lambda_
+        # 4. 更新逆相关矩阵P：P = (P - k * phi' * P) / lambda，秩1更新原地完成。
+        #    以 u = P*phi/sqrt(denominator) 做 P - u*u'，使得 u_i*u_j 与 u_j*u_i
+        #    逐位相同，从而保持P严格对称（否则非对称误差会按 1/lambda 逐步放大）。
+        u = P_phi * (1.0 / np.sqrt(k_denominator))
+        self.P = self._ger(-1.0, u, u, a=self.P, overwrite_a=1)
+        self.P *= 1.0 / self.lambda_
 
     def get_params(self):
         """
@@ -5,9 +5,15 @@ import yaml
 from pathlib import Path
 import logging
 import importlib
+import mmap
+
+try:
+    # Prefer the libyaml-backed loader when PyYAML was built with it.
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:
+    from yaml import SafeLoader as _SafeLoader
 
 from core_lib.core_engine.testing.simulation_harness import SimulationHarness
-from core_lib.central_coordination.collaboration.message_bus import MessageBus
 
 class SimulationLoader:
     """
@@ -39,8 +45,16 @@ class SimulationLoader:
         """Loads a single YAML file from the scenario directory."""
         file_path = self.scenario_path / file_name
         try:
-            with open(file_path, 'r') as f:
-                return yaml.safe_load(f)
+            with open(file_path, 'rb') as f:
+                # Files smaller than a page are cheaper to read directly; larger
+                # ones are mapped so the parser scans the file without copying it.
+                if file_path.stat().st_size < mmap.PAGESIZE:
+                    return yaml.load(f, Loader=_SafeLoader)
+                mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+                try:
+                    return yaml.load(mm, Loader=_SafeLoader)
+                finally:
+                    mm.close()
         except FileNotFoundError:
             logging.error(f"Configuration file not found: {file_path}")
             return None
@@ -90,10 +104,13 @@ class SimulationLoader:
 
                 # Controllers
                 "PIDController": "core_lib.local_agents.control.pid_controller.PIDController",
+                "VectorPIDController": "core_lib.local_agents.control.vector_pid_controller.VectorPIDController",
 
                 # Agents
                 "DigitalTwinAgent": "core_lib.local_agents.perception.digital_twin_agent.DigitalTwinAgent",
                 "LocalControlAgent": "core_lib.local_agents.control.local_control_agent.LocalControlAgent",
+                "BatchedPIDAgent": "core_lib.local_agents.control.batched_pid_agent.BatchedPIDAgent",
+                "ControlAgentGroup": "core_lib.local_agents.control.control_agent_group.ControlAgentGroup",
                 "EmergencyAgent": "core_lib.local_agents.supervisory.emergency_agent.EmergencyAgent",
                 "CentralDispatcherAgent": "core_lib.local_agents.supervisory.central_dispatcher_agent.CentralDispatcherAgent",
                 "CsvInflowAgent": "core_lib.data_access.csv_inflow_agent.CsvInflowAgent",
@@ -123,9 +140,10 @@ class SimulationLoader:
     def _setup_infrastructure(self):
         """Initializes the message bus and simulation harness."""
         logging.info("Setting up simulation infrastructure...")
-        self.message_bus = MessageBus()
         sim_config = self.config.get('simulation', {})
         self.harness = SimulationHarness(config=sim_config)
+        # Share the harness's bus so that the harness drives scheduled agent events
+        self.message_bus = self.harness.message_bus
 
     def _load_components(self):
         """Loads and instantiates all physical components."""
@@ -193,6 +211,7 @@ class SimulationLoader:
             )
 
         # Load agents
+        agent_instances = {}
         for agent_conf in self.agents_config.get('agents', []):
             agent_id = agent_conf['id']
             agent_class_path = agent_conf['class']
@@ -235,12 +254,15 @@ class SimulationLoader:
                 for key, value in config.items():
                     args[key] = value
 
-            elif short_class_name == 'LocalControlAgent':
+            elif short_class_name in ('LocalControlAgent', 'BatchedPIDAgent'):
                 # Handle the nested controller object
                 controller_conf = config.pop('controller')
                 CtrlClass = self._get_class(controller_conf['class'])
                 controller_instance = CtrlClass(**controller_conf.get('config', {}))
                 args['controller'] = controller_instance
+                # A group is referenced by the id of a previously declared ControlAgentGroup
+                if 'group' in config:
+                    args['group'] = agent_instances[config.pop('group')]
                 # Pass remaining config to the agent constructor
                 args.update(config)
             else:
@@ -248,6 +270,7 @@ class SimulationLoader:
                 args.update(config)
 
             instance = AgentClass(**args)
+            agent_instances[agent_id] = instance
             self.harness.add_agent(instance)
 
         logging.info("Agents and controllers loaded.")
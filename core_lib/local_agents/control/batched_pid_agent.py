@@ -0,0 +1,61 @@
+"""
+A control agent that drives a bank of PID loops from one batched observation.
+"""
+from core_lib.core.interfaces import Agent
+from core_lib.central_coordination.collaboration.message_bus import MessageBus, Message
+from core_lib.local_agents.control.vector_pid_controller import VectorPIDController
+from typing import List
+
+
+class BatchedPIDAgent(Agent):
+    """
+    The batched counterpart of a group of `LocalControlAgent`s wrapping PIDs.
+
+    Instead of N agents each subscribing to its own observation topic, this agent
+    subscribes once to a topic carrying all N process variables, steps a
+    `VectorPIDController` once, and publishes the N actions in a single batch.
+    """
+
+    def __init__(self, agent_id: str, controller: VectorPIDController, message_bus: MessageBus,
+                 observation_topic: str, action_topics: List[str], dt: float,
+                 observation_key: str = 'process_variables', action_key: str = 'control_signal'):
+        """
+        Initializes the BatchedPIDAgent.
+
+        Args:
+            agent_id: The unique ID for this agent.
+            controller: The PID bank, with one controller per action topic.
+            message_bus: The system's message bus for communication.
+            observation_topic: The topic carrying the batched observations.
+            action_topics: One action topic per controller, in controller order.
+            dt: The simulation time step, required for the controller.
+            observation_key: The key holding the list of process variables.
+            action_key: The key to use in each action message payload.
+        """
+        super().__init__(agent_id)
+        if len(action_topics) != controller.size:
+            raise ValueError(f"Expected {controller.size} action topics, got {len(action_topics)}.")
+        self.controller = controller
+        self.bus = message_bus
+        self.observation_topic = observation_topic
+        self.action_topics = action_topics
+        self.dt = dt
+        self.observation_key = observation_key
+        self.action_key = action_key
+
+        self.bus.subscribe(self.observation_topic, self.handle_observation)
+
+    def handle_observation(self, message: Message):
+        """Steps all PID loops and publishes their actions in one batch."""
+        process_variables = message.get(self.observation_key)
+        if process_variables is None:
+            return
+        actions = self.controller.compute_control_action({'process_variable': process_variables}, self.dt)
+        self.bus.publish_batch(
+            (topic, {self.action_key: float(action), 'agent_id': self.agent_id})
+            for topic, action in zip(self.action_topics, actions)
+        )
+
+    def run(self, current_time: float):
+        """This agent is event-driven, so the run loop is a no-op."""
+        pass
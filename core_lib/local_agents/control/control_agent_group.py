@@ -0,0 +1,66 @@
+"""
+A demultiplexer that feeds many control agents from one compound observation topic.
+"""
+import logging
+from core_lib.core.interfaces import Agent
+from core_lib.central_coordination.collaboration.message_bus import MessageBus, Message, Listener
+from typing import Dict, List
+
+logger = logging.getLogger(__name__)
+
+
+class ControlAgentGroup(Agent):
+    """
+    Subscribes once to a compound observation topic and fans the contained
+    observations out to its member agents.
+
+    A compound message maps each member's observation topic to the observation
+    message that would otherwise have been published on that topic, e.g.::
+
+        {'state.gate_1': {'water_level': 2.1}, 'state.gate_2': {'water_level': 1.8}}
+
+    Publishing one such message replaces one bus publish per member. Members
+    are registered by passing the group to `LocalControlAgent(group=...)`, in
+    which case the agent does not subscribe to its observation topic itself.
+    """
+
+    def __init__(self, agent_id: str, message_bus: MessageBus, observation_topic: str):
+        """
+        Initializes the ControlAgentGroup.
+
+        Args:
+            agent_id: The unique ID for this agent.
+            message_bus: The system's message bus for communication.
+            observation_topic: The compound topic carrying the members' observations.
+        """
+        super().__init__(agent_id)
+        self.bus = message_bus
+        self.observation_topic = observation_topic
+        self._handlers: Dict[str, List[Listener]] = {}
+
+        self.bus.subscribe(self.observation_topic, self.handle_observations)
+        logger.debug("ControlAgentGroup '%s' created. Subscribed to compound topic '%s'.", self.agent_id, observation_topic)
+
+    def add_member(self, member_topic: str, handler: Listener):
+        """
+        Registers an observation handler under a member topic.
+
+        Args:
+            member_topic: The key under which the member's observation appears
+                          in the compound message.
+            handler: The callback to invoke with that observation.
+        """
+        self._handlers.setdefault(member_topic, []).append(handler)
+
+    def handle_observations(self, message: Message):
+        """Dispatches each observation in a compound message to its members."""
+        handlers_by_topic = self._handlers
+        for member_topic, observation in message.items():
+            handlers = handlers_by_topic.get(member_topic)
+            if handlers:
+                for handler in handlers:
+                    handler(observation)
+
+    def run(self, current_time: float):
+        """This agent is event-driven, so the run loop is a no-op."""
+        pass
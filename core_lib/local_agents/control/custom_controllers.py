@@ -1,12 +1,20 @@
+import logging
 from core_lib.core.interfaces import Controller
 from typing import Dict, Any
 import numpy as np
 
+logger = logging.getLogger(__name__)
+
 class HydropowerController(Controller):
     """
     A custom controller to manage a hydropower station with multiple turbines.
     It receives a power target and grid limit from a high-level agent and decides
     the flow for each turbine.
+
+    The actions dictionary returned by `compute_control_action` is drawn from a
+    pool of two pre-built dictionaries that are reused alternately, so a
+    returned action stays valid until the second call after it. Callers that
+    need to keep an action longer must copy it.
     """
     def __init__(self, head_m: float, num_turbines: int = 6, **kwargs):
         self.head = head_m
@@ -14,6 +22,11 @@ class HydropowerController(Controller):
         self.power_target_mw = 0
         self.grid_limit_mw = float('inf')
 
+        # Two pre-built action dictionaries, used alternately (see class docstring)
+        self._keys = [f'turbine_{i+1}' for i in range(self.num_turbines)]
+        self._scratch = [{key: {'outflow': 0.0} for key in self._keys} for _ in range(2)]
+        self._scratch_idx = 0
+
     def compute_control_action(self, observation: Dict[str, Any], dt: float) -> Dict[str, Any]:
         # Update head from the latest observation from the reservoir if available
         self.head = observation.get('water_level', self.head)
@@ -30,11 +43,12 @@ class HydropowerController(Controller):
         eff, rho, g = 0.9, 1000, 9.81
         required_flow_per_turbine = (target_per_turbine * 1e6) / (eff * rho * g * self.head) if self.head > 0 else 0
 
-        # The LocalControlAgent will dispatch these actions to the correct topics
-        actions = {}
-        for i in range(self.num_turbines):
-            # The key here does not matter as the LocalControlAgent uses a list of topics
-            actions[f'turbine_{i+1}'] = {'outflow': required_flow_per_turbine}
+        # The LocalControlAgent will dispatch these actions to the correct topics.
+        # The key here does not matter as the LocalControlAgent uses a list of topics.
+        actions = self._scratch[self._scratch_idx]
+        self._scratch_idx ^= 1
+        for turbine_action in actions.values():
+            turbine_action['outflow'] = required_flow_per_turbine
         return actions
 
     def update_setpoint(self, message: Dict[str, Any]):
@@ -43,10 +57,10 @@ class HydropowerController(Controller):
         """
         if 'target_mw' in message:
             self.power_target_mw = message.get('target_mw', self.power_target_mw)
-            print(f"[{self.__class__.__name__}] New power target: {self.power_target_mw:.2f} MW")
+            logger.debug("[%s] New power target: %.2f MW", self.__class__.__name__, self.power_target_mw)
         if 'limit_mw' in message:
             self.grid_limit_mw = message.get('limit_mw', self.grid_limit_mw)
-            print(f"[{self.__class__.__name__}] New grid limit: {self.grid_limit_mw:.2f} MW")
+            logger.debug("[%s] New grid limit: %.2f MW", self.__class__.__name__, self.grid_limit_mw)
 
 
 class DirectGateController(Controller):
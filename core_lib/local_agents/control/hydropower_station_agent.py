@@ -1,10 +1,13 @@
 """
 An agent for controlling a hydropower station with multiple objectives.
 """
+import logging
 from core_lib.core.interfaces import Agent
 from core_lib.central_coordination.collaboration.message_bus import MessageBus, Message
 from core_lib.physical_objects.reservoir import Reservoir
 
+logger = logging.getLogger(__name__)
+
 
 class HydropowerStationAgent(Agent):
     """
@@ -27,6 +30,9 @@ class HydropowerStationAgent(Agent):
         self.turbine_gate_topics = turbine_gate_topics
         self.config = config
 
+        # Last signal published per topic, so unchanged signals are not re-sent
+        self._last_signals = {}
+
         # Subscribe to relevant sensor topics if needed (e.g., power demand)
         # For this example, we'll keep it simple and use fixed demands.
 
@@ -47,42 +53,50 @@ class HydropowerStationAgent(Agent):
         # Initialize control signals
         flood_gate_opening = 0.0
         supply_gate_opening = 0.0
-        turbine_gate_openings = [0.0] * len(self.turbine_gate_topics)
+        # All turbines share one opening, so a single value (and message) covers them
+        turbine_gate_opening = 0.0
 
         # Decision logic based on priority
         # Priority 1: Flood Control
         if current_level > flood_warning_level:
-            print(f"[{self.agent_id}] FLOOD WARNING: Level {current_level:.2f}m > {flood_warning_level:.2f}m. Prioritizing flood control.")
+            logger.warning("[%s] FLOOD WARNING: Level %.2fm > %.2fm. Prioritizing flood control.",
+                           self.agent_id, current_level, flood_warning_level)
             # Open flood gate fully to release water
             flood_gate_opening = 1.0 # Assuming max opening is 1.0
             # Close turbines to protect them during flood
-            turbine_gate_openings = [0.0] * len(self.turbine_gate_topics)
+            turbine_gate_opening = 0.0
             # Maintain minimum water supply if possible
             supply_gate_opening = min_supply_opening
 
         # Priority 2 & 3: Normal Operation (Water Supply & Power Gen)
         else:
-            print(f"[{self.agent_id}] Normal Operation: Level {current_level:.2f}m. Balancing supply and power.")
+            logger.debug("[%s] Normal Operation: Level %.2fm. Balancing supply and power.", self.agent_id, current_level)
             # Keep flood gate closed
             flood_gate_opening = 0.0
             # Meet minimum water supply
             supply_gate_opening = min_supply_opening
             # Use remaining capacity for power generation
             if current_level > normal_level + 0.2: # Only generate max power if level is safely above normal
-                 turbine_gate_openings = [0.8] * len(self.turbine_gate_topics) # Reduced from 1.0
+                 turbine_gate_opening = 0.8 # Reduced from 1.0
             else:
-                 turbine_gate_openings = [0.4] * len(self.turbine_gate_topics) # Reduced from 0.5
+                 turbine_gate_opening = 0.4 # Reduced from 0.5
 
         # Publish control messages
         self.publish_control_signal(self.flood_gate_topic, flood_gate_opening)
         self.publish_control_signal(self.supply_gate_topic, supply_gate_opening)
-        for i, topic in enumerate(self.turbine_gate_topics):
-            self.publish_control_signal(topic, turbine_gate_openings[i])
+        turbine_message = {'control_signal': turbine_gate_opening, 'sender': self.agent_id}
+        for topic in self.turbine_gate_topics:
+            if self._last_signals.get(topic) != turbine_gate_opening:
+                self.bus.publish(topic, turbine_message)
+                self._last_signals[topic] = turbine_gate_opening
 
     def publish_control_signal(self, topic: str, signal: float):
-        """Helper to publish a control message to the bus."""
+        """Helper to publish a control message to the bus, skipping unchanged signals."""
+        if self._last_signals.get(topic) == signal:
+            return
         message = {'control_signal': signal, 'sender': self.agent_id}
         self.bus.publish(topic, message)
+        self._last_signals[topic] = signal
 
     async def run(self):
         pass
@@ -1,10 +1,13 @@
 """
 Control Agent for a Hydropower Station.
 """
+import logging
 from core_lib.core.interfaces import Agent, State
 from core_lib.central_coordination.collaboration.message_bus import MessageBus
 from typing import List, Dict, Any
 
+logger = logging.getLogger(__name__)
+
 class HydropowerStationControlAgent(Agent):
     """
     A Control Agent for managing a complex Hydropower Station.
@@ -42,13 +45,14 @@ class HydropowerStationControlAgent(Agent):
         self.bus.subscribe(goal_topic, self.handle_goal_message)
         self.bus.subscribe(state_topic, self.handle_state_message)
 
-        print(f"HydropowerStationControlAgent '{self.agent_id}' created.")
+        logger.debug("HydropowerStationControlAgent '%s' created.", self.agent_id)
 
     def handle_goal_message(self, message: Dict[str, Any]):
         """Callback for processing new control goals."""
         self.target_power = message.get('target_power_generation', self.target_power)
         self.target_total_outflow = message.get('target_total_outflow', self.target_total_outflow)
-        print(f"'{self.agent_id}' received new goals: Power={self.target_power}W, Outflow={self.target_total_outflow}m^3/s")
+        logger.info("'%s' received new goals: Power=%sW, Outflow=%sm^3/s",
+                    self.agent_id, self.target_power, self.target_total_outflow)
 
     def handle_state_message(self, message: State):
         """
@@ -78,12 +82,13 @@ class HydropowerStationControlAgent(Agent):
         # Distribute required flow among turbines
         flow_per_turbine = required_flow_for_power / self.num_turbines if self.num_turbines > 0 else 0
 
-        print(f"'{self.agent_id}' Control: Head={self.current_head:.2f}m. "
-              f"Required flow for power: {required_flow_for_power:.2f} m^3/s. "
-              f"Distributing {flow_per_turbine:.2f} m^3/s per turbine.")
+        logger.debug("'%s' Control: Head=%.2fm. Required flow for power: %.2f m^3/s. "
+                     "Distributing %.2f m^3/s per turbine.",
+                     self.agent_id, self.current_head, required_flow_for_power, flow_per_turbine)
 
-        for topic in self.turbine_action_topics:
-            self.bus.publish(topic, {'target_outflow': flow_per_turbine})
+        # Every turbine receives the same command, so one payload is shared by all topics
+        turbine_message = {'target_outflow': flow_per_turbine}
+        batch = [(topic, turbine_message) for topic in self.turbine_action_topics]
 
         # --- 2. Gate Control ---
         # This logic should ideally run after the turbine flow has updated.
@@ -94,13 +99,16 @@ class HydropowerStationControlAgent(Agent):
         if remaining_flow_target > 0:
             flow_per_gate = remaining_flow_target / self.num_gates if self.num_gates > 0 else 0
 
-        print(f"'{self.agent_id}' Control: Target total outflow={self.target_total_outflow:.2f}. "
-              f"Current turbine outflow={self.current_turbine_outflow:.2f}. "
-              f"Distributing {flow_per_gate:.2f} m^3/s per gate.")
+        logger.debug("'%s' Control: Target total outflow=%.2f. Current turbine outflow=%.2f. "
+                     "Distributing %.2f m^3/s per gate.",
+                     self.agent_id, self.target_total_outflow, self.current_turbine_outflow, flow_per_gate)
+
+        # The gate model can handle converting this to an opening
+        gate_message = {'gate_target_outflow': flow_per_gate}
+        batch.extend((topic, gate_message) for topic in self.gate_action_topics)
 
-        for topic in self.gate_action_topics:
-            # The gate model can handle converting this to an opening
-            self.bus.publish(topic, {'gate_target_outflow': flow_per_gate})
+        # Dispatch all turbine and gate commands in one sweep
+        self.bus.publish_batch(batch)
 
     def run(self, current_time: float):
         """
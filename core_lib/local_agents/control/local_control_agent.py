@@ -2,10 +2,14 @@
 A Local Control Agent that encapsulates a control algorithm and communicates
 via a message bus.
 """
+import logging
 from core_lib.core.interfaces import Agent, Controller, State
 from core_lib.central_coordination.collaboration.message_bus import MessageBus, Message
+from core_lib.local_agents.control.control_agent_group import ControlAgentGroup
 from typing import Optional
 
+logger = logging.getLogger(__name__)
+
 class LocalControlAgent(Agent):
     """
     A Control Agent that operates at a local level (e.g., controlling one gate).
@@ -15,10 +19,14 @@ class LocalControlAgent(Agent):
     and can optionally be guided by high-level commands.
     """
 
+    __slots__ = ('controller', 'bus', 'observation_topic', 'observation_key',
+                 'action_topic', 'action_key', 'dt', 'latest_feedback', '_command_handler')
+
     def __init__(self, agent_id: str, controller: Controller, message_bus: MessageBus,
                  observation_topic: str, observation_key: str, action_topic: str,
                  dt: float, action_key: str = 'control_signal',
-                 command_topic: Optional[str] = None, feedback_topic: Optional[str] = None):
+                 command_topic: Optional[str] = None, feedback_topic: Optional[str] = None,
+                 group: Optional[ControlAgentGroup] = None):
         """
         Initializes the LocalControlAgent.
 
@@ -33,6 +41,9 @@ class LocalControlAgent(Agent):
             dt: The simulation time step, required for the controller.
             command_topic: The topic for receiving high-level commands.
             feedback_topic: The topic for receiving state feedback from the controlled object.
+            group: An optional ControlAgentGroup. If given, observations are
+                   delivered through the group's compound topic under
+                   `observation_topic` instead of a bus subscription of our own.
         """
         super().__init__(agent_id)
         self.controller = controller
@@ -44,16 +55,29 @@ class LocalControlAgent(Agent):
         self.dt = dt
         self.latest_feedback: State = {}
 
-        self.bus.subscribe(self.observation_topic, self.handle_observation)
-        print(f"LocalControlAgent '{self.agent_id}' created. Subscribed to observation topic '{observation_topic}'.")
+        # Resolve how this controller accepts commands once, instead of probing
+        # it with hasattr on every command message.
+        if hasattr(self.controller, 'update_setpoint'):
+            self._command_handler = self.controller.update_setpoint
+        elif hasattr(self.controller, 'set_setpoint'):
+            self._command_handler = self._apply_new_setpoint
+        else:
+            self._command_handler = None
+
+        if group is not None:
+            group.add_member(self.observation_topic, self.handle_observation)
+            logger.debug("LocalControlAgent '%s' created. Receiving '%s' through group '%s'.", self.agent_id, observation_topic, group.agent_id)
+        else:
+            self.bus.subscribe(self.observation_topic, self.handle_observation)
+            logger.debug("LocalControlAgent '%s' created. Subscribed to observation topic '%s'.", self.agent_id, observation_topic)
 
         if command_topic:
             self.bus.subscribe(command_topic, self.handle_command_message)
-            print(f"LocalControlAgent '{self.agent_id}' also subscribed to command topic '{command_topic}'.")
+            logger.debug("LocalControlAgent '%s' also subscribed to command topic '%s'.", self.agent_id, command_topic)
 
         if feedback_topic:
             self.bus.subscribe(feedback_topic, self.handle_feedback_message)
-            print(f"LocalControlAgent '{self.agent_id}' also subscribed to feedback topic '{feedback_topic}'.")
+            logger.debug("LocalControlAgent '%s' also subscribed to feedback topic '%s'.", self.agent_id, feedback_topic)
 
     def handle_feedback_message(self, message: Message):
         """Callback to handle incoming state feedback from the controlled object."""
@@ -62,13 +86,14 @@ class LocalControlAgent(Agent):
 
     def handle_command_message(self, message: Message):
         """Callback to handle incoming high-level commands."""
-        # This is a more generic way to update a controller's setpoint
-        if hasattr(self.controller, 'update_setpoint'):
-            self.controller.update_setpoint(message)
-        elif hasattr(self.controller, 'set_setpoint'):
-            new_setpoint = message.get('new_setpoint')
-            if new_setpoint is not None:
-                self.controller.set_setpoint(new_setpoint)
+        if self._command_handler is not None:
+            self._command_handler(message)
+
+    def _apply_new_setpoint(self, message: Message):
+        """Command handler for controllers exposing only `set_setpoint`."""
+        new_setpoint = message.get('new_setpoint')
+        if new_setpoint is not None:
+            self.controller.set_setpoint(new_setpoint)
 
     def handle_observation(self, message: Message):
         """
@@ -82,7 +107,7 @@ class LocalControlAgent(Agent):
             # Otherwise, extract the specific variable.
             process_variable = message.get(self.observation_key)
             if process_variable is None:
-                print(f"[{self.agent_id}] Warning: Key '{self.observation_key}' not found in observation message: {message}")
+                logger.warning("[%s] Key '%s' not found in observation message: %s", self.agent_id, self.observation_key, message)
                 return
             # And wrap it in the expected format for simple controllers.
             observation_for_controller = {'process_variable': process_variable}
@@ -2,9 +2,10 @@
 一个模型预测控制（MPC）控制器。
 """
 import numpy as np
+from scipy.linalg import cho_factor, cho_solve, LinAlgError
 from scipy.optimize import minimize
-from typing import Dict, Any, List
-from collections import deque
+from typing import Dict, Any
+from collections import OrderedDict
 from core_lib.core.interfaces import Controller, State
 
 class MPCController(Controller):
@@ -13,6 +14,12 @@ class MPCController(Controller):
     依据“现地MPC”的设计文档进行实现。
     """
 
+    __slots__ = ('horizon', 'dt', 'target_level', 'q_weight', 'r_weight', 'bounds', '_bnds',
+                 'K', 'tau', '_history_buffer', '_history_head',
+                 '_G', '_qp_rhs', '_qp_factor', '_last_solution',
+                 'solution_cache_size', '_solution_cache',
+                 'steady_state_level_tol', 'steady_state_flow_tol', '_solver_options')
+
     def __init__(self, horizon: int, dt: float, config: Dict[str, Any]):
         """
         初始化MPC控制器。
@@ -27,6 +34,14 @@ class MPCController(Controller):
                 - bounds: 控制动作的元组（最小值, 最大值）。
                 - id_model_gain (K): 积分-时滞模型的增益。
                 - id_model_delay_steps (tau): 以离散步数表示的时间延迟。
+                - solution_cache_size: 最优解缓存的最大条目数（默认1024，0表示禁用）。
+                  水位按0.01、扰动预测和控制历史按0.001量化后作为缓存键，
+                  在稳定工况下可直接复用之前的最优解而无需重新求解。
+                - steady_state_level_tol: 判定处于稳态的水位偏差阈值（默认1e-3，0表示禁用稳态判定）。
+                - steady_state_flow_tol: 判定处于稳态的扰动及历史控制作用（K*u）阈值（默认1e-6）。
+                - solver_maxiter: SLSQP的最大迭代次数（默认20）。
+                - solver_ftol: SLSQP的收敛精度（默认1e-3）。滚动时域下每一步都会重新规划，
+                  且初始点已接近最优，无需收敛到SLSQP默认的1e-6。
         """
         self.horizon = horizon
         self.dt = dt
@@ -34,47 +49,122 @@ class MPCController(Controller):
         self.q_weight = config.get("q_weight", 1.0)
         self.r_weight = config.get("r_weight", 0.1)
         self.bounds = config.get("bounds", (0, 1))
+        # SLSQP所需的逐变量边界列表在整个生命周期内不变，只构造一次
+        self._bnds = [self.bounds] * self.horizon
+        self._solver_options = {
+            'maxiter': int(config.get("solver_maxiter", 20)),
+            'ftol': config.get("solver_ftol", 1e-3),
+        }
 
         # ID模型参数
         self.K = config["id_model_gain"]
         self.tau = int(config["id_model_delay_steps"]) # 以步数表示的延迟
 
-        # 存储控制动作历史以处理延迟
-        self.control_history = deque([0.0] * self.tau, maxlen=self.tau)
+        # 存储控制动作历史以处理延迟。使用长度为2*tau的镜像环形缓冲区：每个动作
+        # 同时写入位置 head 和 head+tau，使按时间顺序排列的最近tau个动作始终是
+        # 连续切片 [head, head+tau)，无需复制即可作为数组视图传给目标函数。
+        self._history_buffer = np.zeros(2 * self.tau)
+        self._history_head = 0
+
+        # 成本是控制序列u的凸二次函数：predicted_levels = levels_0 + G u，
+        # 其中 G[j, k] = K*dt（当 j >= k + tau 时）。Hessian 与当前状态无关，
+        # 因此在此处一次性完成Cholesky分解，每步只需一次三角回代。
+        self._G = self.K * self.dt * np.tril(np.ones((self.horizon, self.horizon)), -self.tau)
+        self._qp_rhs = -self.q_weight * self._G.T
+        try:
+            hessian = self.q_weight * self._G.T @ self._G + self.r_weight * np.eye(self.horizon)
+            self._qp_factor = cho_factor(hessian)
+        except LinAlgError:
+            # 例如 r_weight 为0时Hessian可能奇异，此时只使用SLSQP
+            self._qp_factor = None
+
+        # 上一步的最优控制序列，用于为SLSQP提供热启动
+        self._last_solution = None
+
+        # 以量化输入为键的LRU最优解缓存
+        self.solution_cache_size = int(config.get("solution_cache_size", 1024))
+        self._solution_cache = OrderedDict()
+
+        # 稳态判定阈值
+        self.steady_state_level_tol = config.get("steady_state_level_tol", 1e-3)
+        self.steady_state_flow_tol = config.get("steady_state_flow_tol", 1e-6)
+
+    @property
+    def control_history(self) -> np.ndarray:
+        """最近tau个控制动作（从旧到新）的只读视图。"""
+        view = self._history_buffer[self._history_head:self._history_head + self.tau]
+        view.flags.writeable = False
+        return view
+
+    def _record_action(self, action: float):
+        """将一个控制动作追加到环形缓冲区。"""
+        if self.tau:
+            self._history_buffer[self._history_head] = action
+            self._history_buffer[self._history_head + self.tau] = action
+            self._history_head = (self._history_head + 1) % self.tau
 
     def _objective_function(self, control_sequence: np.ndarray,
                             current_level: float,
-                            disturbance_forecast: List[float],
-                            past_controls: List[float]) -> float:
+                            disturbance_forecast: np.ndarray,
+                            past_controls: np.ndarray) -> float:
         """
         要最小化的函数。使用ID模型计算给定控制序列的总成本。
         """
-        cost = 0.0
-        predicted_level = current_level
+        return self._objective_and_grad(control_sequence, current_level,
+                                        disturbance_forecast, past_controls)[0]
 
-        # 用于预测的完整控制输入序列包括历史动作和新的候选序列。
-        full_control_input = past_controls + list(control_sequence)
+    def _objective_and_grad(self, control_sequence: np.ndarray,
+                            current_level: float,
+                            disturbance_forecast: np.ndarray,
+                            past_controls: np.ndarray):
+        """
+        计算总成本及其对控制序列的解析梯度。
+
+        整个时域上的水位预测以向量形式一次完成（累加和），而不是逐步循环。
+        由于 d(level_j)/d(u_k) = K*dt（当 j >= k + tau 时，否则为0），
+        梯度可由误差的反向累加和直接得到，无需有限差分。
 
+        返回:
+            (cost, grad) 元组，供 minimize(..., jac=True) 使用。
+        """
         num_steps = min(len(control_sequence), len(disturbance_forecast))
 
-        for i in range(num_steps):
-            # 影响当前步骤'i'的控制动作是在'tau'个步骤前执行的。
-            # 索引是 i + tau (对于past_controls) - tau = i
-            effective_control_action = full_control_input[i]
+        # 用于预测的完整控制输入序列包括历史动作和新的候选序列。
+        # 影响步骤'i'的控制动作是在'tau'个步骤前执行的，即完整序列中的第i个元素。
+        effective_controls = np.concatenate((past_controls, control_sequence))[:num_steps]
 
-            # ID模型：水位的变化与延迟的控制动作成正比，减去任何外部扰动（例如，预测的出流量/需求）。
-            change_in_level = self.K * effective_control_action - disturbance_forecast[i]
+        # ID模型：水位的变化与延迟的控制动作成正比，减去任何外部扰动（例如，预测的出流量/需求）。
+        change_in_level = self.K * effective_controls - disturbance_forecast[:num_steps]
+        predicted_levels = current_level + self.dt * np.cumsum(change_in_level)
 
-            predicted_level += change_in_level * self.dt
+        # 成本计算：1. 偏离目标水位的成本；2. 控制动作大小的成本
+        level_error = predicted_levels - self.target_level
+        controls = control_sequence[:num_steps]
+        cost = self.q_weight * np.dot(level_error, level_error) + self.r_weight * np.dot(controls, controls)
 
-            # 成本计算
-            # 1. 偏离目标水位的成本
-            cost += self.q_weight * ((predicted_level - self.target_level) ** 2)
+        # 梯度：u_k 影响其生效（k + tau）之后的所有水位
+        grad = np.zeros(len(control_sequence))
+        tail_error_sums = np.cumsum(level_error[::-1])[::-1]
+        num_effective = max(num_steps - len(past_controls), 0)
+        grad[:num_effective] = (2.0 * self.q_weight * self.K * self.dt) * tail_error_sums[len(past_controls):num_steps]
+        grad[:num_steps] += 2.0 * self.r_weight * controls
 
-            # 2. 控制动作大小的成本
-            cost += self.r_weight * (control_sequence[i] ** 2)
+        return cost, grad
 
-        return cost
+    def _solve_unconstrained(self, current_level: float,
+                             disturbance_forecast: np.ndarray,
+                             past_controls: np.ndarray) -> np.ndarray:
+        """
+        求解不考虑边界约束的二次规划问题的闭式解。
+        """
+        # 控制序列为零时的预测水位（仅包含已执行的历史动作和扰动）
+        free_controls = np.zeros(self.horizon)
+        num_past = min(len(past_controls), self.horizon)
+        free_controls[:num_past] = past_controls[:num_past]
+        free_levels = current_level + self.dt * np.cumsum(
+            self.K * free_controls - disturbance_forecast[:self.horizon])
+
+        return cho_solve(self._qp_factor, self._qp_rhs @ (free_levels - self.target_level))
 
     def compute_control_action(self, observation: State, dt: float) -> Any:
         """
@@ -82,33 +172,107 @@ class MPCController(Controller):
         """
         current_level = observation.get("water_level")
         # 'disturbance_forecast'可以是净入流量（入流量 - 基础出流量）或类似值
-        disturbance_forecast = observation.get("disturbance_forecast", [0.0] * self.horizon)
+        disturbance_forecast = observation.get("disturbance_forecast")
+        if disturbance_forecast is None:
+            disturbance_forecast = ()
 
         if current_level is None:
             raise ValueError("观测值必须包含'water_level'。")
 
-        # 确保预测与时域长度匹配
-        if len(disturbance_forecast) < self.horizon:
-            last_value = disturbance_forecast[-1] if disturbance_forecast else 0
-            disturbance_forecast.extend([last_value] * (self.horizon - len(disturbance_forecast)))
-
-        initial_guess = np.zeros(self.horizon)
-        bnds = [self.bounds] * self.horizon
+        # 确保预测与时域长度匹配：写入一个长度为horizon的新数组，不足部分用最后一个值填充，
+        # 而不是原地扩展调用方传入的列表
+        disturbance_array = np.empty(self.horizon)
+        num_given = min(len(disturbance_forecast), self.horizon)
+        disturbance_array[:num_given] = disturbance_forecast[:num_given]
+        disturbance_array[num_given:] = disturbance_forecast[-1] if num_given else 0.0
 
         # 传递模拟延迟所需的控制历史
-        past_controls_for_prediction = list(self.control_history)
+        past_controls_for_prediction = self.control_history
 
-        result = minimize(
-            self._objective_function,
-            initial_guess,
-            args=(current_level, disturbance_forecast, past_controls_for_prediction),
-            method='SLSQP',
-            bounds=bnds
-        )
+        solution = None
+        if self._is_steady_state(current_level, disturbance_array, past_controls_for_prediction):
+            # 水位已在目标附近且没有扰动、也没有尚未生效的控制动作：不施加控制时水位保持不变，
+            # 最优解就是投影到边界内的零控制序列，无需调用优化器
+            lower, upper = self.bounds
+            solution = np.full(self.horizon, min(max(0.0, -np.inf if lower is None else lower),
+                                                 np.inf if upper is None else upper))
+        elif self.solution_cache_size > 0:
+            cache_key = (round(current_level, 2),
+                         np.round(disturbance_array[:self.horizon], 3).tobytes(),
+                         np.round(past_controls_for_prediction, 3).tobytes())
+            solution = self._solution_cache.get(cache_key)
+            if solution is not None:
+                self._solution_cache.move_to_end(cache_key)
 
-        optimal_action = result.x[0] if result.success else initial_guess[0]
+        if solution is None:
+            solution, success = self._optimize(current_level, disturbance_array,
+                                               past_controls_for_prediction)
+            if success and self.solution_cache_size > 0:
+                self._solution_cache[cache_key] = solution
+                if len(self._solution_cache) > self.solution_cache_size:
+                    self._solution_cache.popitem(last=False)
+        else:
+            success = True
+
+        if success:
+            self._last_solution = solution
+        optimal_action = solution[0]
 
         # 用选择的动作更新控制历史
-        self.control_history.append(optimal_action)
+        self._record_action(optimal_action)
 
         return {'opening': float(optimal_action)}
+
+    def _is_steady_state(self, current_level: float,
+                         disturbance_forecast: np.ndarray,
+                         past_controls: np.ndarray) -> bool:
+        """
+        判断系统是否处于无需求解的稳态：水位偏差、扰动预测以及延迟中的控制作用均可忽略。
+        """
+        if self.steady_state_level_tol <= 0:
+            return False
+        if abs(current_level - self.target_level) >= self.steady_state_level_tol:
+            return False
+        if disturbance_forecast.size and np.abs(disturbance_forecast).max() >= self.steady_state_flow_tol:
+            return False
+        return not past_controls.size or abs(self.K) * np.abs(past_controls).max() < self.steady_state_flow_tol
+
+    def _optimize(self, current_level: float,
+                  disturbance_forecast: np.ndarray,
+                  past_controls: np.ndarray):
+        """
+        求解一次MPC优化问题。
+
+        返回:
+            (control_sequence, success) 元组。求解失败时返回初始猜测。
+        """
+        if self._qp_factor is not None:
+            # 先求无约束最优解并投影到边界内；若没有约束被激活，它就是最优解
+            unconstrained = self._solve_unconstrained(current_level, disturbance_forecast, past_controls)
+            lower, upper = self.bounds
+            initial_guess = np.clip(unconstrained,
+                                    -np.inf if lower is None else lower,
+                                    np.inf if upper is None else upper)
+            if np.array_equal(initial_guess, unconstrained):
+                return initial_guess, True
+        elif self._last_solution is not None:
+            # 滚动时域下最优计划变化缓慢：将上一步的解前移一步作为热启动
+            initial_guess = np.roll(self._last_solution, -1)
+            initial_guess[-1] = self._last_solution[-1]
+        else:
+            initial_guess = np.zeros(self.horizon)
+
+        # 边界约束被激活时以投影后的闭式解为起点调用SLSQP，否则以热启动值为起点
+        result = minimize(
+            self._objective_and_grad,
+            initial_guess,
+            args=(current_level, disturbance_forecast, past_controls),
+            method='SLSQP',
+            jac=True,
+            bounds=self._bnds,
+            options=self._solver_options
+        )
+
+        if result.success:
+            return result.x, True
+        return initial_guess, False
@@ -1,8 +1,11 @@
 """
 A Proportional-Integral-Derivative (PID) Controller with anti-windup.
 """
+import logging
 from core_lib.core.interfaces import Controller, State
 
+logger = logging.getLogger(__name__)
+
 class PIDController(Controller):
     """
     A standard PID controller with clamping and anti-windup.
@@ -12,6 +15,11 @@ class PIDController(Controller):
     term saturation when the actuator is at its limit.
     """
 
+    # One instance per controlled device, read on every tick: fixed slots avoid
+    # a per-instance __dict__ and make attribute access cheaper.
+    __slots__ = ('Kp', 'Ki', 'Kd', 'setpoint', 'min_output', 'max_output',
+                 '_integral', '_previous_error', '_previous_output')
+
     def __init__(self, Kp: float, Ki: float, Kd: float, setpoint: float,
                  min_output: float, max_output: float):
         """
@@ -34,8 +42,9 @@ class PIDController(Controller):
 
         self._integral = 0
         self._previous_error = 0
-        print(f"PIDController created with Kp={Kp}, Ki={Ki}, Kd={Kd}, Setpoint={setpoint}, "
-              f"OutputRange=[{min_output}, {max_output}].")
+        self._previous_output = min_output
+        logger.debug("PIDController created with Kp=%s, Ki=%s, Kd=%s, Setpoint=%s, OutputRange=[%s, %s].",
+                     Kp, Ki, Kd, setpoint, min_output, max_output)
 
     def compute_control_action(self, observation: State, dt: float) -> float:
         """
@@ -51,11 +60,14 @@ class PIDController(Controller):
         if dt <= 0:
             return self.min_output # Avoid division by zero
 
-        process_variable = observation.get('process_variable')
+        try:
+            process_variable = observation['process_variable']
+        except KeyError:
+            process_variable = None
         if process_variable is None:
             # Handle cases where the observation is not as expected
-            # Returning a neutral or safe value
-            return self._previous_output if hasattr(self, '_previous_output') else self.min_output
+            # Returning the last (initially the minimum) output as a safe value
+            return self._previous_output
 
         error = self.setpoint - process_variable
 
@@ -104,7 +116,7 @@ class PIDController(Controller):
         Updates the controller's setpoint and resets internal states.
         """
         if self.setpoint != new_setpoint:
-            print(f"PIDController setpoint updated from {self.setpoint} to {new_setpoint}.")
+            logger.info("PIDController setpoint updated from %s to %s.", self.setpoint, new_setpoint)
             self.setpoint = new_setpoint
             # Reset integral and derivative error to prevent output jumps
             self._integral = 0
@@ -1,11 +1,15 @@
 """
 An agent for controlling a pump station to maintain pressure in a pipe network.
 """
+import logging
 import math
+import numpy as np
 from core_lib.core.interfaces import Agent
 from core_lib.central_coordination.collaboration.message_bus import MessageBus, Message
 from core_lib.physical_objects.pump import PumpStation
 
+logger = logging.getLogger(__name__)
+
 class PressureControlAgent(Agent):
     """
     An agent that controls a PumpStation to maintain pressure within a target range.
@@ -24,14 +28,32 @@ class PressureControlAgent(Agent):
         # Control parameters
         self.min_pressure = self.config['min_pressure']
         self.max_pressure = self.config['max_pressure']
+        # Minimum time between two pump count changes, so a pressure signal that
+        # hovers around a limit does not toggle pumps (and republish) every step
+        self.min_dwell = self.config.get('min_dwell_seconds', 30)
+        self._last_change_time = -math.inf
 
         self.pumps = self.pump_station.pumps
         self.num_pumps = len(self.pumps)
         self.active_pumps = 0
 
-    def execute_control_logic(self):
+        # Topics and the two possible messages never change, so build them once
+        self._pump_topics = [f"{self.control_topic_prefix}.{pump.name}" for pump in self.pumps]
+        self._on_msg = {'control_signal': 1, 'sender': self.agent_id}
+        self._off_msg = {'control_signal': 0, 'sender': self.agent_id}
+
+        # Last control signal sent to each pump; -1 until the first publish
+        self._pump_indices = np.arange(self.num_pumps)
+        self._last_pump_states = np.full(self.num_pumps, -1, dtype=np.int8)
+
+    def execute_control_logic(self, current_time: float = None):
         """
         Executes the pressure control logic for one time step.
+
+        Args:
+            current_time: The current simulation time in seconds. When given, the
+                number of active pumps changes at most once every `min_dwell`
+                seconds; when omitted, no dwell time is enforced.
         """
         # In a real system, this would come from a sensor message.
         # Here, we read it directly from the component's state for simplicity.
@@ -42,22 +64,34 @@ class PressureControlAgent(Agent):
         # Hysteresis control logic
         if current_pressure < self.min_pressure:
             # If pressure is too low, turn on one more pump (if available)
-            self.active_pumps = min(self.active_pumps + 1, self.num_pumps)
-            print(f"[{self.agent_id}] Pressure low ({current_pressure:.2f} < {self.min_pressure:.2f}). Activating {self.active_pumps} pumps.")
+            requested_pumps = min(self.active_pumps + 1, self.num_pumps)
         elif current_pressure > self.max_pressure:
             # If pressure is too high, turn off one pump
-            self.active_pumps = max(self.active_pumps - 1, 0)
-            print(f"[{self.agent_id}] Pressure high ({current_pressure:.2f} > {self.max_pressure:.2f}). Deactivating to {self.active_pumps} pumps.")
+            requested_pumps = max(self.active_pumps - 1, 0)
         else:
             # Pressure is within the deadband, do nothing
-            pass
-
-        # Publish control signals to each pump
-        for i, pump in enumerate(self.pumps):
-            control_signal = 1 if i < self.active_pumps else 0
-            topic = f"{self.control_topic_prefix}.{pump.name}"
-            message = {'control_signal': control_signal, 'sender': self.agent_id}
-            self.bus.publish(topic, message)
+            requested_pumps = self.active_pumps
+
+        if requested_pumps != self.active_pumps:
+            if current_time is not None and current_time - self._last_change_time < self.min_dwell:
+                logger.debug("[%s] Pressure %.2f out of range, but last change was at t=%.1f; holding %d pumps.",
+                             self.agent_id, current_pressure, self._last_change_time, self.active_pumps)
+            else:
+                logger.debug("[%s] Pressure %.2f outside [%.2f, %.2f]. Changing active pumps from %d to %d.",
+                             self.agent_id, current_pressure, self.min_pressure, self.max_pressure,
+                             self.active_pumps, requested_pumps)
+                self.active_pumps = requested_pumps
+                if current_time is not None:
+                    self._last_change_time = current_time
+
+        # Pumps [0, active_pumps) run; publish only to pumps whose state changed
+        signals = (self._pump_indices < self.active_pumps).astype(np.int8)
+        changed = np.flatnonzero(signals != self._last_pump_states)
+        if changed.size:
+            self.bus.publish_batch(
+                (self._pump_topics[i], self._on_msg if signals[i] else self._off_msg) for i in changed
+            )
+            self._last_pump_states = signals
 
     async def run(self, current_time: float):
         pass
@@ -1,42 +1,69 @@
 """
 An agent for controlling a pump station to meet a flow demand.
 """
-import math
+import logging
+import numbers
+from bisect import bisect_left
 from core_lib.core.interfaces import Agent
 from core_lib.central_coordination.collaboration.message_bus import MessageBus, Message
 from core_lib.physical_objects.pump import PumpStation
 
+logger = logging.getLogger(__name__)
 
 class PumpControlAgent(Agent):
     """
     An agent that controls a PumpStation to meet a specified flow demand.
     It listens for demand messages and turns individual pumps on or off to
     collectively meet the target flow rate.
+
+    Each control step publishes the whole station's signals once, as
+    `{'signals': [...], 'sender': agent_id}` on `<control_topic_prefix>.batch`.
+    With `per_pump_topics` enabled (the default), each pump additionally
+    receives its own `control_signal` message on `<control_topic_prefix>.<pump name>`,
+    which is what `Pump` subscribes to. Disable it when the batch topic is
+    consumed directly, e.g. by `PumpStation.handle_batch_action_message`.
     """
 
     def __init__(self, agent_id: str, message_bus: MessageBus, pump_station: PumpStation,
-                 demand_topic: str, control_topic_prefix: str):
+                 demand_topic: str, control_topic_prefix: str, per_pump_topics: bool = True):
         super().__init__(agent_id)
         self.bus = message_bus
         self.pump_station = pump_station
         self.demand_topic = demand_topic
         self.control_topic_prefix = control_topic_prefix
         self.pumps = self.pump_station.pumps
+        self.per_pump_topics = per_pump_topics
+
+        # Topics and the two possible per-pump messages never change, so build them once
+        self.control_topic_batch = f"{self.control_topic_prefix}.batch"
+        self._pump_topics = [f"{self.control_topic_prefix}.{pump.name}" for pump in self.pumps]
+        self._on_msg = {'control_signal': 1, 'sender': self.agent_id}
+        self._off_msg = {'control_signal': 0, 'sender': self.agent_id}
+
+        # Pumps [0, n) run, so the station's signals are fully described by n.
+        # Number of running pumps last published; -1 until the first publish.
+        self._last_num_pumps = -1
 
         # Assume all pumps have the same flow rate for simplicity
         self.pump_flow_rate = self.pumps[0].get_parameters().get('max_flow_rate', 1.0) if self.pumps else 0
+        # With identical pumps, the number needed is a step function of demand:
+        # k pumps suffice while demand <= k * flow rate. Thresholds[j] = j * flow
+        # rate, so the count of thresholds below the demand is the pump count.
+        self._thresholds = [i * self.pump_flow_rate for i in range(len(self.pumps))]
 
         # Subscribe to the demand topic
         self.bus.subscribe(self.demand_topic, self.handle_demand_message)
         self.current_demand = 0.0
-        print(f"Agent '{self.agent_id}' created and subscribed to demand topic '{self.demand_topic}'.")
+        logger.debug("Agent '%s' created and subscribed to demand topic '%s'.", self.agent_id, self.demand_topic)
 
     def handle_demand_message(self, message: Message):
         """Callback to update the flow demand when a message is received."""
         demand = message.get('value')
-        if isinstance(demand, (int, float)):
-            self.current_demand = demand
-            print(f"[{self.agent_id}] Received new flow demand: {self.current_demand:.2f} m^3/s")
+        # Numbers only: float() would also accept strings such as '3.5'
+        if not isinstance(demand, numbers.Real):
+            return
+        self.current_demand = float(demand)
+        logger.info("[%s] Received new flow demand: %.2f m^3/s", self.agent_id, self.current_demand)
 
     async def run(self):
         """
@@ -53,20 +80,34 @@ class PumpControlAgent(Agent):
         if not self.pumps or self.pump_flow_rate <= 0:
             return
 
-        # Calculate the number of pumps required to meet the current demand.
-        # Use ceiling to ensure demand is met or exceeded.
-        num_pumps_needed = math.ceil(self.current_demand / self.pump_flow_rate)
+        # Calculate the number of pumps required to meet or exceed the current
+        # demand (the ceiling of demand / flow rate, capped at the available pumps)
+        # with a binary search over the precomputed thresholds.
+        num_pumps_needed = bisect_left(self._thresholds, self.current_demand)
+
+        logger.debug("[%s] Demand is %.2f m^3/s. Activating %d of %d pumps.",
+                     self.agent_id, self.current_demand, num_pumps_needed, len(self.pumps))
 
-        # Ensure the number of pumps does not exceed the available pumps.
-        num_pumps_needed = min(num_pumps_needed, len(self.pumps))
+        # Nothing changed since the last publish: skip it entirely
+        last_num_pumps = self._last_num_pumps
+        if num_pumps_needed == last_num_pumps:
+            return
+        self._last_num_pumps = num_pumps_needed
 
-        print(f"[{self.agent_id}] Demand is {self.current_demand:.2f} m^3/s. Activating {num_pumps_needed} of {len(self.pumps)} pumps.")
+        # Publish the station's signals once on the batch topic.
+        num_pumps = len(self.pumps)
+        signals = [1] * num_pumps_needed + [0] * (num_pumps - num_pumps_needed)
+        self.bus.publish(self.control_topic_batch, {'signals': signals, 'sender': self.agent_id})
 
-        # Publish control signals to each pump's specific topic.
-        for i, pump in enumerate(self.pumps):
-            control_signal = 1 if i < num_pumps_needed else 0
-            topic = f"{self.control_topic_prefix}.{pump.name}"
+        if self.per_pump_topics:
+            # Fan out in one dispatch sweep, only to the pumps whose signal changed:
+            # those between the previous and the new count (all of them on the first publish).
             # The pump's handler expects a 'control_signal' key in the message dict.
-            message = {'control_signal': control_signal, 'sender': self.agent_id}
-            self.bus.publish(topic, message)
-            # print(f"[{self.agent_id}] Sending control_signal={control_signal} to {pump.name} on topic {topic}")
+            if last_num_pumps < 0:
+                start, stop = 0, num_pumps
+            else:
+                start, stop = sorted((last_num_pumps, num_pumps_needed))
+            self.bus.publish_batch(
+                (self._pump_topics[i], self._on_msg if i < num_pumps_needed else self._off_msg)
+                for i in range(start, stop)
+            )
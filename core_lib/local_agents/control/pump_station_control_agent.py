@@ -1,9 +1,13 @@
 """
 Control Agent for a Pump Station.
 """
+import logging
+import operator
 from core_lib.core.interfaces import Agent, State
 from core_lib.central_coordination.collaboration.message_bus import MessageBus
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
+
+logger = logging.getLogger(__name__)
 
 class PumpStationControlAgent(Agent):
     """
@@ -20,7 +24,8 @@ class PumpStationControlAgent(Agent):
                  message_bus: MessageBus,
                  goal_topic: str,
                  state_topic: str,
-                 pump_action_topics: List[str]):
+                 pump_action_topics: List[str],
+                 station_action_topic: Optional[str] = None):
         """
         Initializes the PumpStationControlAgent.
 
@@ -30,35 +35,51 @@ class PumpStationControlAgent(Agent):
             goal_topic: The topic to listen on for new control goals.
             state_topic: The topic to listen on for the station's current state.
             pump_action_topics: A list of the action topics for each pump in the station.
+            station_action_topic: If given, the whole station's state is published on
+                                  this topic as one bitmask message,
+                                  `{'pump_mask': mask, 'n': num_pumps}` with bit i set
+                                  when pump i should run, instead of one message per pump
+                                  (see `PumpStation.handle_batch_action_message`).
         """
         super().__init__(agent_id)
         self.bus = message_bus
-        self.pump_action_topics = pump_action_topics
+        self.pump_action_topics = tuple(pump_action_topics)
         self.num_pumps = len(pump_action_topics)
+        self.station_action_topic = station_action_topic
+
+        # The two possible messages never change, so build them once
+        self._msg_on = {'control_signal': 1}
+        self._msg_off = {'control_signal': 0}
 
         # Agent's memory
         self.target_active_pumps: int = 0
         self.current_active_pumps: int = 0
+        # Last control signal sent to each pump; -1 until the first publish
+        self._last_signals: List[int] = [-1] * self.num_pumps
+        # Last bitmask sent on the station topic; -1 until the first publish
+        self._last_mask: int = -1
 
         # Subscribe to relevant topics
         self.bus.subscribe(goal_topic, self.handle_goal_message)
         self.bus.subscribe(state_topic, self.handle_state_message)
 
-        print(f"PumpStationControlAgent '{self.agent_id}' created.")
-        print(f"  - Subscribed to goal topic: '{goal_topic}'")
-        print(f"  - Subscribed to state topic: '{state_topic}'")
-        print(f"  - Controls {self.num_pumps} pumps.")
+        logger.debug("PumpStationControlAgent '%s' created. Subscribed to goal topic '%s' and state topic '%s'; controls %d pumps.",
+                     self.agent_id, goal_topic, state_topic, self.num_pumps)
 
     def handle_goal_message(self, message: Dict[str, Any]):
         """Callback for processing new control goals."""
-        new_target = message.get('target_active_pumps')
-        if isinstance(new_target, int) and 0 <= new_target <= self.num_pumps:
-            if new_target != self.target_active_pumps:
-                print(f"'{self.agent_id}' received new goal: Turn on {new_target} pumps.")
-                self.target_active_pumps = new_target
-                self.run_control_logic()
-        else:
-            print(f"'{self.agent_id}' received invalid goal: {message}")
+        try:
+            # operator.index accepts integers only, rejecting floats rather than truncating them
+            new_target = operator.index(message.get('target_active_pumps'))
+        except TypeError:
+            new_target = -1
+        if not 0 <= new_target <= self.num_pumps:
+            logger.warning("'%s' received invalid goal: %s", self.agent_id, message)
+            return
+        if new_target != self.target_active_pumps:
+            logger.info("'%s' received new goal: Turn on %d pumps.", self.agent_id, new_target)
+            self.target_active_pumps = new_target
+            self.run_control_logic()
 
     def handle_state_message(self, message: State):
         """Callback for processing state updates from the perception agent."""
@@ -73,15 +94,39 @@ class PumpStationControlAgent(Agent):
         This is a simple strategy: turn pumps on or off sequentially to meet the target.
         A more advanced implementation would use an economic strategy table.
         """
-        print(f"'{self.agent_id}' running control logic. Target: {self.target_active_pumps}, Current: {self.current_active_pumps}")
+        logger.debug("'%s' running control logic. Target: %d, Current: %d",
+                     self.agent_id, self.target_active_pumps, self.current_active_pumps)
+
+        if self.station_action_topic is not None:
+            # Pumps [0, target) run: the low `target` bits
+            mask = (1 << self.target_active_pumps) - 1
+            if mask != self._last_mask:
+                self.bus.publish(self.station_action_topic, {'pump_mask': mask, 'n': self.num_pumps})
+                self._last_mask = mask
+            return
 
-        # Turn pumps on/off to match the target
+        # Checked once, not per pump
+        log_pumps = logger.isEnabledFor(logging.DEBUG)
+
+        # Turn pumps on/off to match the target, only publishing to pumps whose signal changed
+        last_signals = self._last_signals
+        topics_on, topics_off = [], []
         for i, topic in enumerate(self.pump_action_topics):
             # The desired state for this pump (1 for on, 0 for off)
             desired_status = 1 if i < self.target_active_pumps else 0
+            if desired_status == last_signals[i]:
+                continue
+
+            if log_pumps:
+                logger.debug("  - Sending control signal %d to pump %d on topic '%s'", desired_status, i + 1, topic)
+            (topics_on if desired_status else topics_off).append(topic)
+            last_signals[i] = desired_status
 
-            print(f"  - Sending control signal {desired_status} to pump {i+1} on topic '{topic}'")
-            self.bus.publish(topic, {'control_signal': desired_status})
+        # All pumps switched the same way share one message
+        if topics_on:
+            self.bus.publish_many(topics_on, self._msg_on)
+        if topics_off:
+            self.bus.publish_many(topics_off, self._msg_off)
 
     def run(self, current_time: float):
         """
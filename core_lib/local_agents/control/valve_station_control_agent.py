@@ -1,9 +1,13 @@
 """
 Control Agent for a Valve Station.
 """
+import logging
+import numbers
 from core_lib.core.interfaces import Agent, State
 from core_lib.central_coordination.collaboration.message_bus import MessageBus
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
+
+logger = logging.getLogger(__name__)
 
 class ValveStationControlAgent(Agent):
     """
@@ -20,7 +24,9 @@ class ValveStationControlAgent(Agent):
                  goal_topic: str,
                  state_topic: str,
                  valve_action_topics: List[str],
-                 kp: float = 0.1):
+                 kp: float = 0.1,
+                 opening_tolerance: float = 1e-3,
+                 batch_topic: Optional[str] = None):
         """
         Initializes the ValveStationControlAgent.
 
@@ -31,34 +37,44 @@ class ValveStationControlAgent(Agent):
             state_topic: The topic to listen on for the station's current state.
             valve_action_topics: A list of the action topics for each valve.
             kp: The proportional gain for the controller.
+            opening_tolerance: The smallest change in opening (in %) from the last
+                               published value that is worth a new broadcast.
+            batch_topic: If given, the opening is published once on this topic
+                         (e.g. for `ValveStation.handle_batch_action_message`)
+                         instead of once per valve action topic.
         """
         super().__init__(agent_id)
         self.bus = message_bus
         self.valve_action_topics = valve_action_topics
+        self._valve_topics = tuple(valve_action_topics)
+        self.batch_topic = batch_topic
         self.kp = kp
+        self.opening_tolerance = opening_tolerance
 
         # Agent's memory
         self.target_total_flow: float = 0.0
         self.current_total_flow: float = 0.0
         self.current_valve_opening: float = 50.0 # Assume a starting opening
+        self._last_published_opening: Optional[float] = None
 
         # Subscribe to relevant topics
         self.bus.subscribe(goal_topic, self.handle_goal_message)
         self.bus.subscribe(state_topic, self.handle_state_message)
 
-        print(f"ValveStationControlAgent '{self.agent_id}' created.")
-        print(f"  - Subscribed to goal topic: '{goal_topic}'")
-        print(f"  - Subscribed to state topic: '{state_topic}'")
+        logger.debug("ValveStationControlAgent '%s' created. Subscribed to goal topic '%s' and state topic '%s'.",
+                     self.agent_id, goal_topic, state_topic)
 
     def handle_goal_message(self, message: Dict[str, Any]):
         """Callback for processing new control goals."""
         new_target = message.get('target_total_flow')
-        if isinstance(new_target, (int, float)):
-            if new_target != self.target_total_flow:
-                print(f"'{self.agent_id}' received new flow target: {new_target:.2f}")
-                self.target_total_flow = new_target
-        else:
-            print(f"'{self.agent_id}' received invalid goal: {message}")
+        # Numbers only: float() would also accept strings such as '3.5'
+        if not isinstance(new_target, numbers.Real):
+            logger.warning("'%s' received invalid goal: %s", self.agent_id, message)
+            return
+        new_target = float(new_target)
+        if new_target != self.target_total_flow:
+            logger.info("'%s' received new flow target: %.2f", self.agent_id, new_target)
+            self.target_total_flow = new_target
 
     def handle_state_message(self, message: State):
         """Callback for processing state updates from the perception agent."""
@@ -73,19 +89,30 @@ class ValveStationControlAgent(Agent):
         # Proportional control action
         adjustment = self.kp * error
 
-        # Update the opening for all valves
-        self.current_valve_opening += adjustment
-
-        # Clamp the opening to the valid range [0, 100]
-        self.current_valve_opening = max(0.0, min(100.0, self.current_valve_opening))
-
-        print(f"'{self.agent_id}' Control Loop: Target={self.target_total_flow:.2f}, "
-              f"Current={self.current_total_flow:.2f}, Error={error:.2f}, "
-              f"New Opening={self.current_valve_opening:.1f}%")
-
-        # Publish the new control signal to all valves
-        for topic in self.valve_action_topics:
-            self.bus.publish(topic, {'control_signal': self.current_valve_opening})
+        # Update the opening for all valves, clamped to the valid range [0, 100]
+        opening = self.current_valve_opening + adjustment
+        if opening < 0.0:
+            opening = 0.0
+        elif opening > 100.0:
+            opening = 100.0
+        self.current_valve_opening = opening
+
+        logger.debug("'%s' Control Loop: Target=%.2f, Current=%.2f, Error=%.2f, New Opening=%.1f%%",
+                     self.agent_id, self.target_total_flow, self.current_total_flow, error,
+                     self.current_valve_opening)
+
+        # Skip the broadcast when the opening has not moved since the last one
+        if (self._last_published_opening is not None and
+                abs(self.current_valve_opening - self._last_published_opening) < self.opening_tolerance):
+            return
+        self._last_published_opening = self.current_valve_opening
+
+        # Publish the new control signal to all valves; they all get the same message
+        message = {'control_signal': self.current_valve_opening}
+        if self.batch_topic is not None:
+            self.bus.publish(self.batch_topic, message)
+        else:
+            self.bus.publish_many(self._valve_topics, message)
 
     def run(self, current_time: float):
         """
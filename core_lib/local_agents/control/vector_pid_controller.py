@@ -0,0 +1,99 @@
+"""
+A bank of independent PID controllers evaluated together with NumPy.
+"""
+import numpy as np
+from typing import Sequence, Union
+from core_lib.core.interfaces import Controller, State
+
+ArrayLike = Union[float, Sequence[float], np.ndarray]
+
+
+class VectorPIDController(Controller):
+    """
+    N independent PID controllers with clamping and anti-windup, stepped in a
+    single set of vectorized operations.
+
+    Each element behaves exactly like a `PIDController` with the same gains,
+    setpoint and output range. Grouping them replaces N interpreted
+    `compute_control_action` calls per tick with one NumPy sweep, which pays off
+    when many devices run the same kind of loop.
+    """
+
+    def __init__(self, Kp: ArrayLike, Ki: ArrayLike, Kd: ArrayLike, setpoint: ArrayLike,
+                 min_output: ArrayLike, max_output: ArrayLike, size: int = None):
+        """
+        Initializes the PID bank.
+
+        Args:
+            Kp: Proportional gain(s).
+            Ki: Integral gain(s).
+            Kd: Derivative gain(s).
+            setpoint: The desired value(s) for the controlled variables.
+            min_output: The minimum value(s) for the control actions.
+            max_output: The maximum value(s) for the control actions.
+            size: The number of controllers. Only needed when every other
+                  argument is a scalar; otherwise it is inferred.
+
+        Scalars are broadcast to all controllers.
+        """
+        params = [Kp, Ki, Kd, setpoint, min_output, max_output]
+        if size is None:
+            size = max(np.size(p) for p in params)
+        self.Kp, self.Ki, self.Kd, self.setpoint, self.min_output, self.max_output = (
+            np.broadcast_to(np.asarray(p, dtype=float), (size,)).copy() for p in params
+        )
+        self.size = size
+
+        self._integral = np.zeros(size)
+        self._previous_error = np.zeros(size)
+        self._previous_output = self.min_output.copy()
+
+    def compute_control_action(self, observation: State, dt: float) -> np.ndarray:
+        """
+        Computes the control actions of all controllers at once.
+
+        Args:
+            observation: The current state, must contain the key 'process_variable'
+                         holding one value per controller.
+            dt: The time step duration in seconds.
+
+        Returns:
+            An array of the computed and clamped control actions.
+        """
+        if dt <= 0:
+            return self.min_output.copy() # Avoid division by zero
+
+        process_variable = observation.get('process_variable')
+        if process_variable is None:
+            return self._previous_output.copy()
+
+        error = self.setpoint - np.asarray(process_variable, dtype=float)
+
+        output = (self.Kp * error
+                  + self.Ki * self._integral
+                  + self.Kd * ((error - self._previous_error) / dt))
+
+        # Anti-windup: do not integrate further into a saturated limit
+        saturated_high = output > self.max_output
+        saturated_low = output < self.min_output
+        integrate = ~((saturated_high & (error > 0)) | (saturated_low & (error < 0)))
+        self._integral += np.where(integrate, error * dt, 0.0)
+
+        clamped_output = np.where(saturated_high, self.max_output,
+                                  np.where(saturated_low, self.min_output, output))
+
+        self._previous_error = error
+        self._previous_output = clamped_output
+
+        return clamped_output.copy()
+
+    def set_setpoint(self, new_setpoint: ArrayLike):
+        """
+        Updates the setpoints, resetting the internal state of every controller
+        whose setpoint changed.
+        """
+        new_setpoint = np.broadcast_to(np.asarray(new_setpoint, dtype=float), (self.size,))
+        changed = new_setpoint != self.setpoint
+        self.setpoint = new_setpoint.copy()
+        self._integral[changed] = 0
+        self._previous_error[changed] = 0
@@ -2,17 +2,28 @@ import logging
 from typing import Dict, Any, List
 from core_lib.core.interfaces import Agent
 from core_lib.central_coordination.collaboration.message_bus import MessageBus
+from core_lib.central_coordination.collaboration.mailbox import Mailbox
 
 class DataAggregator(Agent):
     """
     A custom agent that subscribes to topics and aggregates the data it receives.
+
+    The data for each topic is stored column-wise: `aggregated_data[topic]` maps
+    every message key seen on that topic to a list of values, one per message,
+    with None where a message lacked the key. The columns can be handed to
+    NumPy or pandas as they are.
+
+    The raw (agent_id, topic, message) records are kept in `log`, a `Mailbox`
+    that is unbounded by default; pass `buffer_size` to keep only the most
+    recent records. Use `dump()` to format them.
     """
     def __init__(self, agent_id: str, message_bus: MessageBus, **kwargs):
         super().__init__(agent_id)
         self.message_bus = message_bus
         self.subscribed_topics = kwargs['subscribed_topics']
-        self.aggregated_data: Dict[str, List[Any]] = {topic: [] for topic in self.subscribed_topics}
-        self.log = []
+        self.aggregated_data: Dict[str, Dict[str, List[Any]]] = {topic: {} for topic in self.subscribed_topics}
+        self._row_counts: Dict[str, int] = {topic: 0 for topic in self.subscribed_topics}
+        self.log = Mailbox(kwargs.get('buffer_size'))
 
         for topic in self.subscribed_topics:
             # Use a factory function (or lambda) to create a listener that captures the topic
@@ -21,13 +32,36 @@ class DataAggregator(Agent):
 
     def _create_listener(self, topic: str):
         """Creates a callback function that knows which topic it's for."""
+        columns = self.aggregated_data[topic]
+        row_counts = self._row_counts
+        log = self.log
+        agent_id = self.agent_id
         def listener(message: Dict[str, Any]):
-            log_entry = f"[{self.agent_id}] Received on '{topic}': {message}"
-            logging.info(log_entry)
-            self.log.append(log_entry)
-            self.aggregated_data[topic].append(message)
+            logging.info("[%s] Received on '%s': %s", agent_id, topic, message)
+            log((agent_id, topic, message))
+
+            num_rows = row_counts[topic]
+            for key, value in message.items():
+                column = columns.get(key)
+                if column is None:
+                    # A key not seen before: earlier rows did not have it
+                    column = columns[key] = [None] * num_rows
+                column.append(value)
+            num_rows += 1
+            row_counts[topic] = num_rows
+            if len(message) != len(columns):
+                # Some known keys were missing from this message
+                for column in columns.values():
+                    if len(column) < num_rows:
+                        column.append(None)
         return listener
 
+    def dump(self) -> List[str]:
+        """
+        Formats the logged records as human-readable lines.
+        """
+        return [f"[{agent_id}] Received on '{topic}': {message}" for agent_id, topic, message in self.log]
+
     def run(self, current_time: float):
         """
         The agent's main loop. For this reactive agent, it does nothing.
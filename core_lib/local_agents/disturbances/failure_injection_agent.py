@@ -3,15 +3,30 @@ from core_lib.core.interfaces import Agent
 from core_lib.central_coordination.collaboration.message_bus import MessageBus
 
 class FailureInjectionAgent(Agent):
-    """Issues a shutdown command at a specific time."""
+    """
+    Issues a shutdown command at a specific time.
+
+    The injection is scheduled once on the message bus and fires from
+    `MessageBus.advance_time`. Loops that step the agents without advancing the
+    bus clock still get the failure from `run`, which fires it once the time
+    has been reached. Either way it is issued only once.
+    """
     def __init__(self, agent_id: str, message_bus: MessageBus, **kwargs):
         super().__init__(agent_id)
         self.bus = message_bus
         self.topic = kwargs['target_topic']
         self.time = kwargs['failure_time']
         self.fault_injected = False
+        self.bus.schedule_once(self.time, self._inject)
+
+    def _inject(self, current_time: float):
+        if self.fault_injected:
+            return
+        self.fault_injected = True
+        logging.critical("[%s] Injecting failure at time %.2fs on topic %s", self.agent_id, current_time, self.topic)
+        self.bus.publish(self.topic, {'shutdown': True})
+
     def run(self, current_time: float):
+        """Fires the failure if the bus scheduler has not already done so."""
         if not self.fault_injected and current_time >= self.time:
-            logging.critical(f"[{self.agent_id}] Injecting failure at time {current_time:.2f}s on topic {self.topic}")
-            self.bus.publish(self.topic, {'shutdown': True})
-            self.fault_injected = True
+            self._inject(current_time)
@@ -12,8 +12,9 @@ class ConstantInflowAgent(Agent):
         self.target_component_id = kwargs['target_component_id']
         self.inflow_rate = kwargs['inflow_rate']
         self.inflow_topic = f"inflow/{self.target_component_id}"
+        # The payload never changes, so build it once; subscribers treat it as read-only
+        self._msg = {'inflow_rate': self.inflow_rate}
 
 
     def run(self, current_time: float):
-        message = {'inflow_rate': self.inflow_rate}
-        self.message_bus.publish(self.inflow_topic, message)
+        self.message_bus.publish(self.inflow_topic, self._msg)
@@ -15,20 +15,31 @@ class WaterUseAgent(Agent):
         self.bus = message_bus
         self.supply_gate_topic = supply_gate_topic
 
+        # Only two messages are ever sent, so build them once
+        self._msg_day = {'control_signal': 0.8, 'sender': self.agent_id} # 80% open
+        self._msg_night = {'control_signal': 0.2, 'sender': self.agent_id} # 20% open
+        self._last_message = None
+
+        # Daytime window in seconds since midnight
+        self._day_start = 7 * 3600
+        self._day_end = 19 * 3600
+
     def run(self, current_time: float):
         """
-        Determines the water demand based on the time of day and publishes a control signal.
+        Determines the water demand based on the time of day and publishes a control
+        signal whenever it changes, i.e. at the day/night transitions.
         """
         # Simulate a daily pattern: higher demand during the day, lower at night.
-        hour_of_day = (current_time / 3600) % 24
+        time_of_day = current_time % 86400
 
-        if 7 <= hour_of_day < 19:
+        if self._day_start <= time_of_day < self._day_end:
             # Daytime: high demand
-            target_opening = 0.8 # 80% open
+            message = self._msg_day
         else:
             # Nighttime: low demand
-            target_opening = 0.2 # 20% open
+            message = self._msg_night
 
-        message = {'control_signal': target_opening, 'sender': self.agent_id}
-        self.bus.publish(self.supply_gate_topic, message)
-        # print(f"[{self.agent_id}] Time: {hour_of_day:.1f}h, setting supply gate to {target_opening*100}%.")
+        if message is not self._last_message:
+            self.bus.publish(self.supply_gate_topic, message)
+            self._last_message = message
+            # print(f"[{self.agent_id}] Time: {time_of_day / 3600:.1f}h, setting supply gate to {message['control_signal']*100}%.")
@@ -1,4 +1,5 @@
 import numpy as np
+from functools import partial
 from typing import Dict, Any
 
 from core_lib.core.interfaces import Agent, PhysicalObjectInterface
@@ -50,6 +51,14 @@ class PhysicalIOAgent(Agent):
         self.sensors = sensors_config
         self.actuators = actuators_config
 
+        # Sensor settings are fixed, so unpack them once and keep the noise
+        # levels in an array to draw every sensor's noise in one call per step
+        self._sensor_items = [
+            (config['obj'], config['state_key'], config['topic'])
+            for config in self.sensors.values()
+        ]
+        self._noise_stds = np.array([config.get('noise_std', 0.0) for config in self.sensors.values()])
+
         print(f"PhysicalIOAgent '{self.agent_id}' created.")
         self._subscribe_to_actions()
 
@@ -59,20 +68,18 @@ class PhysicalIOAgent(Agent):
         """
         for name, config in self.actuators.items():
             topic = config['topic']
-            # Use a lambda with default argument to capture the correct config
-            # for each callback.
-            callback = lambda message, cfg=config: self._handle_action(message, cfg)
+            # Bind the actuator's settings to the shared handler once, so each
+            # message needs no config lookups.
+            callback = partial(self._handle_action, obj=config['obj'],
+                               target_attr=config['target_attr'], control_key=config['control_key'])
             self.bus.subscribe(topic, callback)
             print(f"  - Subscribed to actuator topic '{topic}' for '{name}'.")
 
-    def _handle_action(self, message: Message, config: Dict[str, Any]):
+    def _handle_action(self, message: Message, obj: PhysicalObjectInterface,
+                       target_attr: str, control_key: str):
         """
         Generic callback to handle an incoming action message.
         """
-        obj: PhysicalObjectInterface = config['obj']
-        target_attr: str = config['target_attr']
-        control_key: str = config['control_key']
-
         control_signal = message.get(control_key)
         if control_signal is not None:
             # Set the target attribute on the physical object.
@@ -86,19 +93,16 @@ class PhysicalIOAgent(Agent):
         This is called at each simulation step.
         """
         # print(f"[{self.agent_id}] Running sensing cycle at time {current_time}.")
-        for name, config in self.sensors.items():
-            obj: PhysicalObjectInterface = config['obj']
-            state_key: str = config['state_key']
-            topic: str = config['topic']
-            noise_std: float = config.get('noise_std', 0.0)
+        # Gaussian noise for all sensors at once, to simulate real sensors
+        noises = (np.random.standard_normal(len(self._noise_stds)) * self._noise_stds).tolist()
 
+        for (obj, state_key, topic), noise in zip(self._sensor_items, noises):
             # Read the true state from the physical object
             true_value = obj.get_state().get(state_key)
             if true_value is None:
                 continue
 
-            # Add Gaussian noise to simulate a real sensor
-            noisy_value = true_value + np.random.normal(0, noise_std)
+            noisy_value = true_value + noise
 
             # Publish the noisy sensor reading
             message = {state_key: noisy_value, 'timestamp': current_time}
@@ -1,6 +1,8 @@
 import time
 from collections import deque
 
+import numpy as np
+
 from ...core.interfaces import Agent
 from ...central_coordination.collaboration.message_bus import MessageBus
 
@@ -10,13 +12,20 @@ class ChannelPerceptionAgent(Agent):
     2. 渠道感知智能体 (分布式孪生)
     将渠道本体仿真模型转化为具备自我认知、诊断、辨识和预测能力的孪生体。
     """
+    # 每处理这么多个样本后按窗口内容重新计算一次滑动和，消除累积的舍入误差
+    WINDOW_RESYNC_INTERVAL = 1000
+    # 输入/输出历史环形缓冲区的长度
+    HISTORY_LENGTH = 20
+
     def __init__(self, agent_id: str, broker: MessageBus, channel_id: str):
         super().__init__(agent_id)
         self.broker = broker
         self.channel_id = channel_id
 
-        # 数据缓存和清洗
-        self.raw_data_buffer = deque(maxlen=10)
+        # 数据缓存和清洗：最近10个下游水位及其滑动和，每个样本O(1)更新平均值
+        self._window = deque(maxlen=10)
+        self._window_sum = 0.0
+        self._samples_since_resync = 0
         self.cleaned_downstream_level = None
 
         # 孪生模型与在线辨识 (ID 模型: y = K * u(t-T))
@@ -25,8 +34,12 @@ class ChannelPerceptionAgent(Agent):
             'time_delay': 2, # (steps) - 初始时滞估计
             'manning_coefficient': 0.03 # 初始曼宁系数估计
         }
-        self.input_history = deque(maxlen=20) # for time delay
-        self.output_history = deque(maxlen=20)
+        # 输入（闸门开度，用于时滞）和输出（清洗后水位）历史：定长数组加写入计数，
+        # 第k个最近的值位于 (count - k) % HISTORY_LENGTH
+        self._in = np.zeros(self.HISTORY_LENGTH)
+        self._out = np.zeros(self.HISTORY_LENGTH)
+        self._idx_in = 0
+        self._idx_out = 0
 
         # 预测与诊断
         self.prediction = None
@@ -34,33 +47,58 @@ class ChannelPerceptionAgent(Agent):
 
         # 订阅原始传感器数据
         self.broker.subscribe("raw_sensor_data", self._handle_raw_data)
-        self.broker.subscribe("gate_executor_status", lambda msg: self.input_history.append(msg['actual_opening'])) # Simplified input
+        self.broker.subscribe("gate_executor_status", self._handle_gate_status) # Simplified input
+
+    def _handle_gate_status(self, message):
+        """记录闸门实际开度作为模型输入"""
+        self._in[self._idx_in % self.HISTORY_LENGTH] = message['actual_opening']
+        self._idx_in += 1
+
+    def _input_at(self, offset: int) -> float:
+        """按负偏移读取输入历史，-1 为最新值"""
+        return float(self._in[(self._idx_in + offset) % self.HISTORY_LENGTH])
+
+    def _output_at(self, offset: int) -> float:
+        """按负偏移读取输出历史，-1 为最新值"""
+        return float(self._out[(self._idx_out + offset) % self.HISTORY_LENGTH])
 
     def _handle_raw_data(self, message):
         """处理并清洗原始传感器数据"""
-        self.raw_data_buffer.append(message)
-        # 数据清洗 (简单滑动平均)
-        if len(self.raw_data_buffer) > 0:
-            avg_downstream_level = sum(d['downstream_level'] for d in self.raw_data_buffer) / len(self.raw_data_buffer)
-            self.cleaned_downstream_level = avg_downstream_level
-            self.output_history.append(self.cleaned_downstream_level)
+        sample = message['downstream_level']
+        window = self._window
+        # 数据清洗 (简单滑动平均)：窗口已满时先减去即将被挤出的最旧样本
+        if len(window) == window.maxlen:
+            self._window_sum -= window[0]
+        window.append(sample)
+        self._window_sum += sample
+
+        self._samples_since_resync += 1
+        if self._samples_since_resync >= self.WINDOW_RESYNC_INTERVAL:
+            self._window_sum = sum(window)
+            self._samples_since_resync = 0
+
+        self.cleaned_downstream_level = self._window_sum / len(window)
+        self._out[self._idx_out % self.HISTORY_LENGTH] = self.cleaned_downstream_level
+        self._idx_out += 1
 
 
     def run_step(self, time_step: int):
-        if self.cleaned_downstream_level is None or len(self.input_history) < 5 or len(self.output_history) < 5:
+        num_inputs = min(self._idx_in, self.HISTORY_LENGTH)
+        num_outputs = min(self._idx_out, self.HISTORY_LENGTH)
+        if self.cleaned_downstream_level is None or num_inputs < 5 or num_outputs < 5:
             # 等待足够的数据
             return
 
         # --- 1. 分布式孪生构建与在线辨识 ---
         # 简化的在线系统辨识 (估算增益)
         # 比较 5 步前的输入和现在的输出变化
-        if len(self.input_history) > self.twin_model['time_delay'] and len(self.output_history) > 1:
+        if num_inputs > self.twin_model['time_delay'] and num_outputs > 1:
             # 假设时滞为 T 步
             T = self.twin_model['time_delay']
-            if len(self.input_history) > T and len(self.output_history) > T:
+            if num_inputs > T and num_outputs > T:
                 # 这是一个非常简化的增益辨识
-                delta_output = self.output_history[-1] - self.output_history[-1-T]
-                delta_input = self.input_history[-1-T] - self.input_history[-2-T] if len(self.input_history) > T+1 else 0
+                delta_output = self._output_at(-1) - self._output_at(-1-T)
+                delta_input = self._input_at(-1-T) - self._input_at(-2-T) if num_inputs > T+1 else 0
                 if abs(delta_input) > 0.01: # 仅在输入有显著变化时更新
                     estimated_gain = delta_output / delta_input
                     # 平滑更新
@@ -69,14 +107,14 @@ class ChannelPerceptionAgent(Agent):
         # --- 2. 预测, 诊断与信息发布 ---
         # a. 实时预测
         # 基于ID模型预测下一时刻的水位
-        if len(self.input_history) > self.twin_model['time_delay']:
-            delayed_input = self.input_history[-self.twin_model['time_delay']]
+        if num_inputs > self.twin_model['time_delay']:
+            delayed_input = self._input_at(-self.twin_model['time_delay'])
             # 这是一个简化的积分模型预测: current_level + gain * input
             self.prediction = self.cleaned_downstream_level + self.twin_model['gain'] * delayed_input
 
         # b. 异常诊断
         if self.prediction is not None:
-            deviation = self.cleaned_downstream_level - self.output_history[-2] if len(self.output_history) > 1 else 0
+            deviation = self.cleaned_downstream_level - self._output_at(-2) if num_outputs > 1 else 0
             prediction_based_deviation = self.prediction - self.cleaned_downstream_level
 
             # 这里我们简化诊断逻辑：如果实际水位远超模型预测，可能存在异常入流
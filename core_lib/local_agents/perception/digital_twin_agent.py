@@ -3,7 +3,7 @@ Digital Twin Agent for state synchronization, enhancement, and publication.
 """
 from core_lib.core.interfaces import Agent, Simulatable, State
 from core_lib.central_coordination.collaboration.message_bus import MessageBus, Message
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List, Tuple
 
 class DigitalTwinAgent(Agent):
     """
@@ -12,14 +12,24 @@ class DigitalTwinAgent(Agent):
     Its primary responsibility is to maintain an internal simulation model and
     publish its state to the message bus. It can also perform "cognitive"
     enhancements on the raw state, such as smoothing noisy data.
+
+    The specialised perception agents (gate, pump, reservoir, ...) only set
+    `role`, the label used when the agent reports its creation; they share
+    this class's behaviour. `for_object` creates a twin labelled after the
+    model's type without needing a dedicated subclass.
     """
 
+    role: Optional[str] = None
+
     def __init__(self,
                  agent_id: str,
                  simulated_object: Simulatable,
                  message_bus: MessageBus,
                  state_topic: str,
-                 smoothing_config: Optional[Dict[str, float]] = None):
+                 smoothing_config: Optional[Dict[str, float]] = None,
+                 role: Optional[str] = None,
+                 publish_batch_size: int = 1,
+                 publish_on_change: bool = False):
         """
         Initializes the DigitalTwinAgent.
 
@@ -31,44 +41,127 @@ class DigitalTwinAgent(Agent):
             smoothing_config: Optional config for applying EMA smoothing.
                 Example: {'water_level': 0.3, 'outflow': 0.5}
                 The value is the alpha (smoothing factor).
+            role: Optional label overriding the class's `role`.
+            publish_batch_size: Number of states to queue before delivering
+                them together with `MessageBus.publish_batch`. The default of 1
+                publishes every state immediately. Larger values delay delivery
+                by up to `publish_batch_size - 1` steps, so only use them when
+                no controller closes its loop on `state_topic` (e.g. for
+                logging or aggregation); call `flush` at the end of a run.
+            publish_on_change: If True, a state equal to the last published
+                one is not published again. Off by default, because consumers
+                that act on every observation (e.g. a PID integrating its
+                error) behave differently when repeated states are dropped.
         """
         super().__init__(agent_id)
+        if role is not None:
+            self.role = role
         self.model = simulated_object
         self.bus = message_bus
         self.state_topic = state_topic
         self.smoothing_config = smoothing_config
-        self.smoothed_states: Dict[str, float] = {}
+        # Bound methods called on every tick, resolved once
+        self._get_state = simulated_object.get_state
+        self._publish = message_bus.publish
+
+        # The smoothing configuration is fixed, so freeze it into one tuple of
+        # (slot, key, alpha, 1 - alpha) and keep the last smoothed values in a
+        # list indexed by slot (None until a key's first sample).
+        self._smoothing_items = tuple(
+            (slot, key, alpha, 1 - alpha)
+            for slot, (key, alpha) in enumerate((smoothing_config or {}).items())
+        )
+        self._last_smoothed: List[Optional[float]] = [None] * len(self._smoothing_items)
+
+        self.publish_batch_size = publish_batch_size
+        self._pending: List[Tuple[str, Message]] = []
+        self.publish_on_change = publish_on_change
+        self._last_published: Optional[Message] = None
+
+        self._log_creation()
 
-        model_id = self.model.name
-        print(f"DigitalTwinAgent '{self.agent_id}' created for model '{model_id}'. Will publish state to '{self.state_topic}'.")
+    @classmethod
+    def for_object(cls, simulated_object: Simulatable, agent_id: str, message_bus: MessageBus,
+                   state_topic: str, smoothing_config: Optional[Dict[str, float]] = None) -> 'DigitalTwinAgent':
+        """
+        Creates a twin for `simulated_object`, labelled with the object's type name.
+
+        Args:
+            simulated_object: The simulation model the twin mirrors.
+            agent_id: The unique ID of the new agent.
+            message_bus: The system's message bus for communication.
+            state_topic: The topic on which to publish the object's state.
+            smoothing_config: Optional config for applying EMA smoothing.
+        """
+        return cls(agent_id=agent_id, simulated_object=simulated_object, message_bus=message_bus,
+                   state_topic=state_topic, smoothing_config=smoothing_config,
+                   role=type(simulated_object).__name__)
+
+    def _log_creation(self):
+        """Reports the new twin once, naming its role if it has one."""
+        print(f"{type(self).__name__} '{self.agent_id}' created for {self.role or 'model'} '{self.model.name}'. "
+              f"Will publish state to '{self.state_topic}'.")
         if self.smoothing_config:
             print(f"  - Smoothing enabled for keys: {list(self.smoothing_config.keys())}")
 
+    @property
+    def smoothed_states(self) -> Dict[str, float]:
+        """The latest smoothed value of every key that has been seen so far."""
+        return {key: last for (_, key, _, _), last in zip(self._smoothing_items, self._last_smoothed)
+                if last is not None}
+
     def _apply_smoothing(self, state: State) -> State:
         """Applies Exponential Moving Average (EMA) smoothing to configured state variables."""
-        if not self.smoothing_config:
+        if not self._smoothing_items:
             return state
 
-        smoothed_state = state.copy()
-        for key, alpha in self.smoothing_config.items():
-            if key in smoothed_state:
-                raw_value = smoothed_state[key]
-                last_smoothed = self.smoothed_states.get(key, raw_value) # Initialize with first raw value
-                new_smoothed = alpha * raw_value + (1 - alpha) * last_smoothed
+        # The input state is never modified. It is copied on the first smoothed
+        # value only, so a state without any configured key is passed through.
+        smoothed_state = None
+        get = state.get
+        last_smoothed = self._last_smoothed
+        for slot, key, alpha, one_minus_alpha in self._smoothing_items:
+            raw_value = get(key)
+            if raw_value is not None:
+                last = last_smoothed[slot]
+                if last is None:
+                    last = raw_value # Initialize with first raw value
+                new_smoothed = alpha * raw_value + one_minus_alpha * last
+                if smoothed_state is None:
+                    smoothed_state = state.copy()
                 smoothed_state[key] = new_smoothed
-                self.smoothed_states[key] = new_smoothed
-        return smoothed_state
+                last_smoothed[slot] = new_smoothed
+        return state if smoothed_state is None else smoothed_state
 
     def publish_state(self):
         """
         Fetches the current state, applies enhancements (e.g., smoothing),
         and publishes it.
         """
-        raw_state = self.model.get_state()
+        raw_state = self._get_state()
         enhanced_state = self._apply_smoothing(raw_state)
 
         message: Message = enhanced_state
-        self.bus.publish(self.state_topic, message)
+        if self.publish_on_change:
+            if message == self._last_published:
+                return
+            # Keep a copy: subscribers are free to modify the message they receive
+            self._last_published = message.copy()
+
+        if self.publish_batch_size <= 1:
+            self._publish(self.state_topic, message)
+            return
+
+        pending = self._pending
+        pending.append((self.state_topic, message))
+        if len(pending) >= self.publish_batch_size:
+            self.flush()
+
+    def flush(self):
+        """Delivers any states queued by a batched `publish_state`."""
+        if self._pending:
+            pending, self._pending = self._pending, []
+            self.bus.publish_batch(pending)
 
     def run(self, current_time: float):
         """
@@ -11,10 +11,5 @@ class GatePerceptionAgent(DigitalTwinAgent):
     potentially enhancing it, and publishing it for other agents. It is a
     specialization of the DigitalTwinAgent.
     """
-    def __init__(self, **kwargs):
-        """
-        Initializes the GatePerceptionAgent.
-        Inherits the base functionality from DigitalTwinAgent.
-        """
-        super().__init__(**kwargs)
-        print(f"GatePerceptionAgent '{self.agent_id}' initialized.")
+
+    role = 'Gate'
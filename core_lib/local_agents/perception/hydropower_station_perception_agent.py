@@ -14,6 +14,8 @@ class HydropowerStationPerceptionAgent(DigitalTwinAgent):
     publishing it to a designated topic on the message bus.
     """
 
+    role = 'HydropowerStation'
+
     def __init__(self,
                  agent_id: str,
                  hydropower_station_model: HydropowerStation,
@@ -32,5 +34,3 @@ class HydropowerStationPerceptionAgent(DigitalTwinAgent):
                          simulated_object=hydropower_station_model,
                          message_bus=message_bus,
                          state_topic=state_topic)
-
-        print(f"HydropowerStationPerceptionAgent '{self.agent_id}' created for HydropowerStation '{hydropower_station_model.name}'.")
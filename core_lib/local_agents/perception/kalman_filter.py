@@ -4,6 +4,86 @@
 """
 import numpy as np
 
+try:
+    from numba import njit
+except ImportError:  # numba为可选依赖，缺失时回退到numpy实现
+    njit = None
+
+
+if njit is not None:
+    @njit(cache=True)
+    def _predict_kernel(F, P, Q, x, FP):
+        """
+        预测步骤的原生编译内核：原地更新 P = F P F^T + Q，返回新的状态估计 F x。
+
+        参数:
+            F (np.ndarray): 状态转移矩阵，形状为 (n, n)。
+            P (np.ndarray): 估计协方差，形状为 (n, n)，原地更新。
+            Q (np.ndarray): 过程噪声协方差，形状为 (n, n)。
+            x (np.ndarray): 状态估计，形状为 (n,)。
+            FP (np.ndarray): 存放 F P 的缓冲区，形状为 (n, n)。
+        """
+        n = x.shape[0]
+        x_new = np.empty_like(x)
+        for i in range(n):
+            acc = 0.0
+            for k in range(n):
+                acc += F[i, k] * x[k]
+            x_new[i] = acc
+        for i in range(n):
+            for j in range(n):
+                acc = 0.0
+                for k in range(n):
+                    acc += F[i, k] * P[k, j]
+                FP[i, j] = acc
+        for i in range(n):
+            for j in range(n):
+                acc = Q[i, j]
+                for k in range(n):
+                    acc += FP[i, k] * F[j, k]
+                P[i, j] = acc
+        return x_new
+
+    @njit(cache=True)
+    def _update_scalar_kernel(P, x, h, r, z):
+        """
+        单维测量更新步骤的原生编译内核：原地更新P，返回新的状态估计。
+
+        参数:
+            P (np.ndarray): 估计协方差，形状为 (n, n)，原地更新。
+            x (np.ndarray): 状态估计，形状为 (n,)。
+            h (np.ndarray): 测量矩阵H的唯一一行，形状为 (n,)。
+            r (float): 测量噪声方差。
+            z (float): 测量值。
+        """
+        n = x.shape[0]
+        HP = np.empty(n)
+        PHt = np.empty(n)
+        for j in range(n):
+            hp = 0.0
+            pht = 0.0
+            for i in range(n):
+                hp += h[i] * P[i, j]
+                pht += P[j, i] * h[i]
+            HP[j] = hp
+            PHt[j] = pht
+        s = r
+        hx = 0.0
+        for j in range(n):
+            s += HP[j] * h[j]
+            hx += h[j] * x[j]
+        y = z - hx
+        x_new = np.empty_like(x)
+        for i in range(n):
+            k = PHt[i] / s
+            x_new[i] = x[i] + k * y
+            for j in range(n):
+                P[i, j] -= k * HP[j]
+        return x_new
+else:
+    _predict_kernel = None
+    _update_scalar_kernel = None
+
 class KalmanFilter:
     """
     一个简单的线性卡尔曼滤波器实现。
@@ -17,42 +97,99 @@ class KalmanFilter:
     v_k ~ N(0, R) (测量噪声)
     """
 
-    def __init__(self, F, B, H, Q, R, x0, P0):
+    # 使用numba内核的最大状态维度
+    KERNEL_MAX_STATES = 8
+
+    def __init__(self, F, B, H, Q, R, x0, P0, dtype=np.float64):
         """
         初始化卡尔曼滤波器。
 
         参数:
             F (np.ndarray): 状态转移矩阵。
-            B (np.ndarray): 控制输入矩阵。
+            B (np.ndarray, optional): 控制输入矩阵。没有控制输入时可为None。
             H (np.ndarray): 测量矩阵。
             Q (np.ndarray): 过程噪声协方差矩阵。
             R (np.ndarray): 测量噪声协方差矩阵。
             x0 (np.ndarray): 初始状态估计。
             P0 (np.ndarray): 初始估计协方差矩阵。
+            dtype (np.dtype, optional): 滤波计算使用的浮点类型，所有矩阵在构造时转换为该类型。
+                默认为np.float64。水位、流量等测量精度不高的场景可用np.float32以单精度运行，
+                此时协方差的舍入误差约为1e-7量级。
         """
-        self.F = F  # 状态转移矩阵
-        self.B = B  # 控制输入矩阵
-        self.H = H  # 测量矩阵
-        self.Q = Q  # 过程噪声协方差
-        self.R = R  # 测量噪声协方差
+        self.dtype = np.dtype(dtype)
+        self.F = np.asarray(F, dtype=self.dtype)  # 状态转移矩阵
+        self.B = None if B is None else np.asarray(B, dtype=self.dtype)  # 控制输入矩阵
+        self.H = np.asarray(H, dtype=self.dtype)  # 测量矩阵
+        self.Q = np.asarray(Q, dtype=self.dtype)  # 过程噪声协方差
+        self.R = np.asarray(R, dtype=self.dtype)  # 测量噪声协方差
+
+        self.x = np.array(x0, dtype=self.dtype)  # 初始状态估计
+        # 初始估计协方差。P 会被原地更新，因此复制一份，不修改调用者传入的P0
+        self.P = np.array(P0, dtype=self.dtype)
+
+        self.n = self.F.shape[1]  # 状态变量的数量
+        self.I = np.eye(self.n, dtype=self.dtype) # 单位矩阵
+
+        # F 与 H 的转置在每一步都会用到，预先保存为连续数组，避免每步重新取转置。
+        # 若之后替换了 F 或 H，需要同步更新这两个缓存
+        self._Ft = np.ascontiguousarray(self.F.T)
+        self._Ht = np.ascontiguousarray(self.H.T)
 
-        self.x = x0  # 初始状态估计
-        self.P = P0  # 初始估计协方差
+        # 预分配的中间结果缓冲区，predict/update 通过 out= 原地写入，避免每步分配临时矩阵
+        m = self.H.shape[0]  # 测量变量的数量
+        self._FP = np.empty((self.n, self.n), dtype=self.dtype)   # F P
+        self._HP = np.empty((m, self.n), dtype=self.dtype)        # H P
+        self._S = np.empty((m, m), dtype=self.dtype)              # 新息协方差 S
+        self._KHP = np.empty((self.n, self.n), dtype=self.dtype)  # K (H P)
 
-        self.n = F.shape[1]  # 状态变量的数量
-        self.I = np.eye(self.n) # 单位矩阵
+        # 单维测量（m=1）时 S 为标量，update 走专用路径，不构造1x1矩阵也不求解线性方程组
+        self._scalar_measurement = m == 1
+        if self._scalar_measurement:
+            self._r = float(np.reshape(R, ()))
 
-    def predict(self, u=0):
+        # F 为单位阵（状态随机游走）时，预测只需累加过程噪声 P + Q
+        self._F_is_identity = np.array_equal(self.F, np.eye(self.n))
+
+        # 若numba可用，小维度滤波器的预测与单维测量更新由编译后的内核完成，消除逐个numpy
+        # 调用的开销；维度较大时内核中的朴素三重循环不如BLAS，仍走numpy路径。
+        # 内核要求连续数组，因此另存一份连续的 F、Q 和 H 的唯一一行
+        self._kernels = _predict_kernel is not None and self.n <= self.KERNEL_MAX_STATES
+        if self._kernels:
+            self._Fk = np.ascontiguousarray(self.F)
+            self._Qk = np.ascontiguousarray(self.Q)
+            if self._scalar_measurement:
+                self._h = np.ascontiguousarray(self.H).reshape(self.n)
+
+    def predict(self, u=None):
         """
         执行预测步骤。
 
         参数:
-            u (np.ndarray, optional): 控制向量。默认为0。
+            u (np.ndarray, optional): 控制向量。默认为None，即无控制输入（自由演化）。
         """
-        # 预测下一状态
-        self.x = np.dot(self.F, self.x) + np.dot(self.B, u)
-        # 预测误差协方差
-        self.P = np.dot(np.dot(self.F, self.P), self.F.T) + self.Q
+        if self._F_is_identity:
+            # 状态不变，只累加过程噪声
+            if u is not None and self.B is not None:
+                self.x = self.x + np.dot(self.B, np.asarray(u, dtype=self.dtype))
+            self.P += self.Q
+            return self.x
+
+        if self._kernels:
+            x = self.x
+            self.x = _predict_kernel(self._Fk, self.P, self._Qk,
+                                     np.asarray(x, dtype=self.dtype).reshape(self.n), self._FP).reshape(np.shape(x))
+            if u is not None and self.B is not None:
+                self.x = self.x + np.dot(self.B, np.asarray(u, dtype=self.dtype))
+            return self.x
+
+        # 预测下一状态；无控制输入时跳过 B u 项
+        self.x = np.dot(self.F, self.x)
+        if u is not None and self.B is not None:
+            self.x = self.x + np.dot(self.B, np.asarray(u, dtype=self.dtype))
+        # 预测误差协方差 P = F P F^T + Q，结果原地写回P
+        np.dot(self.F, self.P, out=self._FP)
+        np.dot(self._FP, self._Ft, out=self.P)
+        self.P += self.Q
 
         return self.x
 
@@ -63,15 +200,53 @@ class KalmanFilter:
         参数:
             z (np.ndarray): 测量向量。
         """
-        # 计算卡尔曼增益
-        S = np.dot(self.H, np.dot(self.P, self.H.T)) + self.R
-        K = np.dot(np.dot(self.P, self.H.T), np.linalg.inv(S))
+        if self._scalar_measurement:
+            return self._update_scalar(z)
+        z = np.asarray(z, dtype=self.dtype)
+
+        # H P 在新息协方差和协方差更新中都会用到，只计算一次。P H^T 单独计算而不取 (H P)^T：
+        # 舍入误差会让P略微不对称，若假定对称，这种不对称会在迭代中不断放大
+        HP = np.dot(self.H, self.P, out=self._HP)
+        PHt = np.dot(self.P, self._Ht)
+
+        # 计算卡尔曼增益 K = P H^T S^-1。不显式求逆，而是求解 S^T K^T = (P H^T)^T；
+        S = np.dot(HP, self._Ht, out=self._S)
+        S += self.R
+        K = np.linalg.solve(S.T, PHt.T).T
 
         # 用测量值z更新估计
         y = z - np.dot(self.H, self.x)  # 测量残差
         self.x = self.x + np.dot(K, y)
 
-        # 更新误差协方差
-        self.P = np.dot(self.I - np.dot(K, self.H), self.P)
+        # 更新误差协方差：P - K (H P) 与 (I - K H) P 相等，但不需要构造 n x n 的 K H
+        # 再与P相乘
+        self.P -= np.dot(K, HP, out=self._KHP)
+
+        return self.x
+
+    def _update_scalar(self, z):
+        """
+        单维测量的更新步骤：S 为标量，增益是一次除法，协方差更新为秩1外积。
+        """
+        # 测量值可为标量、列表或形状为 (1,)、(1, 1) 的数组，统一转换为标量，
+        # 使残差的形状只取决于 H x，从而与状态x的形状一致
+        z = np.asarray(z, dtype=self.dtype).item()
+        if self._kernels:
+            x = self.x
+            self.x = _update_scalar_kernel(self.P, np.asarray(x, dtype=self.dtype).reshape(self.n), self._h,
+                                           self._r, z).reshape(np.shape(x))
+            return self.x
+
+        HP = np.dot(self.H, self.P, out=self._HP)
+        PHt = np.dot(self.P, self._Ht)
+        s = np.dot(HP, self._Ht).item() + self._r  # 新息方差（Python标量）
+        K = PHt / s
+
+        # 用测量值z更新估计
+        y = z - np.dot(self.H, self.x)  # 测量残差
+        self.x = self.x + np.dot(K, y)  # K 为 (n, 1)，与 y 相乘会广播成 (n, n)，须用 dot
+
+        # 更新误差协方差 P - K (H P)：列向量与行向量的外积
+        self.P -= np.dot(K, HP, out=self._KHP)
 
         return self.x
@@ -0,0 +1,148 @@
+#-*- coding: utf-8 -*-
+"""
+本模块提供了批量卡尔曼滤波器的实现：把多个同维度的小型滤波器堆叠在一起，
+用一次批量矩阵运算完成全部滤波器的预测与更新。
+"""
+import numpy as np
+
+
+def predict_batch(F, P, Ft, Q, x, B=None, u=None):
+    """
+    对一批滤波器同时执行预测步骤。
+
+    参数:
+        F (np.ndarray): 状态转移矩阵，形状 [N, n, n]。
+        P (np.ndarray): 估计协方差，形状 [N, n, n]。
+        Ft (np.ndarray): F 的转置，形状 [N, n, n]。
+        Q (np.ndarray): 过程噪声协方差，形状 [N, n, n]。
+        x (np.ndarray): 状态估计，形状 [N, n]。
+        B (np.ndarray, optional): 控制输入矩阵，形状 [N, n, p]。
+        u (np.ndarray, optional): 控制向量，形状 [N, p]。为None时跳过 B u 项。
+
+    返回:
+        (x, P): 预测后的状态估计与协方差。
+    """
+    x = np.matmul(F, x[..., None])[..., 0]
+    if u is not None and B is not None:
+        x = x + np.matmul(B, u[..., None])[..., 0]
+    P = np.matmul(np.matmul(F, P), Ft) + Q
+    return x, P
+
+
+def update_batch(H, Ht, P, R, x, z):
+    """
+    对一批滤波器同时执行更新步骤（校正）。
+
+    参数:
+        H (np.ndarray): 测量矩阵，形状 [N, m, n]。
+        Ht (np.ndarray): H 的转置，形状 [N, n, m]。
+        P (np.ndarray): 估计协方差，形状 [N, n, n]。
+        R (np.ndarray): 测量噪声协方差，形状 [N, m, m]。
+        x (np.ndarray): 状态估计，形状 [N, n]。
+        z (np.ndarray): 测量向量，形状 [N, m]。
+
+    返回:
+        (x, P): 更新后的状态估计与协方差。
+    """
+    # 与 KalmanFilter.update 相同：H P 只计算一次，P H^T 单独计算，协方差按 P - K (H P) 更新
+    HP = np.matmul(H, P)
+    PHt = np.matmul(P, Ht)
+    S = np.matmul(HP, Ht) + R
+    # 求解 S^T K^T = (P H^T)^T；np.linalg.solve 沿第一维广播，一次求解全部滤波器
+    K = np.swapaxes(np.linalg.solve(np.swapaxes(S, -1, -2), np.swapaxes(PHt, -1, -2)), -1, -2)
+
+    y = z - np.matmul(H, x[..., None])[..., 0]  # 测量残差
+    x = x + np.matmul(K, y[..., None])[..., 0]
+    P = P - np.matmul(K, HP)
+    return x, P
+
+
+class KalmanFilterBatch:
+    """
+    一组同维度线性卡尔曼滤波器的批量实现。
+
+    每个滤波器占用一个槽位（slot），其矩阵按槽位堆叠为 F[N,n,n]、P[N,n,n]、
+    x[N,n]、H[N,m,n] 等数组。对N个小型滤波器逐个调用 KalmanFilter 时，耗时主要
+    花在Python和numpy的调用开销上；批量实现每一步只需固定次数的numpy调用，
+    与N无关。
+
+    所有槽位必须具有相同的状态维度n、测量维度m和控制维度p。
+    """
+
+    def __init__(self, n, m, p=0):
+        """
+        初始化一个空的批量滤波器。
+
+        参数:
+            n (int): 状态变量的数量。
+            m (int): 测量变量的数量。
+            p (int, optional): 控制变量的数量。默认为0，即无控制输入。
+        """
+        self.n = n
+        self.m = m
+        self.p = p
+
+        self.F = np.empty((0, n, n))
+        self.B = np.empty((0, n, p))
+        self.H = np.empty((0, m, n))
+        self.Q = np.empty((0, n, n))
+        self.R = np.empty((0, m, m))
+        self.x = np.empty((0, n))
+        self.P = np.empty((0, n, n))
+
+        # F 与 H 的转置在每一步都会用到，随槽位一起维护
+        self._Ft = np.empty((0, n, n))
+        self._Ht = np.empty((0, n, m))
+
+    def __len__(self):
+        return self.x.shape[0]
+
+    def add_slot(self, F, H, Q, R, x0, P0, B=None):
+        """
+        添加一个滤波器槽位。
+
+        参数与 KalmanFilter 相同；x0 可以是形状 [n] 或 [n, 1] 的数组。
+        B 为None时该槽位没有控制输入。
+
+        返回:
+            int: 新槽位的索引，用于读取 x[slot]、P[slot] 以及组织批量测量。
+        """
+        n, m, p = self.n, self.m, self.p
+        F = np.asarray(F, dtype=float).reshape(n, n)
+        H = np.asarray(H, dtype=float).reshape(m, n)
+        B = np.zeros((n, p)) if B is None else np.asarray(B, dtype=float).reshape(n, p)
+
+        # 槽位只在建模阶段添加，逐个拼接的开销可以忽略
+        self.F = np.concatenate((self.F, F[None]))
+        self.B = np.concatenate((self.B, B[None]))
+        self.H = np.concatenate((self.H, H[None]))
+        self.Q = np.concatenate((self.Q, np.asarray(Q, dtype=float).reshape(1, n, n)))
+        self.R = np.concatenate((self.R, np.asarray(R, dtype=float).reshape(1, m, m)))
+        self.x = np.concatenate((self.x, np.asarray(x0, dtype=float).reshape(1, n)))
+        self.P = np.concatenate((self.P, np.asarray(P0, dtype=float).reshape(1, n, n)))
+        self._Ft = np.concatenate((self._Ft, F.T[None]))
+        self._Ht = np.concatenate((self._Ht, H.T[None]))
+
+        return len(self) - 1
+
+    def predict(self, u=None):
+        """
+        对所有槽位执行预测步骤。
+
+        参数:
+            u (np.ndarray, optional): 控制向量，形状 [N, p]。默认为None，即无控制输入。
+        """
+        self.x, self.P = predict_batch(self.F, self.P, self._Ft, self.Q, self.x,
+                                       self.B if self.p else None, u)
+        return self.x
+
+    def update(self, z):
+        """
+        对所有槽位执行更新步骤（校正）。
+
+        参数:
+            z (np.ndarray): 测量向量，形状 [N, m]，第i行对应第i个槽位。
+        """
+        self.x, self.P = update_batch(self.H, self._Ht, self.P, self.R, self.x,
+                                      np.asarray(z, dtype=float).reshape(-1, self.m))
+        return self.x
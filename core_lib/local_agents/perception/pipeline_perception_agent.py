@@ -16,6 +16,8 @@ class PipelinePerceptionAgent(DigitalTwinAgent):
     identification (e.g., friction factor).
     """
 
+    role = 'Pipe'
+
     def __init__(self,
                  agent_id: str,
                  pipe_model: Pipe,
@@ -34,5 +36,3 @@ class PipelinePerceptionAgent(DigitalTwinAgent):
                          simulated_object=pipe_model,
                          message_bus=message_bus,
                          state_topic=state_topic)
-
-        print(f"PipelinePerceptionAgent '{self.agent_id}' created for Pipe '{pipe_model.name}'.")
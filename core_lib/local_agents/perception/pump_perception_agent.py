@@ -11,10 +11,5 @@ class PumpPerceptionAgent(DigitalTwinAgent):
     potentially enhancing it, and publishing it for other agents. It is a
     specialization of the DigitalTwinAgent.
     """
-    def __init__(self, **kwargs):
-        """
-        Initializes the PumpPerceptionAgent.
-        Inherits the base functionality from DigitalTwinAgent.
-        """
-        super().__init__(**kwargs)
-        print(f"PumpPerceptionAgent '{self.agent_id}' initialized.")
+
+    role = 'Pump'
@@ -14,6 +14,8 @@ class PumpStationPerceptionAgent(DigitalTwinAgent):
     to a designated topic on the message bus.
     """
 
+    role = 'PumpStation'
+
     def __init__(self,
                  agent_id: str,
                  pump_station_model: PumpStation,
@@ -32,5 +34,3 @@ class PumpStationPerceptionAgent(DigitalTwinAgent):
                          simulated_object=pump_station_model,
                          message_bus=message_bus,
                          state_topic=state_topic)
-
-        print(f"PumpStationPerceptionAgent '{self.agent_id}' created for PumpStation '{pump_station_model.name}'.")
@@ -14,6 +14,8 @@ class ReservoirPerceptionAgent(DigitalTwinAgent):
     reservoir-specific logic (e.g., evaporation estimation).
     """
 
+    role = 'Reservoir'
+
     def __init__(self,
                  agent_id: str,
                  reservoir_model: Reservoir,
@@ -32,5 +34,3 @@ class ReservoirPerceptionAgent(DigitalTwinAgent):
                          simulated_object=reservoir_model,
                          message_bus=message_bus,
                          state_topic=state_topic)
-
-        print(f"ReservoirPerceptionAgent '{self.agent_id}' created for Reservoir '{reservoir_model.name}'.")
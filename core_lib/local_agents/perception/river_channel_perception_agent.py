@@ -12,10 +12,5 @@ class RiverChannelPerceptionAgent(DigitalTwinAgent):
     it for other agents to consume. It is a specialization of the DigitalTwinAgent,
     tailored for river channel objects.
     """
-    def __init__(self, **kwargs):
-        """
-        Initializes the RiverChannelPerceptionAgent.
-        Inherits the base functionality from DigitalTwinAgent.
-        """
-        super().__init__(**kwargs)
-        print(f"RiverChannelPerceptionAgent '{self.agent_id}' initialized.")
+
+    role = 'RiverChannel'
@@ -14,6 +14,8 @@ class ValveStationPerceptionAgent(DigitalTwinAgent):
     topic on the message bus.
     """
 
+    role = 'ValveStation'
+
     def __init__(self,
                  agent_id: str,
                  valve_station_model: ValveStation,
@@ -32,5 +34,3 @@ class ValveStationPerceptionAgent(DigitalTwinAgent):
                          simulated_object=valve_station_model,
                          message_bus=message_bus,
                          state_topic=state_topic)
-
-        print(f"ValveStationPerceptionAgent '{self.agent_id}' created for ValveStation '{valve_station_model.name}'.")
@@ -2,12 +2,11 @@
 An agent that uses an ARIMA model to forecast future values.
 """
 import warnings
-import pandas as pd
-from collections import deque
+import numpy as np
 from statsmodels.tsa.arima.model import ARIMA
 from core_lib.core.interfaces import Agent
 from core_lib.central_coordination.collaboration.message_bus import MessageBus, Message
-from typing import Deque, Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional
 
 # Suppress warnings from statsmodels, which can be verbose
 warnings.filterwarnings("ignore")
@@ -34,6 +33,11 @@ class ARIMAForecaster(Agent):
                 - forecast_steps: The number of future steps to forecast.
                 - refit_interval: The number of new observations to collect
                                   before refitting the model.
+                - full_refit_every: Re-estimate the model parameters on every
+                                  n-th refit only (default 5). In between, the
+                                  new observations are appended to the fitted
+                                  model with its parameters kept. 1 re-estimates
+                                  on every refit.
         """
         super().__init__(agent_id)
         self.bus = message_bus
@@ -46,20 +50,41 @@ class ARIMAForecaster(Agent):
         self.arima_order = tuple(config.get("arima_order", (5, 1, 0)))
         self.forecast_steps = config.get("forecast_steps", 10)
         self.refit_interval = config.get("refit_interval", 10)
+        self.full_refit_every = config.get("full_refit_every", 5)
+        # Heuristic for the minimum amount of data needed to fit the model
+        self._min_data_points = max(10, sum(self.arima_order) * 2)
 
-        # State
-        self.history: Deque[float] = deque(maxlen=self.history_size)
+        # State. The history is a ring buffer: `_idx` is the next slot to write
+        # and `_filled` the number of valid observations.
+        self._buf = np.empty(self.history_size)
+        self._idx = 0
+        self._filled = 0
         self.new_obs_since_fit = 0
         self.model_fit = None
+        self._appends_since_full_fit = 0
 
         self.bus.subscribe(self.obs_topic, self.handle_observation_message)
         print(f"ARIMAForecaster '{self.agent_id}' created and subscribed to '{self.obs_topic}'.")
 
+    @property
+    def history(self) -> np.ndarray:
+        """The retained observations, oldest first."""
+        if self._filled < self.history_size:
+            # Not wrapped yet: the valid part is a prefix of the buffer
+            return self._buf[:self._filled]
+        idx = self._idx
+        return np.concatenate((self._buf[idx:], self._buf[:idx]))
+
     def handle_observation_message(self, message: Message):
         """Callback to handle incoming observation messages."""
         value = message.get(self.obs_key)
         if isinstance(value, (int, float)):
-            self.history.append(float(value))
+            idx = self._idx
+            self._buf[idx] = value
+            idx += 1
+            self._idx = 0 if idx == self.history_size else idx
+            if self._filled < self.history_size:
+                self._filled += 1
             self.new_obs_since_fit += 1
 
     def _fit_and_forecast(self) -> Optional[List[float]]:
@@ -68,15 +93,31 @@ class ARIMAForecaster(Agent):
         Returns None if fitting or forecasting fails.
         """
         # Do not attempt to fit if there is not enough data
-        min_data_points = max(10, sum(self.arima_order) * 2) # Heuristic for minimum data
-        if len(self.history) < min_data_points:
+        if self._filled < self._min_data_points:
             return None
 
-        print(f"  [{self.agent_id}] Refitting ARIMA model with {len(self.history)} data points...")
-        series = pd.Series(list(self.history))
-        model = ARIMA(series, order=self.arima_order)
+        new_obs = self.new_obs_since_fit
+        if (self.model_fit is not None and self._appends_since_full_fit + 1 < self.full_refit_every
+                and 0 < new_obs <= self._filled):
+            # Extend the fitted model with the new observations, keeping its
+            # parameters, instead of solving the MLE again
+            try:
+                self.model_fit = self.model_fit.append(np.array(self.history[-new_obs:]), refit=False)
+                self._appends_since_full_fit += 1
+                self.new_obs_since_fit = 0
+                forecast = self.model_fit.forecast(steps=self.forecast_steps)
+                return forecast.tolist()
+            except Exception as e:
+                print(f"  [{self.agent_id}] WARNING: Appending to the ARIMA model failed, refitting: {e}")
+
+        print(f"  [{self.agent_id}] Refitting ARIMA model with {self._filled} data points...")
+        # A plain array rather than a pd.Series, so that later appends do not
+        # have to continue a pandas index. It is copied because `history` may
+        # be a view of the ring buffer, which keeps being overwritten.
+        model = ARIMA(np.array(self.history), order=self.arima_order)
         try:
             self.model_fit = model.fit()
+            self._appends_since_full_fit = 0
             self.new_obs_since_fit = 0
             print(f"  [{self.agent_id}] Model refit successful.")
 
@@ -92,18 +133,14 @@ class ARIMAForecaster(Agent):
         """
         Periodically fits the model and publishes a new forecast.
         """
-        should_fit = False
-        # Fit if we don't have a model but have enough data to start
-        if self.model_fit is None and self.new_obs_since_fit >= self.refit_interval:
-            should_fit = True
-        # Fit if we do have a model and the refit interval has been reached
-        elif self.model_fit is not None and self.new_obs_since_fit >= self.refit_interval:
-            should_fit = True
-
-        if should_fit:
-            forecast_values = self._fit_and_forecast()
-            if forecast_values is not None:
-                self.publish_forecast(current_time, forecast_values)
+        # (Re)fit once enough new observations have arrived and there is enough
+        # data for the model, whether or not a model has been fitted before
+        if self.new_obs_since_fit < self.refit_interval or self._filled < self._min_data_points:
+            return
+
+        forecast_values = self._fit_and_forecast()
+        if forecast_values is not None:
+            self.publish_forecast(current_time, forecast_values)
 
     def publish_forecast(self, current_time: float, forecast_values: List[float]):
         """Publishes the forecast to the message bus."""
@@ -14,7 +14,8 @@ class ForecastingAgent(Agent):
 
     def __init__(self, agent_id: str, message_bus: MessageBus,
                  observation_topic: str, observation_key: str,
-                 forecast_topic: str, window_size: int = 5):
+                 forecast_topic: str, window_size: int = 5,
+                 increase_factor: float = 1.05, decrease_factor: float = 0.95):
         """
         Initializes the ForecastingAgent.
 
@@ -25,6 +26,10 @@ class ForecastingAgent(Agent):
             observation_key: The key to extract the value from the observation message.
             forecast_topic: The topic to publish forecasts to.
             window_size: The number of recent data points to consider for trend detection.
+            increase_factor: The latest value must exceed the oldest one times this
+                             factor to count as an increasing trend (default: 5% increase).
+            decrease_factor: The latest value must fall below the oldest one times this
+                             factor to count as a decreasing trend (default: 5% decrease).
         """
         super().__init__(agent_id)
         self.bus = message_bus
@@ -32,6 +37,8 @@ class ForecastingAgent(Agent):
         self.observation_key = observation_key
         self.forecast_topic = forecast_topic
         self.window_size = window_size
+        self._up = increase_factor
+        self._down = decrease_factor
 
         self.history: Deque[float] = deque(maxlen=self.window_size)
         self.last_forecasted_trend: str = "stable"
@@ -59,19 +66,19 @@ class ForecastingAgent(Agent):
         oldest_value = self.history[0]
         latest_value = self.history[-1]
 
-        current_trend = "stable"
-        if latest_value > oldest_value * 1.05: # Require a 5% increase to call it a trend
-            current_trend = "increasing"
-        elif latest_value < oldest_value * 0.95: # Require a 5% decrease
-            current_trend = "decreasing"
+        current_trend = ("increasing" if latest_value > oldest_value * self._up else
+                         "decreasing" if latest_value < oldest_value * self._down else
+                         "stable")
 
         # Only publish if the trend has changed to avoid spamming the bus
-        if current_trend != self.last_forecasted_trend:
-            forecast_message = {
-                "trend": current_trend,
-                "current_value": latest_value,
-                "window_size_s": self.window_size * self.bus.dt # Assuming harness dt is on bus
-            }
-            self.bus.publish(self.forecast_topic, forecast_message)
-            self.last_forecasted_trend = current_trend
-            print(f"  [{current_time}s] ForecastAgent '{self.agent_id}': Detected trend '{current_trend}'. Publishing forecast.")
+        if current_trend == self.last_forecasted_trend:
+            return
+
+        forecast_message = {
+            "trend": current_trend,
+            "current_value": latest_value,
+            "window_size_s": self.window_size * self.bus.dt # Assuming harness dt is on bus
+        }
+        self.bus.publish(self.forecast_topic, forecast_message)
+        self.last_forecasted_trend = current_trend
+        print(f"  [{current_time}s] ForecastAgent '{self.agent_id}': Detected trend '{current_trend}'. Publishing forecast.")
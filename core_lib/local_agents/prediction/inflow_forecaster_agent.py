@@ -38,6 +38,8 @@ class InflowForecasterAgent(Agent):
         self.horizon = config["prediction_horizon"]
         self.dt = config["dt"]
         self.end_time = self.start_time + self.duration
+        # 预测序列各点相对当前时间的偏移量在整个仿真中不变，预先计算一次
+        self._offsets = tuple(i * self.dt for i in range(self.horizon))
 
         print(f"InflowForecasterAgent '{self.agent_id}' created. Will publish perfect forecasts to '{self.forecast_topic}'.")
 
@@ -45,14 +47,15 @@ class InflowForecasterAgent(Agent):
         """
         生成并发布对未来入流的完美预测。
         """
-        # 创建一个长度为 horizon 的预测列表
-        forecast_sequence: List[float] = [0.0] * self.horizon
-
-        # 根据当前时间填充预测序列
-        for i in range(self.horizon):
-            future_time = current_time + (i * self.dt)
-            if self.start_time <= future_time < self.end_time:
-                forecast_sequence[i] = self.inflow_rate
+        start_time, end_time, inflow_rate = self.start_time, self.end_time, self.inflow_rate
+        offsets = self._offsets
+        if current_time >= end_time or (offsets and current_time + offsets[-1] < start_time):
+            # 整个预测时域都不与扰动重叠
+            forecast_sequence: List[float] = [0.0] * self.horizon
+        else:
+            # 根据当前时间生成长度为 horizon 的预测序列
+            forecast_sequence = [inflow_rate if start_time <= current_time + offset < end_time else 0.0
+                                 for offset in offsets]
 
         # 将预测发布到消息总线
         forecast_message: Message = {'inflow_forecast': forecast_sequence}
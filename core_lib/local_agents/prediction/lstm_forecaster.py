@@ -4,13 +4,25 @@ An agent that uses an LSTM neural network to forecast future values.
 import torch
 import torch.nn as nn
 import numpy as np
-from collections import deque
-from sklearn.preprocessing import MinMaxScaler
 
 from core_lib.core.interfaces import Agent
 from core_lib.central_coordination.collaboration.message_bus import MessageBus, Message
 from core_lib.local_agents.prediction.lstm_model import LSTMModel
-from typing import Deque, Any, Dict, List, Tuple
+from typing import Any, Dict, List, Tuple
+
+
+def _compile_model(model: nn.Module) -> nn.Module:
+    """
+    Compiles `model` so its ops run as fused kernels.
+
+    Uses `torch.compile` on PyTorch 2.x and TorchScript otherwise. The result
+    shares its parameters with `model`.
+    """
+    if hasattr(torch, "compile"):
+        # The last mini-batch of an epoch is usually smaller than the others,
+        # so compile for a dynamic batch size instead of once per shape
+        return torch.compile(model, dynamic=True)
+    return torch.jit.script(model)
 
 class LSTMFlowForecaster(Agent):
     """
@@ -27,84 +39,200 @@ class LSTMFlowForecaster(Agent):
         self.forecast_topic = config["forecast_topic"]
         self.history_size = config.get("history_size", 200)
         self.refit_interval = config.get("refit_interval", 50)
+        # Train on the whole history on every n-th refit only. In between, the
+        # model is fine-tuned for `warm_epochs` on the newest sequences. 1 trains
+        # on the whole history every time.
+        self.full_refit_every = config.get("full_refit_every", 5)
 
         # LSTM specific config
         self.input_window_size = config.get("input_window_size", 30)
         self.output_window_size = config.get("output_window_size", 5)
         self.epochs = config.get("epochs", 50)
+        self.warm_epochs = config.get("warm_epochs", 3)
+        # Number of sequences per gradient step; 1 reproduces per-sample training
+        self.batch_size = config.get("batch_size", 64)
         self.learning_rate = config.get("learning_rate", 0.001)
         self.hidden_size = config.get("hidden_size", 50)
         self.num_layers = config.get("num_layers", 1)
-
-        # State
-        self.history: Deque[float] = deque(maxlen=self.history_size)
+        # Compiling costs several seconds up front, which only pays off when the
+        # model is refit and queried many times
+        self.compile_model = config.get("compile_model", False)
+        # Forecast with an int8 copy of the trained model. This changes the
+        # forecasts slightly, so it is off by default
+        self.quantize_inference = config.get("quantize_inference", False)
+        # Train under autocast in bfloat16 (float16 on GPUs without bfloat16).
+        # Only worth it on hardware with native low-precision matmuls
+        self.mixed_precision = config.get("mixed_precision", False)
+
+        # State. The history is a ring buffer: `_idx` is the next slot to write
+        # and `_filled` the number of valid observations.
+        self._buf = np.empty(self.history_size)
+        self._idx = 0
+        self._filled = 0
         self.new_obs_since_fit = 0
-        self.model = LSTMModel(1, self.hidden_size, self.num_layers, self.output_window_size)
-        self.scaler = MinMaxScaler(feature_range=(-1, 1))
+        self._fitted = False
+        self._warm_fits_since_full_fit = 0
+        # The uncompiled module, which is what gets quantized
+        self._eager_model = LSTMModel(1, self.hidden_size, self.num_layers, self.output_window_size)
+        self.model = _compile_model(self._eager_model) if self.compile_model else self._eager_model
+        # The model `_forecast` runs: `model` itself, or its quantized copy
+        self._infer_model = self.model
+        # Kept across refits, so Adam's moment estimates are allocated once and
+        # carry over from one fit to the next
+        self.optimizer = torch.optim.Adam(self.model.parameters(), lr=self.learning_rate)
+        self.loss_function = nn.MSELoss()
+        # The data is scaled to [-1, 1] as `(x - _dmin) * _dscale - 1`, with both
+        # numbers taken from the history on every full fit
+        self._dmin = 0.0
+        self._dscale = 1.0
+        # Input of every forecast, reused instead of allocated per call
+        self._infer_buf = torch.empty(1, self.input_window_size, 1, dtype=torch.float32)
 
         self.bus.subscribe(self.obs_topic, self.handle_observation_message)
         print(f"LSTMFlowForecaster '{self.agent_id}' created.")
 
+    @property
+    def history(self) -> np.ndarray:
+        """The retained observations, oldest first."""
+        if self._filled < self.history_size:
+            # Not wrapped yet: the valid part is a prefix of the buffer
+            return self._buf[:self._filled]
+        idx = self._idx
+        return np.concatenate((self._buf[idx:], self._buf[:idx]))
+
+    def _latest(self, count: int) -> np.ndarray:
+        """The last `count` observations, oldest first; `count` must not exceed `_filled`."""
+        idx = self._idx
+        if count <= idx:
+            return self._buf[idx - count:idx]
+        # The window wraps around the end of the buffer
+        return np.concatenate((self._buf[idx - count:], self._buf[:idx]))
+
     def handle_observation_message(self, message: Message):
         value = message.get(self.obs_key)
         if isinstance(value, (int, float)):
-            self.history.append(float(value))
+            idx = self._idx
+            self._buf[idx] = value
+            idx += 1
+            self._idx = 0 if idx == self.history_size else idx
+            if self._filled < self.history_size:
+                self._filled += 1
             self.new_obs_since_fit += 1
 
+    def _scale(self, values: np.ndarray) -> np.ndarray:
+        """Maps `values` onto the model's [-1, 1] scale."""
+        return (values - self._dmin) * self._dscale - 1.0
+
+    def _unscale(self, values: np.ndarray) -> np.ndarray:
+        """Maps values on the model's scale back to observation units."""
+        return (values + 1.0) / self._dscale + self._dmin
+
     def _create_sequences(self, data: np.ndarray) -> Tuple[torch.Tensor, torch.Tensor]:
-        inout_seq = []
-        L = len(data)
-        for i in range(L - self.input_window_size - self.output_window_size):
-            train_seq = data[i:i + self.input_window_size]
-            train_label = data[i + self.input_window_size : i + self.input_window_size + self.output_window_size]
-            inout_seq.append((train_seq, train_label))
-
-        # Convert to tensors, ensuring labels are flattened
-        X = torch.FloatTensor(np.array([seq for seq, _ in inout_seq]))
-        y = torch.FloatTensor(np.array([label.flatten() for _, label in inout_seq]))
-        return X.view(-1, self.input_window_size, 1), y
+        # Every window of input + output points, as a strided view of the data
+        windows = np.lib.stride_tricks.sliding_window_view(
+            data.reshape(-1), self.input_window_size + self.output_window_size)
+        # The last window is left out, as it always has been
+        X = windows[:-1, :self.input_window_size]
+        y = windows[:-1, self.input_window_size:]
+
+        # Each array is copied once, straight into float32
+        X = torch.from_numpy(np.ascontiguousarray(X, dtype=np.float32))
+        y = torch.from_numpy(np.ascontiguousarray(y, dtype=np.float32))
+        return X.unsqueeze(-1), y
 
     def _fit_model(self):
-        if len(self.history) < self.input_window_size + self.output_window_size:
+        if self._filled < self.input_window_size + self.output_window_size:
             return
 
-        print(f"  [{self.agent_id}] Preprocessing data and training LSTM model...")
+        full_fit = not self._fitted or self._warm_fits_since_full_fit + 1 >= self.full_refit_every
 
         # 1. Preprocess data
-        data_np = np.array(self.history).reshape(-1, 1)
-        data_scaled = self.scaler.fit_transform(data_np)
+        if full_fit:
+            print(f"  [{self.agent_id}] Preprocessing data and training LSTM model...")
+            data_np = self.history.reshape(-1, 1)
+            dmin = data_np.min()
+            dmax = data_np.max()
+            self._dmin = dmin
+            # A constant history is only shifted, as MinMaxScaler does
+            self._dscale = 2.0 / (dmax - dmin) if dmax > dmin else 2.0
+            data_scaled = self._scale(data_np)
+            epochs = self.epochs
+        else:
+            # Only the sequences that end in an observation not trained on yet.
+            # The scaling is kept, so the model sees the same scale as before.
+            print(f"  [{self.agent_id}] Fine-tuning LSTM model on recent data...")
+            recent = min(self._filled, self.new_obs_since_fit + self.input_window_size + self.output_window_size)
+            data_np = self._latest(recent).reshape(-1, 1)
+            data_scaled = self._scale(data_np)
+            epochs = self.warm_epochs
         X_train, y_train = self._create_sequences(data_scaled)
 
         # 2. Train model
-        optimizer = torch.optim.Adam(self.model.parameters(), lr=self.learning_rate)
-        loss_function = nn.MSELoss()
-
-        for i in range(self.epochs):
-            for seq, labels in zip(X_train, y_train):
-                optimizer.zero_grad()
-                y_pred = self.model(seq.unsqueeze(0))
-                single_loss = loss_function(y_pred, labels.unsqueeze(0))
-                single_loss.backward()
-                optimizer.step()
-
+        optimizer = self.optimizer
+        loss_function = self.loss_function
+        # Restart every fit from the configured learning rate
+        for group in optimizer.param_groups:
+            group["lr"] = self.learning_rate
+
+        # Train on shuffled mini-batches: one batched LSTM pass per step instead
+        # of one pass per sequence
+        self.model.train()
+        device = next(self.model.parameters()).device
+        X_train = X_train.to(device, non_blocking=True)
+        y_train = y_train.to(device, non_blocking=True)
+        num_samples = X_train.size(0)
+
+        amp_dtype = torch.bfloat16
+        grad_scaler = None
+        if self.mixed_precision and device.type == "cuda" and not torch.cuda.is_bf16_supported():
+            # float16 gradients can underflow, so scale the loss
+            amp_dtype = torch.float16
+            grad_scaler = torch.cuda.amp.GradScaler()
+
+        for i in range(epochs):
+            permutation = torch.randperm(num_samples, device=device)
+            for start in range(0, num_samples, self.batch_size):
+                batch = permutation[start:start + self.batch_size]
+                optimizer.zero_grad(set_to_none=True)
+                with torch.autocast(device.type, dtype=amp_dtype, enabled=self.mixed_precision):
+                    y_pred = self.model(X_train[batch])
+                    loss = loss_function(y_pred, y_train[batch])
+                if grad_scaler is None:
+                    loss.backward()
+                    optimizer.step()
+                else:
+                    grad_scaler.scale(loss).backward()
+                    grad_scaler.step(optimizer)
+                    grad_scaler.update()
+
+        if self.quantize_inference:
+            # Re-quantize after every fit; the FP32 model keeps being trained
+            self._eager_model.eval()
+            self._infer_model = torch.ao.quantization.quantize_dynamic(
+                self._eager_model, {nn.LSTM, nn.Linear}, dtype=torch.qint8)
+
+        self._fitted = True
+        self._warm_fits_since_full_fit = 0 if full_fit else self._warm_fits_since_full_fit + 1
         self.new_obs_since_fit = 0
         print(f"  [{self.agent_id}] LSTM model training complete.")
 
     def _forecast(self) -> List[float]:
-        if len(self.history) < self.input_window_size:
+        if not self._fitted or self._filled < self.input_window_size:
             return []
 
         # Take the last `input_window_size` points from history
-        last_sequence = np.array(list(self.history)[-self.input_window_size:]).reshape(-1, 1)
-        last_sequence_scaled = self.scaler.transform(last_sequence)
+        last_sequence = self._latest(self.input_window_size).reshape(-1, 1)
+        last_sequence_scaled = self._scale(last_sequence)
 
-        with torch.no_grad():
-            self.model.eval()
-            input_tensor = torch.FloatTensor(last_sequence_scaled).view(1, self.input_window_size, 1)
-            prediction_scaled = self.model(input_tensor)
+        # _fit_model leaves the model in training mode
+        model = self._infer_model
+        model.eval()
+        with torch.inference_mode():
+            input_tensor = self._infer_buf.copy_(torch.from_numpy(last_sequence_scaled).view(1, -1, 1))
+            prediction_scaled = model(input_tensor)
 
         # Inverse transform the prediction to get the real value
-        prediction = self.scaler.inverse_transform(prediction_scaled.numpy())
+        prediction = self._unscale(prediction_scaled.numpy())
         return prediction.flatten().tolist()
 
     def run(self, current_time: float):
@@ -29,6 +29,8 @@ class LSTMModel(nn.Module):
             num_layers=num_layers,
             batch_first=True # Expect input tensors with batch dimension first
         )
+        # Keep the weights in one contiguous buffer, as cuDNN's fused LSTM expects
+        self.lstm.flatten_parameters()
 
         # Define the fully connected output layer
         self.linear = nn.Linear(
@@ -42,17 +44,16 @@ class LSTMModel(nn.Module):
 
         Args:
             input_seq: The input sequence tensor. Shape: (batch_size, sequence_length, input_size)
+                It should already be contiguous; build it in that layout once
+                rather than reshaping per call.
 
         Returns:
             The prediction tensor. Shape: (batch_size, output_size)
         """
-        # Initialize hidden and cell states
-        h0 = torch.zeros(self.num_layers, input_seq.size(0), self.hidden_layer_size).to(input_seq.device)
-        c0 = torch.zeros(self.num_layers, input_seq.size(0), self.hidden_layer_size).to(input_seq.device)
-
+        # The hidden and cell states start at zero, which is nn.LSTM's default.
         # We only care about the final output of the LSTM layer
         # lstm_out shape: (batch_size, sequence_length, hidden_layer_size)
-        lstm_out, _ = self.lstm(input_seq, (h0, c0))
+        lstm_out, _ = self.lstm(input_seq.contiguous())
 
         # We pass the output of the last time step to the linear layer
         # lstm_out[:, -1, :] gets the last time step's output for all batches
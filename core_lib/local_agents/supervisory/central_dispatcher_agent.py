@@ -38,7 +38,14 @@ class CentralDispatcherAgent(Agent):
         self.observation_key = observation_key
         self.command_topic = command_topic
         self.params = dispatcher_params
+        # The thresholds and setpoints are fixed, so read them out of the dict once
+        self._low_level = float(dispatcher_params['low_level'])
+        self._high_level = float(dispatcher_params['high_level'])
+        self._low_setpoint = float(dispatcher_params['low_setpoint'])
+        self._high_setpoint = float(dispatcher_params['high_setpoint'])
         self.current_observed_value = None
+        # The setpoint most recently published, while the level stays out of band
+        self._last_setpoint = None
 
         self.bus.subscribe(self.subscribed_topic, self.handle_state_message)
         logging.info(f"CentralDispatcherAgent '{self.agent_id}' initialized. Monitoring '{self.observation_key}' on topic '{self.subscribed_topic}'.")
@@ -54,25 +61,27 @@ class CentralDispatcherAgent(Agent):
         The main execution logic, called at each simulation step. It checks the
         current state and decides whether to issue a new command.
         """
-        if self.current_observed_value is None:
+        observed_value = self.current_observed_value
+        if observed_value is None:
             # No data received yet, do nothing.
             return
 
-        low_level = self.params['low_level']
-        high_level = self.params['high_level']
         new_setpoint = None
 
         # Simple hysteresis (bang-bang) control logic
-        if self.current_observed_value < low_level:
-            new_setpoint = self.params['high_setpoint'] # Level is too low, increase inflow by raising upstream setpoint
-        elif self.current_observed_value > high_level:
-            new_setpoint = self.params['low_setpoint'] # Level is too high, decrease inflow by lowering upstream setpoint
+        if observed_value < self._low_level:
+            new_setpoint = self._high_setpoint # Level is too low, increase inflow by raising upstream setpoint
+        elif observed_value > self._high_level:
+            new_setpoint = self._low_setpoint # Level is too high, decrease inflow by lowering upstream setpoint
 
-        if new_setpoint is not None:
-            # Check if this is a change from the last command to avoid flooding the bus
-            # (A more robust implementation would store the last commanded setpoint)
+        if new_setpoint is None:
+            # Back within the band: the next excursion issues its command again,
+            # even if it asks for the same setpoint as the last one
+            self._last_setpoint = None
+        elif new_setpoint != self._last_setpoint:
+            # Only a change is published, to avoid flooding the bus with the same
+            # command on every tick the level stays out of band
             logging.info(f"Dispatcher '{self.agent_id}' is issuing a new setpoint: {new_setpoint}")
             command_message: Message = {'new_setpoint': new_setpoint}
             self.bus.publish(self.command_topic, command_message)
-            # We can reset the observed value to prevent re-issuing the same command
-            # until a new state message arrives, but for simplicity we don't here.
+            self._last_setpoint = new_setpoint
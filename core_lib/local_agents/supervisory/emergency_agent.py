@@ -32,7 +32,7 @@ class EmergencyAgent(Agent):
         super().__init__(agent_id)
         self.bus = message_bus
         self.subscribed_topics = subscribed_topics
-        self.pressure_threshold = pressure_threshold
+        self.pressure_threshold = float(pressure_threshold)
         self.action_topic = action_topic
         self.emergency_declared = False
 
@@ -56,6 +56,9 @@ class EmergencyAgent(Agent):
         logging.critical(f"EMERGENCY DECLARED by '{self.agent_id}'! Pressure dropped below threshold.")
         # Set flag to prevent multiple declarations
         self.emergency_declared = True
+        # Nothing else is done with state messages, so stop receiving them
+        for topic in self.subscribed_topics:
+            self.bus.unsubscribe(topic, self.handle_state_message)
 
         # The action message could be structured to command a specific component.
         # For example, telling a PID controller to change its setpoint to 0
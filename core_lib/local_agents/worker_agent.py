@@ -1,25 +1,63 @@
 import logging
 import random
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, Any
 from core_lib.core.interfaces import Agent
 from core_lib.central_coordination.collaboration.message_bus import MessageBus
+from core_lib.central_coordination.collaboration.mailbox import Mailbox
 
 class WorkerAgent(Agent):
-    """Picks up tasks, processes them, and returns results."""
+    """
+    Picks up tasks, processes them, and returns results.
+
+    By default a task is processed inside `handle_task`, on the thread that
+    published it, which blocks the publisher for the duration of the work.
+
+    With `asynchronous=True` the work runs on a background thread instead:
+    `handle_task` queues the task and returns at once, and the result is
+    published by the next `run` call, on the simulation thread, because the
+    MessageBus delivers synchronously and is not meant to be driven from
+    several threads. Results then arrive in wall-clock time rather than within
+    the step the task was published in, so the driving loop has to keep
+    stepping until they do. Call `stop` when the worker is no longer needed.
+    """
     def __init__(self, agent_id: str, message_bus: MessageBus, **kwargs):
         super().__init__(agent_id)
         self.bus = message_bus
         self.task_topic = kwargs['task_topic']
         self.result_topic = kwargs['result_topic']
         self.is_busy = False
+        self.asynchronous = kwargs.get('asynchronous', False)
+        if self.asynchronous:
+            # A single thread, so the worker still processes its tasks one at a
+            # time and in the order they arrived
+            self._pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix=agent_id)
+            self._lock = threading.Lock()
+            self._tasks_in_progress = 0
+            # Finished results, appended by the pool thread and published by run()
+            self._results = Mailbox()
         self.bus.subscribe(self.task_topic, self.handle_task)
 
     def handle_task(self, message: Dict[str, Any]):
+        if self.asynchronous:
+            # Queue the task behind any in progress instead of dropping it
+            with self._lock:
+                self._tasks_in_progress += 1
+                self.is_busy = True
+            self._pool.submit(self._work_in_background, message)
+            return
+
         if self.is_busy:
             return # Already working on a task
 
         self.is_busy = True
+        self._publish_result(self._process(message))
+        self.is_busy = False
+
+    def _process(self, message: Dict[str, Any]) -> Dict[str, Any]:
+        """Does the work for one task and returns the result message."""
         task_id = message.get('task_id', 'unknown_task')
         payload = message.get('payload')
         logging.info(f"[{self.agent_id}] Picked up task: {task_id}")
@@ -29,10 +67,34 @@ class WorkerAgent(Agent):
         time.sleep(processing_time)
         result = payload * payload # Square the number
 
-        result_message = {'task_id': task_id, 'result': result, 'worker_id': self.agent_id}
+        return {'task_id': task_id, 'result': result, 'worker_id': self.agent_id}
+
+    def _work_in_background(self, message: Dict[str, Any]):
+        """Runs on the pool thread in asynchronous mode."""
+        try:
+            self._results(self._process(message))
+        except Exception:
+            logging.exception(f"[{self.agent_id}] Task {message.get('task_id', 'unknown_task')} failed")
+        finally:
+            with self._lock:
+                self._tasks_in_progress -= 1
+                self.is_busy = self._tasks_in_progress > 0
+
+    def _publish_result(self, result_message: Dict[str, Any]):
         self.bus.publish(self.result_topic, result_message)
-        logging.info(f"[{self.agent_id}] Completed task: {task_id}, result: {result}")
-        self.is_busy = False
+        logging.info(f"[{self.agent_id}] Completed task: {result_message['task_id']}, result: {result_message['result']}")
 
     def run(self, current_time: float):
-        pass # Reactive agent
+        if self.asynchronous:
+            # Publish the results finished since the last step
+            for result_message in self._results.drain():
+                self._publish_result(result_message)
+        # Otherwise a purely reactive agent
+
+    def stop(self):
+        """Discards queued tasks and waits for the one in progress, in asynchronous mode."""
+        if self.asynchronous:
+            self._pool.shutdown(wait=True, cancel_futures=True)
+            with self._lock:
+                self._tasks_in_progress = 0
+                self.is_busy = False
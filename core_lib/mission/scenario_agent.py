@@ -1,10 +1,14 @@
 """
 Agent for managing and executing test scenarios.
 """
+import bisect
+import logging
 from core_lib.core.interfaces import Agent
 from core_lib.central_coordination.collaboration.message_bus import MessageBus
 from typing import List, Dict, Any
 
+logger = logging.getLogger(__name__)
+
 class ScenarioAgent(Agent):
     """
     Manages the execution of a predefined scenario script.
@@ -27,6 +31,8 @@ class ScenarioAgent(Agent):
         super().__init__(agent_id)
         self.bus = message_bus
         self.script = sorted(scenario_script, key=lambda x: x['time'])
+        # Event times in script order, for locating the current time by bisection
+        self._times = [event['time'] for event in self.script]
         self.event_index = 0
 
         print(f"ScenarioAgent '{self.agent_id}' initialized with a script of {len(self.script)} events.")
@@ -35,14 +41,18 @@ class ScenarioAgent(Agent):
         """
         Checks the scenario script and executes any events scheduled for the current time.
         """
-        while self.event_index < len(self.script) and self.script[self.event_index]['time'] <= current_time:
-            event = self.script[self.event_index]
+        # Every event up to `due` is scheduled at or before the current time
+        due = bisect.bisect_right(self._times, current_time, self.event_index)
+        if due == self.event_index:
+            return
 
+        for event in self.script[self.event_index:due]:
             topic = event['topic']
             message = event['message']
 
             self.bus.publish(topic, message)
 
-            print(f"[{self.agent_id} at {current_time}] Executed scenario event: Published to '{topic}' -> {message}")
+            logger.info("[%s at %s] Executed scenario event: Published to '%s' -> %s",
+                        self.agent_id, current_time, topic, message)
 
-            self.event_index += 1
+        self.event_index = due
@@ -39,6 +39,14 @@ class Canal(PhysicalObjectInterface):
         self.side_slope_z = self._params['side_slope_z']
         self.manning_n = self._params['manning_n']
 
+        # Geometry-derived constants used by every step
+        self._b_squared = self.bottom_width**2
+        self._two_z = 2 * self.side_slope_z
+        self._bed_area = self.bottom_width * self.length
+        self._side_coeff = math.sqrt(1 + self.side_slope_z**2)
+        self._inv_n = 1 / self.manning_n
+        self._sqrt_slope = self.slope**0.5
+
         # For data-driven inflow from the message bus
         self.bus = message_bus
         self.inflow_topic = inflow_topic
@@ -67,48 +75,50 @@ class Canal(PhysicalObjectInterface):
         # Total inflow is the sum of physical inflow and data-driven inflow
         inflow = physical_inflow + self.data_inflow
 
+        state = self._state
+        volume = state['volume']
+        length = self.length
+        z = self.side_slope_z
+        bottom_width = self.bottom_width
+
         # Approximate water level from volume. For a trapezoid, this is more complex.
         # V = L * (b*y + z*y^2) -> z*y^2 + b*y - V/L = 0
         # Solving the quadratic equation for y (water_level)
-        a = self.side_slope_z
-        b = self.bottom_width
-        c = -self._state['volume'] / self.length if self.length > 0 else 0
-
-        if a == 0:  # Rectangular channel case
-            water_level = self._state['volume'] / (self.bottom_width * self.length) if (self.bottom_width * self.length) > 0 else 0
+        if z == 0:  # Rectangular channel case
+            bed_area = self._bed_area
+            water_level = volume / bed_area if bed_area > 0 else 0
         else:
+            c = -volume / length if length > 0 else 0
             # Quadratic formula: y = (-b + sqrt(b^2 - 4ac)) / 2a
-            discriminant = b**2 - 4 * a * c
+            discriminant = self._b_squared - 4 * z * c
             if discriminant >= 0:
-                water_level = (-b + math.sqrt(discriminant)) / (2 * a)
+                water_level = (-bottom_width + math.sqrt(discriminant)) / self._two_z
             else:
                 water_level = 0
 
-        self._state['water_level'] = water_level
+        state['water_level'] = water_level
 
         # If the harness provides an outflow value (for stateful components), use it.
         # Otherwise, calculate it using Manning's equation (for open-ended components).
         if action and action.get('outflow') is not None:
             outflow = action['outflow']
-        else:
+        elif water_level > 0:
             # Calculate hydraulic properties for a trapezoidal channel
-            if water_level > 0:
-                area = (self.bottom_width + self.side_slope_z * water_level) * water_level
-                wetted_perimeter = self.bottom_width + 2 * water_level * math.sqrt(1 + self.side_slope_z**2)
-                hydraulic_radius = area / wetted_perimeter if wetted_perimeter > 0 else 0
-            else:
-                area = 0
-                hydraulic_radius = 0
+            area = (bottom_width + z * water_level) * water_level
+            wetted_perimeter = bottom_width + 2 * water_level * self._side_coeff
+            hydraulic_radius = area / wetted_perimeter if wetted_perimeter > 0 else 0
 
             # Calculate outflow using Manning's equation
             # Q = (1/n) * A * R_h^(2/3) * S^(1/2)
-            outflow = (1 / self.manning_n) * area * (hydraulic_radius**(2/3)) * (self.slope**0.5) if area > 0 else 0
+            outflow = self._inv_n * area * (hydraulic_radius**(2/3)) * self._sqrt_slope if area > 0 else 0
+        else:
+            outflow = 0
 
-        self._state['outflow'] = outflow
+        state['outflow'] = outflow
 
         # Update volume based on inflow and outflow using mass balance
-        self._state['volume'] += (inflow - outflow) * dt
-        self._state['volume'] = max(0, self._state['volume']) # Volume cannot be negative
+        volume += (inflow - outflow) * dt
+        state['volume'] = max(0, volume) # Volume cannot be negative
 
         return self.get_state()
 
@@ -82,8 +82,30 @@ class PumpStation(PhysicalObjectInterface):
         self._state.setdefault('total_outflow', 0.0)
         self._state.setdefault('active_pumps', 0)
         self._state.setdefault('total_power_draw_kw', 0.0)
+        # The two possible per-pump messages never change, so build them once
+        self._msg_on = {'control_signal': 1}
+        self._msg_off = {'control_signal': 0}
         print(f"PumpStation '{self.name}' created with {len(self.pumps)} pumps.")
 
+    def handle_batch_action_message(self, message: Message):
+        """
+        Callback for a station-level message carrying the control signals of all
+        pumps, either as a list, e.g. `{'signals': [1, 1, 0]}`, or as a bitmask
+        with bit i set when pump i should run, e.g. `{'pump_mask': 0b011, 'n': 3}`.
+        Subscribing this once replaces one subscription (and one publish) per pump.
+        Each signal is passed on to `Pump.handle_action_message`, which validates it.
+        """
+        signals = message.get('signals')
+        if signals is not None:
+            for pump, signal in zip(self.pumps, signals):
+                pump.handle_action_message({'control_signal': signal})
+            return
+
+        mask = message.get('pump_mask')
+        if mask is not None:
+            for i, pump in enumerate(self.pumps[:message.get('n', len(self.pumps))]):
+                pump.handle_action_message(self._msg_on if (mask >> i) & 1 else self._msg_off)
+
     def step(self, action: Dict[str, Any], dt: float) -> State:
         """
         Steps each pump in the station and aggregates their states.
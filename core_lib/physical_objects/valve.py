@@ -93,6 +93,15 @@ class ValveStation(PhysicalObjectInterface):
         self._state.setdefault('valve_count', len(self.valves))
         print(f"ValveStation '{self.name}' created with {len(self.valves)} valves.")
 
+    def handle_batch_action_message(self, message: Message):
+        """
+        Callback for a station-level message carrying one control signal for
+        all valves, e.g. `{'control_signal': 40.0}`. Subscribing this once
+        replaces one subscription (and one publish) per valve.
+        """
+        for valve in self.valves:
+            valve.handle_action_message(message)
+
     def step(self, action: Dict[str, Any], dt: float) -> State:
         """
         Steps each valve in the station and aggregates their states.
@@ -0,0 +1,53 @@
+import unittest
+import sys
+from pathlib import Path
+
+# Add the project root to the Python path
+project_root = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(project_root))
+
+from core_lib.central_coordination.collaboration.message_bus import MessageBus
+from core_lib.local_agents.disturbances.failure_injection_agent import FailureInjectionAgent
+
+class TestFailureInjectionAgent(unittest.TestCase):
+    """
+    Tests that FailureInjectionAgent issues its shutdown exactly once, however it is driven.
+    """
+
+    def setUp(self):
+        """Set up an agent failing at t=10 and record the shutdown messages."""
+        self.bus = MessageBus()
+        self.received = []
+        self.bus.subscribe("action.gate", lambda message: self.received.append(message))
+        self.agent = FailureInjectionAgent("failure", self.bus, target_topic="action.gate", failure_time=10.0)
+
+    def test_fired_by_bus_scheduler(self):
+        """The failure fires from advance_time once its time is reached."""
+        for t in (0.0, 5.0, 9.0):
+            self.bus.advance_time(t)
+        self.assertEqual(self.received, [])
+
+        self.bus.advance_time(10.0)
+        self.assertEqual(self.received, [{'shutdown': True}])
+        self.bus.advance_time(15.0)
+        self.assertEqual(len(self.received), 1)
+
+    def test_fired_by_run(self):
+        """A loop that only calls run still gets the failure, once."""
+        for t in (0.0, 5.0, 9.0):
+            self.agent.run(t)
+        self.assertEqual(self.received, [])
+
+        for t in (10.0, 15.0, 20.0):
+            self.agent.run(t)
+        self.assertEqual(self.received, [{'shutdown': True}])
+
+    def test_scheduler_and_run_fire_once(self):
+        """Driving both advance_time and run, as the harness does, issues a single shutdown."""
+        for t in (0.0, 5.0, 10.0, 15.0):
+            self.bus.advance_time(t)
+            self.agent.run(t)
+        self.assertEqual(self.received, [{'shutdown': True}])
+
+if __name__ == '__main__':
+    unittest.main()
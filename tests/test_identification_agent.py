@@ -0,0 +1,83 @@
+import unittest
+import sys
+from pathlib import Path
+import numpy as np
+
+# Add the project root to the Python path
+project_root = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(project_root))
+
+from core_lib.central_coordination.collaboration.message_bus import MessageBus
+from core_lib.core.interfaces import Identifiable
+from core_lib.identification.identification_agent import ParameterIdentificationAgent
+
+class RecordingModel(Identifiable):
+    """An Identifiable that keeps a copy of the data it is given."""
+
+    def __init__(self):
+        self.calls = []
+
+    def identify_parameters(self, data, method='offline'):
+        self.calls.append({key: np.array(values) for key, values in data.items()})
+        return {}
+
+class TestParameterIdentificationAgent(unittest.TestCase):
+    """
+    Tests which data values ParameterIdentificationAgent stores.
+    """
+
+    def setUp(self):
+        """Set up an agent collecting three points from two streams."""
+        self.bus = MessageBus()
+        self.model = RecordingModel()
+        self.agent = ParameterIdentificationAgent(
+            agent_id="identification",
+            target_model=self.model,
+            message_bus=self.bus,
+            config={
+                'identification_interval': 3,
+                'identification_data_map': {'rainfall': 'data.rainfall', 'observed_runoff': 'data.runoff'}
+            }
+        )
+
+    def test_numeric_values_stored(self):
+        """Ints, floats and numpy scalars are collected and handed to the model."""
+        for rain, runoff in [(1, 0.5), (2.5, np.float32(1.0)), (np.int64(3), 1.5)]:
+            self.bus.publish('data.rainfall', {'value': rain})
+            self.bus.publish('data.runoff', {'value': runoff})
+        self.agent.run(current_time=0)
+
+        self.assertEqual(len(self.model.calls), 1)
+        np.testing.assert_array_equal(self.model.calls[0]['rainfall'], [1.0, 2.5, 3.0])
+        np.testing.assert_array_equal(self.model.calls[0]['observed_runoff'], [0.5, 1.0, 1.5])
+
+    def test_non_numeric_values_rejected(self):
+        """Numeric strings and other non-numbers are dropped and not counted."""
+        with self.assertLogs('core_lib.identification.identification_agent', level='WARNING'):
+            for value in ["1.5", [1.0], "abc"]:
+                self.bus.publish('data.rainfall', {'value': value})
+        self.bus.publish('data.rainfall', {})
+        self.assertEqual(self.agent.new_data_count, 0)
+
+        self.agent.run(current_time=0)
+        self.assertEqual(self.model.calls, [])
+
+    def test_dropped_samples_not_counted(self):
+        """Samples arriving after a column is full are neither stored nor counted."""
+        for value in range(5):
+            self.bus.publish('data.rainfall', {'value': value})
+        self.assertEqual(self.agent.new_data_count, 3)
+
+        for value in range(5):
+            self.bus.publish('data.runoff', {'value': value})
+        self.agent.run(current_time=0)
+        np.testing.assert_array_equal(self.model.calls[0]['rainfall'], [0.0, 1.0, 2.0])
+        np.testing.assert_array_equal(self.model.calls[0]['observed_runoff'], [0.0, 1.0, 2.0])
+
+        # The next cycle starts from zero rather than from the dropped samples
+        self.assertEqual(self.agent.new_data_count, 0)
+        self.bus.publish('data.rainfall', {'value': 9.0})
+        self.assertEqual(self.agent.new_data_count, 1)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,137 @@
+import unittest
+import sys
+from pathlib import Path
+
+import numpy as np
+
+# Add the project root to the Python path
+project_root = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(project_root))
+
+from core_lib.local_agents.perception.kalman_filter import KalmanFilter
+from core_lib.local_agents.perception.kalman_filter_batch import KalmanFilterBatch
+
+def random_system(rng, n, m, p):
+    """Returns a stable random (F, B, H, Q, R, x0, P0) system."""
+    F = np.eye(n) + 0.05 * rng.normal(size=(n, n))
+    F /= max(1.0, 1.05 * np.max(np.abs(np.linalg.eigvals(F))))
+    B = rng.normal(size=(n, p)) if p else None
+    H = rng.normal(size=(m, n))
+    A = rng.normal(size=(n, n))
+    Q = 0.01 * (A @ A.T + np.eye(n))
+    C = rng.normal(size=(m, m))
+    R = 0.1 * (C @ C.T + np.eye(m))
+    x0 = rng.normal(size=n)
+    P0 = np.eye(n)
+    return F, B, H, Q, R, x0, P0
+
+class TestKalmanFilter(unittest.TestCase):
+    """
+    Tests KalmanFilter against the textbook equations.
+    """
+
+    def test_matches_textbook_form(self):
+        """x and P follow the K = P H^T S^-1, P = (I - K H) P equations and P stays symmetric."""
+        rng = np.random.default_rng(0)
+        for n, m in ((3, 3), (4, 1), (10, 2)):
+            with self.subTest(n=n, m=m):
+                F, B, H, Q, R, x0, P0 = random_system(rng, n, m, 0)
+                kf = KalmanFilter(F, B, H, Q, R, x0, P0)
+                x, P = x0.copy(), P0.copy()
+                for _ in range(2000):
+                    z = rng.normal(size=m)
+                    kf.predict()
+                    kf.update(z)
+
+                    x = F @ x
+                    P = F @ P @ F.T + Q
+                    K = P @ H.T @ np.linalg.inv(H @ P @ H.T + R)
+                    x = x + K @ (z - H @ x)
+                    P = (np.eye(n) - K @ H) @ P
+
+                np.testing.assert_allclose(kf.x, x, rtol=1e-8, atol=1e-10)
+                np.testing.assert_allclose(kf.P, P, rtol=1e-8, atol=1e-10)
+                self.assertLess(np.max(np.abs(kf.P - kf.P.T)), 1e-12 * np.max(np.abs(kf.P)))
+
+    def test_scalar_measurement_numpy_path(self):
+        """Without the compiled kernels, an m=1 update keeps the shape of x0 and matches the general update."""
+        rng = np.random.default_rng(1)
+        # n=10 is above KERNEL_MAX_STATES; the small filter is forced onto the numpy path
+        for n, force_numpy, x_shape in ((10, False, (10,)), (10, False, (10, 1)), (4, True, (4,))):
+            with self.subTest(n=n, force_numpy=force_numpy, x_shape=x_shape):
+                F, B, H, Q, R, x0, P0 = random_system(rng, n, 1, 0)
+                kf = KalmanFilter(F, B, H, Q, R, x0.reshape(x_shape), P0)
+                if force_numpy:
+                    kf._kernels = False
+                x, P = x0.copy(), P0.copy()
+                for _ in range(200):
+                    z = rng.normal(size=1)
+                    kf.predict()
+                    x_kf = kf.update(z)
+
+                    x = F @ x
+                    P = F @ P @ F.T + Q
+                    K = P @ H.T @ np.linalg.inv(H @ P @ H.T + R)
+                    x = x + K @ (z - H @ x)
+                    P = (np.eye(n) - K @ H) @ P
+
+                self.assertEqual(x_kf.shape, x_shape)
+                np.testing.assert_allclose(x_kf.reshape(n), x, rtol=1e-8, atol=1e-10)
+                np.testing.assert_allclose(kf.P, P, rtol=1e-8, atol=1e-10)
+
+    def test_scalar_measurement_forms(self):
+        """An m=1 update gives the same result for a scalar, a list and (1,)/(1, 1) arrays, on both paths."""
+        F, B, H, Q, R, x0, P0 = random_system(np.random.default_rng(2), 4, 1, 0)
+        for force_numpy in (False, True):
+            results = []
+            for z in (0.7, [0.7], np.array([0.7]), np.array([[0.7]])):
+                with self.subTest(force_numpy=force_numpy, z=z):
+                    kf = KalmanFilter(F, B, H, Q, R, x0, P0)
+                    if force_numpy:
+                        kf._kernels = False
+                    kf.predict()
+                    results.append((kf.update(z).copy(), kf.P.copy()))
+            for x, P in results[1:]:
+                np.testing.assert_allclose(x, results[0][0], rtol=1e-12)
+                np.testing.assert_allclose(P, results[0][1], rtol=1e-12)
+
+class TestKalmanFilterBatch(unittest.TestCase):
+    """
+    Tests that a KalmanFilterBatch matches independent KalmanFilter runs.
+    """
+
+    def _check(self, n, m, p):
+        """Runs N filters individually and as one batch on the same inputs."""
+        rng = np.random.default_rng(n * 100 + m * 10 + p)
+        systems = [random_system(rng, n, m, p) for _ in range(5)]
+        filters = [KalmanFilter(*system) for system in systems]
+        batch = KalmanFilterBatch(n, m, p)
+        for F, B, H, Q, R, x0, P0 in systems:
+            batch.add_slot(F, H, Q, R, x0, P0, B=B)
+        self.assertEqual(len(batch), len(systems))
+
+        for _ in range(500):
+            u = rng.normal(size=(len(systems), p)) if p else None
+            z = rng.normal(size=(len(systems), m))
+            for i, kf in enumerate(filters):
+                kf.predict(None if u is None else u[i])
+                kf.update(z[i])
+            batch.predict(u)
+            batch.update(z)
+
+        for i, kf in enumerate(filters):
+            np.testing.assert_allclose(batch.x[i], kf.x, rtol=1e-9, atol=1e-12)
+            np.testing.assert_allclose(batch.P[i], kf.P, rtol=1e-9, atol=1e-12)
+
+    def test_without_control_input(self):
+        """The batch matches the individual filters without control input."""
+        self._check(n=3, m=2, p=0)
+        self._check(n=4, m=1, p=0)
+
+    def test_with_control_input(self):
+        """The batch matches the individual filters with control input."""
+        self._check(n=3, m=2, p=2)
+        self._check(n=4, m=1, p=1)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,119 @@
+import unittest
+import sys
+from pathlib import Path
+
+# Add the project root to the Python path
+project_root = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(project_root))
+
+from core_lib.central_coordination.collaboration.message_bus import MessageBus
+
+class TestMessageBus(unittest.TestCase):
+    """
+    Tests the delivery semantics of the MessageBus.
+    """
+
+    def setUp(self):
+        """Set up a bus and a log of (topic, message) deliveries."""
+        self.bus = MessageBus()
+        self.delivered = []
+
+    def _record(self, topic):
+        """Subscribes a listener that logs every message on `topic`."""
+        self.bus.subscribe(topic, lambda message: self.delivered.append((topic, message)))
+
+    def test_publish_delivers_in_subscription_order(self):
+        """Every listener of a topic receives the message, in subscription order."""
+        calls = []
+        self.bus.subscribe('a', lambda message: calls.append(('first', message)))
+        self.bus.subscribe('a', lambda message: calls.append(('second', message)))
+        self.bus.publish('a', {'v': 1})
+        self.bus.publish('no_subscribers', {'v': 2})
+        self.assertEqual(calls, [('first', {'v': 1}), ('second', {'v': 1})])
+
+    def test_buffered_step_keeps_last_message_per_topic(self):
+        """Between begin_step and end_step only the latest message per topic is delivered."""
+        self._record('a')
+        self._record('b')
+        self.bus.begin_step()
+        self.bus.publish('a', {'v': 1})
+        self.bus.publish('b', {'v': 2})
+        self.bus.publish('a', {'v': 3})
+        self.assertEqual(self.delivered, [])
+
+        self.bus.end_step()
+        # 'a' was published last, so it is delivered after 'b'
+        self.assertEqual(self.delivered, [('b', {'v': 2}), ('a', {'v': 3})])
+
+        # Outside a step, delivery is immediate again
+        self.bus.publish('a', {'v': 4})
+        self.assertEqual(self.delivered[-1], ('a', {'v': 4}))
+
+    def test_buffered_step_applies_to_batch_and_many(self):
+        """publish_batch and publish_many are buffered like publish."""
+        self._record('a')
+        self._record('b')
+        self.bus.begin_step()
+        self.bus.publish_batch([('a', {'v': 1}), ('b', {'v': 2})])
+        self.bus.publish_many(['a'], {'v': 3})
+        self.bus.end_step()
+        self.assertEqual(self.delivered, [('b', {'v': 2}), ('a', {'v': 3})])
+
+    def test_publish_many_shares_one_message(self):
+        """publish_many delivers the same message object to every topic."""
+        self._record('a')
+        self._record('b')
+        message = {'control_signal': 1}
+        self.bus.publish_many(['a', 'b', 'c'], message)
+        self.assertEqual([topic for topic, _ in self.delivered], ['a', 'b'])
+        self.assertTrue(all(delivered is message for _, delivered in self.delivered))
+
+    def test_unsubscribe_during_publish(self):
+        """A listener may unsubscribe itself while being notified without others being skipped."""
+        calls = []
+
+        def once(message):
+            calls.append('once')
+            self.bus.unsubscribe('a', once)
+
+        self.bus.subscribe('a', once)
+        self.bus.subscribe('a', lambda message: calls.append('other'))
+        self.bus.publish('a', {})
+        self.bus.publish('a', {})
+        self.assertEqual(calls, ['once', 'other', 'other'])
+
+        # Unsubscribing something that is not subscribed does nothing
+        self.bus.unsubscribe('a', once)
+        self.bus.unsubscribe('missing', once)
+
+    def test_unsubscribe_bound_method(self):
+        """A bound method can be unsubscribed with a fresh reference to it."""
+        calls = []
+
+        class Listener:
+            def handle(self, message):
+                calls.append(message)
+
+        listener = Listener()
+        self.bus.subscribe('a', listener.handle)
+        self.bus.unsubscribe('a', listener.handle)
+        self.bus.publish('a', {'v': 1})
+        self.assertEqual(calls, [])
+
+    def test_schedule_once_ordering(self):
+        """Scheduled callbacks run once, earliest first, in scheduling order on ties."""
+        calls = []
+        self.bus.schedule_once(5.0, lambda t: calls.append(('late', t)))
+        self.bus.schedule_once(2.0, lambda t: calls.append(('early', t)))
+        self.bus.schedule_once(2.0, lambda t: calls.append(('early_tie', t)))
+
+        self.bus.advance_time(1.0)
+        self.assertEqual(calls, [])
+        self.bus.advance_time(3.0)
+        self.assertEqual(calls, [('early', 3.0), ('early_tie', 3.0)])
+        self.bus.advance_time(10.0)
+        self.bus.advance_time(11.0)
+        self.assertEqual(calls, [('early', 3.0), ('early_tie', 3.0), ('late', 10.0)])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,42 @@
+import unittest
+import sys
+from pathlib import Path
+import numpy as np
+
+# Add the project root to the Python path
+project_root = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(project_root))
+
+from core_lib.central_coordination.collaboration.message_bus import MessageBus
+from core_lib.physical_objects.pump import Pump, PumpStation
+from core_lib.local_agents.control.pump_control_agent import PumpControlAgent
+
+class TestPumpControlAgent(unittest.TestCase):
+    """
+    Tests which demand messages PumpControlAgent accepts.
+    """
+
+    def setUp(self):
+        """Set up an agent for a station of two pumps."""
+        self.bus = MessageBus()
+        pumps = [Pump(name=f"pump_{i}", initial_state={}, parameters={'max_flow_rate': 5.0}) for i in range(2)]
+        station = PumpStation(name="station", initial_state={}, parameters={}, pumps=pumps)
+        self.agent = PumpControlAgent("pump_control", self.bus, station,
+                                      demand_topic="demand", control_topic_prefix="action.pump")
+
+    def test_numeric_demand_accepted(self):
+        """Ints, floats and numpy scalars set the demand."""
+        for value in (3, 4.5, np.float32(6.0), np.int64(7)):
+            self.bus.publish("demand", {'value': value})
+            self.assertEqual(self.agent.current_demand, float(value))
+            self.assertIsInstance(self.agent.current_demand, float)
+
+    def test_non_numeric_demand_rejected(self):
+        """Numeric strings and other non-numbers leave the demand unchanged."""
+        self.bus.publish("demand", {'value': 2.0})
+        for value in ('3.5', b'3.5', None, [3.5]):
+            self.bus.publish("demand", {'value': value})
+            self.assertEqual(self.agent.current_demand, 2.0)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,84 @@
+import unittest
+import sys
+from pathlib import Path
+
+# Add the project root to the Python path
+project_root = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(project_root))
+
+from core_lib.central_coordination.collaboration.message_bus import MessageBus
+from core_lib.physical_objects.pump import Pump, PumpStation
+from core_lib.local_agents.control.pump_station_control_agent import PumpStationControlAgent
+from core_lib.local_agents.control.pump_control_agent import PumpControlAgent
+
+class TestPumpStationBatchActions(unittest.TestCase):
+    """
+    Tests that station-level messages from the control agents reach each pump.
+    """
+
+    def setUp(self):
+        """Set up a station of three pumps listening on one batch topic."""
+        self.bus = MessageBus()
+        self.pumps = [
+            Pump(name=f"pump_{i}", initial_state={'status': 0},
+                 parameters={'max_flow_rate': 5.0, 'max_head': 20, 'power_consumption_kw': 50.0})
+            for i in range(3)
+        ]
+        self.station = PumpStation(name="station", initial_state={}, parameters={}, pumps=self.pumps)
+        self.batch_topic = "action.pump_station.batch"
+        self.bus.subscribe(self.batch_topic, self.station.handle_batch_action_message)
+
+    def target_statuses(self):
+        return [pump.target_status for pump in self.pumps]
+
+    def test_pump_mask_from_station_control_agent(self):
+        """The bitmask published on the station action topic sets each pump's target status."""
+        PumpStationControlAgent(
+            agent_id="pump_station_control",
+            message_bus=self.bus,
+            goal_topic="goal.pump_station",
+            state_topic="state.pump_station",
+            pump_action_topics=[f"action.pump.{i}" for i in range(3)],
+            station_action_topic=self.batch_topic
+        )
+
+        self.bus.publish("goal.pump_station", {'target_active_pumps': 2})
+        self.assertEqual(self.target_statuses(), [1, 1, 0])
+
+        self.bus.publish("goal.pump_station", {'target_active_pumps': 3})
+        self.assertEqual(self.target_statuses(), [1, 1, 1])
+
+        self.bus.publish("goal.pump_station", {'target_active_pumps': 0})
+        self.assertEqual(self.target_statuses(), [0, 0, 0])
+
+    def test_signals_from_pump_control_agent(self):
+        """The signals list published on the batch topic sets each pump's target status."""
+        agent = PumpControlAgent(
+            agent_id="pump_control",
+            message_bus=self.bus,
+            pump_station=self.station,
+            demand_topic="demand.pump_station",
+            control_topic_prefix="action.pump_station",
+            per_pump_topics=False
+        )
+
+        self.bus.publish("demand.pump_station", {'value': 7.0})
+        agent.execute_control_logic()
+        self.assertEqual(self.target_statuses(), [1, 1, 0])
+
+        state = self.station.step({'upstream_head': 0, 'downstream_head': 5}, dt=1.0)
+        self.assertEqual(state['active_pumps'], 2)
+        self.assertEqual(state['total_outflow'], 10.0)
+
+        self.bus.publish("demand.pump_station", {'value': 2.0})
+        agent.execute_control_logic()
+        self.assertEqual(self.target_statuses(), [1, 0, 0])
+
+    def test_invalid_signals_ignored(self):
+        """Signals other than 0 and 1 are rejected by the pump, as on its own action topic."""
+        self.bus.publish(self.batch_topic, {'signals': [1, 1, 1]})
+        self.bus.publish(self.batch_topic, {'signals': [0, 2, None]})
+        self.assertEqual(self.target_statuses(), [0, 1, 1])
+
+if __name__ == '__main__':
+    unittest.main()
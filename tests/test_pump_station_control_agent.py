@@ -0,0 +1,53 @@
+import unittest
+import sys
+from pathlib import Path
+
+# Add the project root to the Python path
+project_root = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(project_root))
+
+from core_lib.central_coordination.collaboration.message_bus import MessageBus
+from core_lib.local_agents.control.pump_station_control_agent import PumpStationControlAgent
+
+class TestPumpStationControlAgent(unittest.TestCase):
+    """
+    Tests that PumpStationControlAgent commands follow its goals.
+    """
+
+    def setUp(self):
+        """Set up an agent for three pumps and record the last signal each pump received."""
+        self.bus = MessageBus()
+        self.topics = ['action.pump.0', 'action.pump.1', 'action.pump.2']
+        self.signals = {}
+        for i, topic in enumerate(self.topics):
+            self.bus.subscribe(topic, lambda message, i=i: self.signals.__setitem__(i, message['control_signal']))
+        self.agent = PumpStationControlAgent(
+            agent_id="pump_station_control",
+            message_bus=self.bus,
+            goal_topic="goal.pump_station",
+            state_topic="state.pump_station",
+            pump_action_topics=self.topics
+        )
+
+    def test_goal_reverted_before_state_update(self):
+        """A goal that reverts a change is applied even though the reported state lags."""
+        self.bus.publish("goal.pump_station", {'target_active_pumps': 2})
+        self.bus.publish("state.pump_station", {'active_pumps': 2})
+        self.bus.publish("goal.pump_station", {'target_active_pumps': 3})
+        self.assertEqual(self.signals, {0: 1, 1: 1, 2: 1})
+
+        # Back to 2 before the station reports the third pump running
+        self.bus.publish("goal.pump_station", {'target_active_pumps': 2})
+        self.assertEqual(self.signals, {0: 1, 1: 1, 2: 0})
+
+    def test_unchanged_signals_are_not_republished(self):
+        """Only the pumps whose signal changes receive a message."""
+        received = []
+        self.bus.subscribe(self.topics[0], received.append)
+        self.bus.publish("goal.pump_station", {'target_active_pumps': 1})
+        self.bus.publish("goal.pump_station", {'target_active_pumps': 2})
+        self.assertEqual(len(received), 1)
+        self.assertEqual(self.signals, {0: 1, 1: 1, 2: 0})
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,43 @@
+import unittest
+import sys
+from pathlib import Path
+
+import numpy as np
+
+# Add the project root to the Python path
+project_root = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(project_root))
+
+from core_lib.identification.rls_estimator import RLSEstimator
+
+class TestRLSEstimator(unittest.TestCase):
+    """
+    Unit tests for the RLSEstimator.
+    """
+
+    def _run(self, use_kernel, make_y):
+        """Identifies y = 2*x1 - 0.5*x2, feeding y through `make_y`."""
+        rng = np.random.default_rng(0)
+        estimator = RLSEstimator(num_params=2, lambda_=0.99)
+        if not use_kernel:
+            estimator._kernel = None
+        true_theta = np.array([2.0, -0.5])
+        for _ in range(200):
+            phi = rng.normal(size=(2, 1))
+            estimator.update(phi, make_y(float(true_theta @ phi[:, 0])))
+        return estimator
+
+    def test_measurement_shapes(self):
+        """Scalar, (1,) and (1, 1) measurements give the same estimate on both update paths."""
+        paths = [False] if RLSEstimator(1)._kernel is None else [False, True]
+        for use_kernel in paths:
+            reference = self._run(use_kernel, lambda y: y)
+            np.testing.assert_allclose(reference.get_params(), [2.0, -0.5], atol=1e-4)
+            for make_y in (lambda y: np.array([y]), lambda y: np.array([[y]])):
+                with self.subTest(use_kernel=use_kernel):
+                    estimator = self._run(use_kernel, make_y)
+                    np.testing.assert_array_equal(estimator.get_params(), reference.get_params())
+                    np.testing.assert_array_equal(estimator.P, reference.P)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,40 @@
+import unittest
+import sys
+from pathlib import Path
+import numpy as np
+
+# Add the project root to the Python path
+project_root = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(project_root))
+
+from core_lib.central_coordination.collaboration.message_bus import MessageBus
+from core_lib.local_agents.control.valve_station_control_agent import ValveStationControlAgent
+
+class TestValveStationControlAgent(unittest.TestCase):
+    """
+    Tests which goal messages ValveStationControlAgent accepts.
+    """
+
+    def setUp(self):
+        """Set up an agent for two valves."""
+        self.bus = MessageBus()
+        self.agent = ValveStationControlAgent("valve_station_control", self.bus,
+                                              goal_topic="goal", state_topic="state",
+                                              valve_action_topics=["action.valve.0", "action.valve.1"])
+
+    def test_numeric_goal_accepted(self):
+        """Ints, floats and numpy scalars set the flow target."""
+        for value in (3, 4.5, np.float32(6.0), np.int64(7)):
+            self.bus.publish("goal", {'target_total_flow': value})
+            self.assertEqual(self.agent.target_total_flow, float(value))
+
+    def test_non_numeric_goal_rejected(self):
+        """Numeric strings and other non-numbers are logged and leave the target unchanged."""
+        self.bus.publish("goal", {'target_total_flow': 2.0})
+        for value in ('3.5', b'3.5', None, [3.5]):
+            with self.assertLogs('core_lib.local_agents.control.valve_station_control_agent', level='WARNING'):
+                self.bus.publish("goal", {'target_total_flow': value})
+            self.assertEqual(self.agent.target_total_flow, 2.0)
+
+if __name__ == '__main__':
+    unittest.main()
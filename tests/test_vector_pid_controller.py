@@ -0,0 +1,135 @@
+import unittest
+import sys
+from pathlib import Path
+
+import numpy as np
+
+# Add the project root to the Python path
+project_root = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(project_root))
+
+from core_lib.central_coordination.collaboration.message_bus import MessageBus
+from core_lib.local_agents.control.pid_controller import PIDController
+from core_lib.local_agents.control.vector_pid_controller import VectorPIDController
+from core_lib.local_agents.control.batched_pid_agent import BatchedPIDAgent
+
+GAINS = dict(
+    Kp=[-0.5, 2.0, 0.8],
+    Ki=[-0.05, 0.4, 0.1],
+    Kd=[-0.01, 0.2, 0.0],
+    setpoint=[10.0, 3.0, 5.0],
+    min_output=[0.0, -1.0, 0.0],
+    max_output=[1.0, 1.0, 4.0],
+)
+
+class TestVectorPIDController(unittest.TestCase):
+    """
+    Tests that a VectorPIDController behaves like N independent PIDControllers.
+    """
+
+    def setUp(self):
+        """Set up a PID bank and the equivalent scalar controllers."""
+        self.bank = VectorPIDController(**GAINS)
+        self.scalars = [PIDController(*(GAINS[k][i] for k in GAINS)) for i in range(3)]
+
+    def _step_both(self, process_variables, dt=1.0):
+        """Steps the bank and every scalar controller, returning both outputs."""
+        vector_output = self.bank.compute_control_action({'process_variable': process_variables}, dt)
+        scalar_output = [pid.compute_control_action({'process_variable': pv}, dt)
+                         for pid, pv in zip(self.scalars, process_variables)]
+        return vector_output, scalar_output
+
+    def test_matches_scalar_controllers(self):
+        """The outputs match step by step, including saturated and anti-windup steps."""
+        rng = np.random.default_rng(0)
+        saturated_high = saturated_low = False
+        for _ in range(300):
+            process_variables = rng.uniform(-5.0, 20.0, size=3).tolist()
+            vector_output, scalar_output = self._step_both(process_variables, dt=0.5)
+            np.testing.assert_array_equal(vector_output, scalar_output)
+            saturated_high |= bool(np.any(vector_output == self.bank.max_output))
+            saturated_low |= bool(np.any(vector_output == self.bank.min_output))
+        # The sequence did exercise the clamping on both sides
+        self.assertTrue(saturated_high and saturated_low)
+
+    def test_missing_process_variable(self):
+        """Without a process variable every controller repeats its previous output."""
+        vector_output = self.bank.compute_control_action({}, 1.0)
+        scalar_output = [pid.compute_control_action({}, 1.0) for pid in self.scalars]
+        np.testing.assert_array_equal(vector_output, scalar_output)
+
+        self._step_both([9.0, 2.5, 4.0])
+        vector_output = self.bank.compute_control_action({'process_variable': None}, 1.0)
+        scalar_output = [pid.compute_control_action({'process_variable': None}, 1.0) for pid in self.scalars]
+        np.testing.assert_array_equal(vector_output, scalar_output)
+
+    def test_non_positive_dt(self):
+        """A non-positive time step returns the minimum outputs."""
+        np.testing.assert_array_equal(
+            self.bank.compute_control_action({'process_variable': [1.0, 2.0, 3.0]}, 0.0),
+            GAINS['min_output'])
+
+    def test_set_setpoint(self):
+        """Changing some setpoints resets only those controllers, like the scalar ones."""
+        for _ in range(5):
+            self._step_both([9.0, 2.5, 4.0])
+        new_setpoints = [10.0, 2.0, 6.0]
+        self.bank.set_setpoint(new_setpoints)
+        for pid, setpoint in zip(self.scalars, new_setpoints):
+            pid.set_setpoint(setpoint)
+        for _ in range(5):
+            vector_output, scalar_output = self._step_both([9.5, 2.2, 4.5])
+            np.testing.assert_array_equal(vector_output, scalar_output)
+
+    def test_scalar_parameters_broadcast(self):
+        """Scalar parameters are broadcast to `size` controllers."""
+        bank = VectorPIDController(1.0, 0.0, 0.0, 2.0, -10.0, 10.0, size=4)
+        output = bank.compute_control_action({'process_variable': [0.0, 1.0, 2.0, 3.0]}, 1.0)
+        np.testing.assert_array_equal(output, [2.0, 1.0, 0.0, -1.0])
+
+class TestBatchedPIDAgent(unittest.TestCase):
+    """
+    Tests the wiring of BatchedPIDAgent from its observation topic to its action topics.
+    """
+
+    def setUp(self):
+        """Set up an agent for three loops and record the actions it publishes."""
+        self.bus = MessageBus()
+        self.action_topics = ['action.gate.0', 'action.gate.1', 'action.gate.2']
+        self.received = []
+        for topic in self.action_topics:
+            self.bus.subscribe(topic, lambda message, topic=topic: self.received.append((topic, message)))
+        self.agent = BatchedPIDAgent(
+            agent_id="batched_pid",
+            controller=VectorPIDController(**GAINS),
+            message_bus=self.bus,
+            observation_topic="state.gates",
+            action_topics=self.action_topics,
+            dt=1.0
+        )
+
+    def test_observation_to_actions(self):
+        """One observation message publishes one action per loop, in topic order."""
+        expected = VectorPIDController(**GAINS).compute_control_action(
+            {'process_variable': [9.0, 2.5, 4.0]}, 1.0)
+
+        self.bus.publish("state.gates", {'process_variables': [9.0, 2.5, 4.0]})
+
+        self.assertEqual([topic for topic, _ in self.received], self.action_topics)
+        for (_, message), action in zip(self.received, expected):
+            self.assertEqual(message, {'control_signal': float(action), 'agent_id': 'batched_pid'})
+            self.assertIs(type(message['control_signal']), float)
+
+    def test_observation_without_key(self):
+        """An observation without the process variables publishes nothing."""
+        self.bus.publish("state.gates", {'water_levels': [9.0, 2.5, 4.0]})
+        self.assertEqual(self.received, [])
+
+    def test_topic_count_must_match(self):
+        """The number of action topics must equal the number of controllers."""
+        with self.assertRaises(ValueError):
+            BatchedPIDAgent("bad", VectorPIDController(**GAINS), self.bus, "state.gates",
+                            self.action_topics[:2], dt=1.0)
+
+if __name__ == '__main__':
+    unittest.main()